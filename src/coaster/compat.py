@@ -17,7 +17,7 @@ from collections.abc import (
     MutableMapping,
 )
 from functools import wraps
-from inspect import isawaitable, iscoroutinefunction
+from inspect import isasyncgenfunction, isawaitable, iscoroutinefunction
 from operator import attrgetter
 from types import SimpleNamespace
 from typing import (
@@ -47,6 +47,7 @@ from flask import (
     render_template_string as flask_render_template_string,
     request as flask_request,
     session as flask_session,
+    stream_with_context as flask_stream_with_context,
     url_for as flask_url_for,
 )
 from flask.globals import app_ctx as flask_app_ctx, request_ctx as flask_request_ctx
@@ -55,6 +56,7 @@ from flask.sansio.app import App as SansIoApp
 from flask.sansio.blueprints import Blueprint as SansIoBlueprint, BlueprintSetupState
 from werkzeug.datastructures import CombinedMultiDict, MultiDict
 from werkzeug.local import LocalProxy
+from werkzeug.routing import BuildError
 from werkzeug.sansio.request import Request as SansIoRequest
 from werkzeug.sansio.response import Response as SansIoResponse
 
@@ -73,9 +75,11 @@ try:
         render_template_string as quart_render_template_string,
         request as quart_request,
         session as quart_session,
+        stream_with_context as quart_stream_with_context,
         url_for as quart_url_for,
     )
     from quart.globals import app_ctx as quart_app_ctx, request_ctx as quart_request_ctx
+    from quart.signals import request_tearing_down as quart_request_tearing_down
 except ModuleNotFoundError:
     quart_abort = None  # type: ignore[assignment]
     quart_app_ctx = None  # type: ignore[assignment]
@@ -88,7 +92,9 @@ except ModuleNotFoundError:
     quart_render_template_string = None  # type: ignore[assignment]
     quart_request = None  # type: ignore[assignment]
     quart_request_ctx = None  # type: ignore[assignment]
+    quart_request_tearing_down = None  # type: ignore[assignment]
     quart_session = None  # type: ignore[assignment]
+    quart_stream_with_context = None  # type: ignore[assignment]
     quart_url_for = None  # type: ignore[assignment]
 
 
@@ -142,8 +148,10 @@ __all__ = [
     'request_ctx',
     'request',
     'session',
+    'stream_with_context',
     'sync_await',
     'url_for',
+    'url_for_many',
 ]
 
 
@@ -400,6 +408,51 @@ def url_for(*args, **kwargs) -> str:
     return flask_url_for(*args, **kwargs)
 
 
+def url_for_many(
+    endpoint: str,
+    values: Iterable[dict[str, Any]],
+    _external: Optional[bool] = None,
+) -> list[str]:
+    """
+    Build URLs to a single endpoint for many sets of values.
+
+    This is equivalent to calling ``url_for(endpoint, _external=_external, **item)``
+    for each item in values, but looks up the URL adapter and blueprint only once.
+    Values must not include ``_anchor``, ``_method`` or ``_scheme``.
+
+    :param endpoint: Endpoint to build URLs for
+    :param values: Dictionaries of URL parameters, one per URL
+    :param _external: Make external URLs (default `True` outside a request)
+    """
+    app = current_app_object()
+    if app is None:
+        raise RuntimeError("Working outside of application context.")
+    if has_request_context():
+        url_adapter = request_ctx.url_adapter
+        if endpoint[:1] == '.':
+            blueprint = request.blueprint
+            endpoint = endpoint[1:] if blueprint is None else f'{blueprint}{endpoint}'
+        if _external is None:
+            _external = False
+    else:
+        url_adapter = app_ctx.url_adapter
+        if _external is None:
+            _external = True
+    if url_adapter is None:
+        raise RuntimeError(
+            "Unable to build URLs outside an active request without 'SERVER_NAME'"
+            " configured."
+        )
+    urls = []
+    for item in values:
+        app.inject_url_defaults(endpoint, item)
+        try:
+            urls.append(url_adapter.build(endpoint, item, force_external=_external))
+        except BuildError as exc:
+            urls.append(app.handle_url_build_error(exc, endpoint, item))
+    return urls
+
+
 def abort(*args, **kwargs) -> NoReturn:
     """Wrap Quart and Flask's `abort` methods."""
     if quart_current_app:
@@ -421,6 +474,28 @@ def make_response(*args: Any) -> Union[WerkzeugResponse, QuartResponse]:
     return flask_make_response(*args)
 
 
+def stream_with_context(func: Callable[_P, Any]) -> Callable[_P, Any]:
+    """
+    Keep the request context available to a streaming generator function.
+
+    Under Quart, a sync generator function is wrapped in an async generator. Under
+    Flask, the generator function must be sync.
+    """
+    if quart_current_app:
+        if not isasyncgenfunction(func):
+            sync_func = func
+
+            @wraps(sync_func)
+            async def func(*args: _P.args, **kwargs: _P.kwargs) -> Any:
+                for item in sync_func(*args, **kwargs):
+                    yield item
+
+        return quart_stream_with_context(func)
+    if isasyncgenfunction(func):
+        raise TypeError("Flask can't stream from an async generator")
+    return flask_stream_with_context(func)  # type: ignore[return-value]
+
+
 def render_template(
     template_name_or_list: Union[str, list[str]], **context: Any
 ) -> str:
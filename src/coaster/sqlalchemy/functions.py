@@ -2,24 +2,35 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from datetime import datetime
 from typing import Any, Optional, TypeVar, Union, cast, overload
 
 import sqlalchemy as sa
 import sqlalchemy.exc as sa_exc
 import sqlalchemy.orm as sa_orm
+from flask import request_tearing_down as flask_request_tearing_down
 from sqlalchemy import inspect
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import DeclarativeBase
 
-from .query import relationship
+from ..compat import g, has_request_context, quart_request_tearing_down
+from .query import _exists_many, _iter_chunks, relationship
 
 __all__ = [
     'make_timestamp_columns',
     'failsafe_add',
+    'failsafe_add_all',
+    'on_conflict_insert',
+    'iter_chunks',
+    'exists_many',
     'add_primary_relationship',
     'auto_init_default',
     'idfilters',
+    'get_cached_instance',
+    'cache_instance',
+    'clear_instance_cache',
 ]
 
 T = TypeVar('T')
@@ -151,6 +162,242 @@ def failsafe_add(
     return None
 
 
+def on_conflict_insert(
+    session: session_type, model: type[Any]
+) -> Optional[Union[postgresql.Insert, sqlite.Insert]]:
+    """
+    Return an insert for the model supporting ``ON CONFLICT`` and ``RETURNING``.
+
+    This is the dialect-specific insert construct for PostgreSQL and SQLite. Returns
+    `None` if the database for the model does not support ``INSERT ... ON CONFLICT``
+    with ``RETURNING``, and the caller must then fall back to the ORM::
+
+        insert = on_conflict_insert(db.session, Model)
+        if insert is not None:
+            db.session.execute(
+                insert.values(rows).on_conflict_do_nothing(index_elements=['name'])
+            )
+
+    :param session: Database session
+    :param model: Model to insert into
+    """
+    dialect = session.get_bind(mapper=sa_orm.class_mapper(model)).dialect
+    if not dialect.insert_returning:
+        return None
+    if dialect.name == 'postgresql':
+        return postgresql.insert(model)
+    if dialect.name == 'sqlite':
+        return sqlite.insert(model)
+    return None
+
+
+def _insert_values(state: sa_orm.InstanceState) -> Optional[dict[str, Any]]:
+    """
+    Return column values for inserting an instance.
+
+    Foreign keys are copied from many-to-one relationships. Returns `None` if a
+    related instance does not have a primary key.
+    """
+    mapper = state.mapper
+    values = {
+        prop.key: state.dict[prop.key]
+        for prop in mapper.column_attrs
+        if prop.key in state.dict
+    }
+    for prop in mapper.relationships:
+        if (
+            prop.direction is not sa_orm.MANYTOONE
+            or prop.local_remote_pairs is None
+            or prop.key not in state.dict
+        ):
+            continue
+        related = state.dict[prop.key]
+        if related is None:
+            continue
+        related_mapper = sa_orm.object_mapper(related)
+        for local, remote in prop.local_remote_pairs:
+            value = getattr(related, related_mapper.get_property_by_column(remote).key)
+            if value is None:
+                return None
+            values[mapper.get_property_by_column(local).key] = value
+    return values
+
+
+def failsafe_add_all(
+    session: session_type,
+    instances: Iterable[T],
+    conflict_keys: Sequence[str],
+    batch_size: int = 1000,
+) -> list[T]:
+    """
+    Add many new instances, returning existing rows for instances that conflict.
+
+    This is a bulk version of :func:`failsafe_add` for import jobs. On PostgreSQL and
+    SQLite, instances are inserted in batches with ``INSERT ... ON CONFLICT DO NOTHING
+    RETURNING``, and rows that already existed are then loaded with ``IN`` queries of
+    up to ``batch_size`` keys. The returned instances are loaded from the database
+    and are not the given instances.
+
+    The database is flushed first so that related instances have primary keys.
+    Column values that are SQL expressions are inserted one row at a time. The
+    model's ``after_insert`` hooks are not called. If it has ``before_insert`` hooks
+    (as the name and scoped id mixins do), if an instance does not have values for
+    all the conflict keys, or on other databases, each instance is instead added with
+    :func:`failsafe_add` so that hooks and column defaults are applied in a flush.
+
+    You must commit the transaction as usual after calling ``failsafe_add_all``.
+
+    :param session: Database session
+    :param instances: New instances of a single model
+    :param conflict_keys: Column attributes in the unique constraint that may conflict,
+        which are also used to load existing rows
+    :param batch_size: Number of rows to insert or load per statement
+    :return: Instances that are in the database, in the order of the given instances
+    """
+    instances = list(instances)
+    if not instances:
+        return []
+    cls = type(instances[0])
+    mapper = sa_orm.class_mapper(cls)
+    for instance in instances:
+        if instance in session:
+            # Added via a save-update cascade. Remove so that flush doesn't insert it
+            session.expunge(instance)
+    insert = (
+        on_conflict_insert(session, cls) if not mapper.dispatch.before_insert else None
+    )
+    session.flush()
+    rows = [
+        _insert_values(sa_orm.attributes.instance_state(instance))
+        for instance in instances
+    ]
+    if insert is None or any(
+        row is None or not row.keys() >= set(conflict_keys) for row in rows
+    ):
+        return [
+            failsafe_add(
+                session,
+                instance,
+                **{
+                    key: row[key] if row and key in row else getattr(instance, key)
+                    for key in conflict_keys
+                },
+            )
+            for instance, row in zip(instances, rows)
+        ]
+
+    columns = [mapper.attrs[key].columns[0] for key in conflict_keys]
+    found: dict[tuple[Any, ...], T] = {}
+    batches: dict[frozenset[str], list[dict[str, Any]]] = {}
+
+    def insert_batch(batch: list[dict[str, Any]]) -> None:
+        for instance in session.scalars(
+            insert.values(batch)
+            .on_conflict_do_nothing(index_elements=columns)
+            .returning(cls)
+        ):
+            found[tuple(getattr(instance, key) for key in conflict_keys)] = instance
+
+    for row in cast(list[dict[str, Any]], rows):
+        if any(isinstance(value, sa.sql.ClauseElement) for value in row.values()):
+            insert_batch([row])
+            continue
+        batch = batches.setdefault(frozenset(row), [])
+        batch.append(row)
+        if len(batch) >= batch_size:
+            insert_batch(batch)
+            batch.clear()
+    for batch in batches.values():
+        if batch:
+            insert_batch(batch)
+
+    keys = [tuple(row[key] for key in conflict_keys) for row in rows]  # type: ignore[index]
+    missing = [key for key in dict.fromkeys(keys) if key not in found]
+    for start in range(0, len(missing), batch_size):
+        chunk = missing[start : start + batch_size]
+        condition = (
+            columns[0].in_([key[0] for key in chunk])
+            if len(columns) == 1
+            else sa.tuple_(*columns).in_(chunk)
+        )
+        for instance in session.scalars(sa.select(cls).where(condition)):
+            found[tuple(getattr(instance, key) for key in conflict_keys)] = instance
+    return [found[key] for key in keys]
+
+
+def iter_chunks(
+    session: session_type,
+    select: sa.Select[Any],
+    size: int = 1000,
+    *,
+    expunge: bool = False,
+    access_for: Optional[Mapping[str, Any]] = None,
+) -> Iterator[list[Any]]:
+    """
+    Iterate over the results of a select statement in lists of ``size`` items.
+
+    This is the select equivalent of :meth:`.Query.iter_chunks`, for maintenance jobs
+    that walk large tables. Rows are streamed with the ``yield_per`` execution option,
+    using a server-side cursor where the driver supports it. Selects for a single
+    entity or column yield the entity or value, and other selects yield rows.
+
+    :param session: Database session
+    :param select: Select statement
+    :param size: Number of items per chunk
+    :param expunge: Remove each chunk's instances from the session after it is
+        processed, so they can be garbage collected
+    :param access_for: Wrap each item in a :meth:`~.RoleMixin.access_for` proxy,
+        passing these parameters
+    """
+    result = session.execute(select, execution_options={'yield_per': size})
+    if len(result.keys()) == 1:
+        yield from _iter_chunks(
+            session,
+            result.scalars().partitions(size),
+            expunge=expunge,
+            access_for=access_for,
+        )
+    else:
+        yield from _iter_chunks(
+            session, result.partitions(size), expunge=expunge, access_for=access_for
+        )
+
+
+def exists_many(
+    session: session_type,
+    select: sa.Select[Any],
+    column: Union[sa.ColumnElement[Any], sa_orm.InstrumentedAttribute[Any]],
+    values: Iterable[Any],
+    chunk_size: int = 500,
+) -> set[Any]:
+    """
+    Return the subset of ``values`` that are present in ``column``.
+
+    This is the select equivalent of :meth:`.Query.exists_many`. The select's filters
+    are retained and its columns are replaced with ``column``::
+
+        taken = exists_many(
+            db.session, sa.select(User).where(User.active), User.email, emails
+        )
+
+    :param session: Database session
+    :param select: Select statement to look in
+    :param column: Column to look for values in
+    :param values: Values to look for
+    :param chunk_size: Maximum number of values per query
+    """
+    base = (
+        select.with_only_columns(column, maintain_column_froms=True)
+        .order_by(None)
+        .distinct()
+    )
+    return _exists_many(
+        lambda chunk: session.scalars(base.where(column.in_(chunk))),
+        values,
+        chunk_size,
+    )
+
+
 def add_primary_relationship(
     parent: type[DeclarativeBase],
     childrel: str,
@@ -348,3 +595,115 @@ def idfilters(obj: DeclarativeBase) -> Optional[list[sa.BinaryExpression]]:
     if len(pkeys) == 1:
         return [pkeys[0] == identity[0]]
     return [column == value for column, value in zip(pkeys, identity)]
+
+
+# --- Request-scoped identity cache ----------------------------------------------------
+
+
+def _instance_cache_key(
+    model: type[Any], filters: Mapping[str, Any]
+) -> Optional[tuple[type[Any], tuple[tuple[str, Any], ...]]]:
+    """Return a hashable cache key for a model and filters, or None if unhashable."""
+    key = (model, tuple(sorted(filters.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def get_cached_instance(model: type[T], filters: Mapping[str, Any]) -> Optional[T]:
+    """
+    Return an instance cached in the current request by :func:`cache_instance`.
+
+    Loaders that look up an instance by attributes other than the primary key (such as
+    ``name``) can use this cache to skip the database when the same lookup is repeated
+    in a request, as the session's identity map only helps with primary key lookups::
+
+        filters = {'name': name}
+        instance = get_cached_instance(Model, filters)
+        if instance is None:
+            instance = Model.query.filter_by(**filters).one_or_none()
+            if instance is not None:
+                cache_instance(Model, filters, instance)
+
+    The cache is stored in the app context's ``g`` and is used only in a request
+    context. It is cleared when the request is torn down, as ``g`` outlives the
+    request if an outer app context was pushed (as in tests and CLI commands). It is
+    also cleared whenever a
+    database session is flushed or rolled back. The cached instance is also checked
+    against the filters, so an instance whose attributes were changed since will not
+    be returned. Attribute names may use dots to refer to an attribute of a
+    relationship (``parent.name``).
+
+    :param model: Model that was queried
+    :param filters: Dictionary of attribute names and values used in the query
+    :returns: The cached instance, or `None` if not cached
+    """
+    if not has_request_context():
+        return None
+    cache: Optional[dict[Any, Any]] = getattr(g, '_coaster_instance_cache', None)
+    if not cache:
+        return None
+    key = _instance_cache_key(model, filters)
+    if key is None or (instance := cache.get(key)) is None:
+        return None
+    if inspect(instance).persistent and all(
+        _get_attr_path(instance, name) == value for name, value in filters.items()
+    ):
+        return instance
+    # The instance is no longer in the database or has changed. Discard it
+    del cache[key]
+    return None
+
+
+def _get_attr_path(obj: Any, name: str) -> Any:
+    """Get an attribute from an object, following dots in the name."""
+    for part in name.split('.'):
+        obj = getattr(obj, part, None)
+    return obj
+
+
+def cache_instance(model: type[T], filters: Mapping[str, Any], instance: T) -> None:
+    """
+    Cache an instance for the current request, for use with :func:`get_cached_instance`.
+
+    Does nothing outside a request context, or if the filter values are not hashable.
+
+    :param model: Model that was queried
+    :param filters: Dictionary of attribute names and values used in the query
+    :param instance: Instance that was loaded by the query
+    """
+    if not has_request_context():
+        return
+    key = _instance_cache_key(model, filters)
+    if key is None:
+        return
+    cache = getattr(g, '_coaster_instance_cache', None)
+    if cache is None:
+        cache = {}
+        g._coaster_instance_cache = cache  # pylint: disable=protected-access
+    cache[key] = instance
+
+
+def clear_instance_cache() -> None:
+    """Clear the request-scoped cache used by :func:`get_cached_instance`."""
+    if has_request_context():
+        cache = getattr(g, '_coaster_instance_cache', None)
+        if cache:
+            cache.clear()
+
+
+@sa.event.listens_for(sa_orm.Session, 'after_flush')
+@sa.event.listens_for(sa_orm.Session, 'after_soft_rollback')
+def _clear_instance_cache_on_session_change(_session: Any, _context: Any) -> None:
+    clear_instance_cache()
+
+
+@flask_request_tearing_down.connect
+def _clear_instance_cache_on_teardown(_sender: Any, **_kwargs: Any) -> None:
+    clear_instance_cache()
+
+
+if quart_request_tearing_down is not None:
+    quart_request_tearing_down.connect(_clear_instance_cache_on_teardown)
@@ -28,17 +28,21 @@ base classes.
 
 from __future__ import annotations
 
+import re
 import warnings
 from collections import abc
-from collections.abc import Collection, Iterator, Mapping
-from dataclasses import dataclass
+from collections.abc import Collection, Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
+from functools import cached_property
+from operator import attrgetter
 from typing import (
     Any,
     Callable,
     ClassVar,
     Generic,
+    Literal,
     Optional,
     Union,
     get_args,
@@ -54,14 +58,16 @@ from sqlalchemy import event
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, declarative_mixin, declared_attr, synonym
 from sqlalchemy.sql import func, select
+from sqlalchemy.sql.elements import NamedColumn
 from werkzeug.routing import BuildError
 
 from ..auth import current_auth
-from ..compat import SansIoApp, current_app_object, url_for
+from ..compat import SansIoApp, current_app_object, url_for, url_for_many
 from ..typing import ReturnDecorator, WrappedFunc
 from ..utils import (
     InspectableSet,
     make_name,
+    uuid7,
     uuid_from_base58,
     uuid_from_base64,
     uuid_to_base58,
@@ -74,7 +80,13 @@ from .comparators import (
     SqlUuidB64Comparator,
     SqlUuidHexComparator,
 )
-from .functions import auto_init_default, failsafe_add
+from .functions import (
+    auto_init_default,
+    cache_instance,
+    failsafe_add,
+    get_cached_instance,
+    on_conflict_insert,
+)
 from .immutable_annotation import immutable
 from .query import Query, QueryProperty
 from .registry import RegistryMixin
@@ -95,6 +107,7 @@ __all__ = [
     'BaseIdNameMixin',
     'BaseScopedIdMixin',
     'BaseScopedIdNameMixin',
+    'ScopedIdCounter',
     'CoordinatesMixin',
     'UuidMixin',
     'RoleMixin',
@@ -126,6 +139,18 @@ class IdentityOptions(TypedDict, total=False):
     order: Optional[bool]
 
 
+def _uuid_default(cls: type[Any]) -> Callable[[], UUID]:
+    """Return the UUID generator for the model's ``__uuid_version__``."""
+    version = getattr(cls, '__uuid_version__', 4)
+    if version == 4:
+        return uuid4
+    if version == 7:
+        return uuid7
+    raise ValueError(
+        f"{cls.__qualname__}.__uuid_version__ must be 4 or 7, not {version!r}"
+    )
+
+
 @declarative_mixin
 class IdMixin(Generic[PkeyType]):
     """
@@ -149,6 +174,13 @@ class IdMixin(Generic[PkeyType]):
         class MyModel(IdMixin, Model):
             __uuid_primary_key__ = True
 
+    UUIDs are random (version 4) by default. Set ``__uuid_version__ = 7`` for
+    time-ordered UUIDs (see :func:`~coaster.utils.uuid7`), so that new rows are
+    inserted together at the end of the primary key index::
+
+        class LogEntry(IdMixin[UUID], Model):
+            __uuid_version__ = 7
+
     :class:`IdMixin` is a base class for :class:`BaseMixin`, the standard base class.
     """
 
@@ -158,6 +190,8 @@ class IdMixin(Generic[PkeyType]):
     #: the need to commit to the database. Do not set this directly; pass UUID as a
     #: Generic argument to the base class instead: ``class MyModel(IdMixin[UUID])``.
     __uuid_primary_key__: ClassVar[bool] = False
+    #: UUID version for generated UUIDs, either 4 (random) or 7 (time-ordered)
+    __uuid_version__: ClassVar[Literal[4, 7]] = 4
     #: Use database-native identity type for integer identity columns
     __primary_key_identity__: ClassVar[Optional[IdentityOptions]] = None
 
@@ -229,7 +263,10 @@ class IdMixin(Generic[PkeyType]):
         """Database identity for this model."""
         if cls.__uuid_primary_key__:
             return sa_orm.mapped_column(
-                sa.Uuid, primary_key=True, nullable=False, insert_default=uuid4
+                sa.Uuid,
+                primary_key=True,
+                nullable=False,
+                insert_default=_uuid_default(cls),
             )
         if cls.__primary_key_identity__ is not None:
             return sa_orm.mapped_column(
@@ -287,9 +324,13 @@ class UuidMixin:
 
     :attr:`buid` is a legacy alias for :attr:`uuid_b64` and should not be used in new
     code.
+
+    New UUIDs are random (version 4), unless the class sets ``__uuid_version__ = 7``
+    for time-ordered UUIDs, as with :class:`IdMixin`.
     """
 
     __uuid_primary_key__: ClassVar[bool]
+    __uuid_version__: ClassVar[Literal[4, 7]]
 
     @classmethod
     def __uuid(cls) -> Mapped[UUID]:
@@ -297,7 +338,7 @@ class UuidMixin:
         if hasattr(cls, '__uuid_primary_key__') and cls.__uuid_primary_key__:
             return synonym('id')
         return sa_orm.mapped_column(
-            sa.Uuid, unique=True, nullable=False, insert_default=uuid4
+            sa.Uuid, unique=True, nullable=False, insert_default=_uuid_default(cls)
         )
 
     uuid: declared_attr[UUID] = immutable(
@@ -432,13 +473,149 @@ class PermissionMixin:
 _UR = TypeVar('_UR', bound='NoIdMixin')
 
 
+def _url_param_getter(
+    attr: Union[str, tuple[str, ...], Callable[[Any], str]],
+) -> tuple[Optional[str], Callable[[Any], Any]]:
+    """Return the keyword argument to read (if any) and a getter for a URL param."""
+    if isinstance(attr, tuple):
+        # attr is a tuple containing:
+        # 1. ('parent', 'name') --> self.parent.name
+        # 2. ('**entity', 'name') --> kwargs['entity'].name
+        if attr[0].startswith('**'):
+            if len(attr) == 1:
+                return attr[0][2:], lambda item: item
+            return attr[0][2:], attrgetter('.'.join(attr[1:]))
+        return None, attrgetter('.'.join(attr))
+    if callable(attr):
+        # TODO: Support callables expecting kwargs
+        return None, attr
+    return None, attrgetter(attr)
+
+
+_ParamAttrs = Mapping[str, Union[str, tuple[str, ...], Callable[[Any], str]]]
+
+
 @dataclass
 class UrlEndpointData:
     endpoint: str
-    paramattrs: dict[str, Union[str, tuple[str, ...], Callable[[_UR], str]]]
     external: Optional[bool]
     roles: Optional[Collection[str]]
-    requires_kwargs: bool
+    #: Returns the mapping of URL parameters to attributes. This is called when the
+    #: parameters are first needed, so that URL rules need not be parsed at startup
+    load_paramattrs: Callable[[], _ParamAttrs] = field(repr=False)
+
+    @cached_property
+    def paramattrs(
+        self,
+    ) -> dict[str, Union[str, tuple[str, ...], Callable[[_UR], str]]]:
+        """Mapping of URL parameter to attribute, with dotted names split as tuples."""
+        paramattrs = dict(self.load_paramattrs())
+        for keyword, attrs in paramattrs.items():
+            if isinstance(attrs, str) and '.' in attrs:
+                paramattrs[keyword] = tuple(attrs.split('.'))
+        return paramattrs
+
+    @cached_property
+    def requires_kwargs(self) -> bool:
+        """Indicate whether building a URL requires keyword arguments."""
+        return any(
+            isinstance(attrs, tuple) and attrs[0].startswith('**')
+            for attrs in self.paramattrs.values()
+        )
+
+    @cached_property
+    def getters(self) -> tuple[tuple[str, Optional[str], Callable[[Any], Any]], ...]:
+        """Getters for URL parameters, compiled from :attr:`paramattrs`."""
+        return tuple(
+            (param, *_url_param_getter(attr)) for param, attr in self.paramattrs.items()
+        )
+
+    def params(self, obj: Any, kwargs: dict[str, Any]) -> dict[str, Any]:
+        """Return URL parameters for an object, consuming kwargs used by getters."""
+        params = {
+            param: getter(obj if kwarg is None else kwargs.pop(kwarg))
+            for param, kwarg, getter in self.getters
+        }
+        # FIXME: Why do we have this? It needs test coverage
+        params.update(kwargs)  # Let kwargs override params
+        return params
+
+
+_UrlDictCandidates = tuple[
+    frozenset[str], tuple[tuple[str, Optional[frozenset[str]]], ...]
+]
+
+
+def _url_dict_candidates(
+    cls: type[UrlForMixin], app: Optional[SansIoApp]
+) -> _UrlDictCandidates:
+    """
+    Return roles that affect :class:`UrlDict` and the candidate actions for an app.
+
+    Candidates are actions available to the `None` app and to the given app, which do
+    not require additional parameters, along with the roles they require (if any).
+    These are cached in the class, for each app.
+    """
+    cache: Optional[dict[Optional[SansIoApp], _UrlDictCandidates]] = cls.__dict__.get(
+        '_url_dict_candidates_cache'
+    )
+    if cache is None:
+        cache = cls._url_dict_candidates_cache = {}
+    if app in cache:
+        return cache[app]
+    candidates: dict[str, Optional[frozenset[str]]] = {}
+    for endpoint_app, app_actions in cls.url_for_endpoints.items():
+        if endpoint_app is None or endpoint_app is app:
+            for action, endpoint_data in app_actions.items():
+                if not endpoint_data.requires_kwargs:
+                    candidates.setdefault(
+                        action,
+                        None
+                        if endpoint_data.roles is None
+                        else frozenset(endpoint_data.roles),
+                    )
+    relevant_roles = frozenset().union(
+        *(roles for roles in candidates.values() if roles is not None)
+    )
+    result = cache[app] = (relevant_roles, tuple(candidates.items()))
+    return result
+
+
+def _url_dict_actions(
+    cls: type[UrlForMixin], app: Optional[SansIoApp], roles: frozenset[str]
+) -> tuple[str, ...]:
+    """Return actions available in :class:`UrlDict` for the given roles (cached)."""
+    cache: Optional[
+        dict[tuple[Optional[SansIoApp], frozenset[str]], tuple[str, ...]]
+    ] = cls.__dict__.get('_url_dict_actions_cache')
+    if cache is None:
+        cache = cls._url_dict_actions_cache = {}
+    actions = cache.get((app, roles))
+    if actions is None:
+        actions = cache[app, roles] = tuple(
+            action
+            for action, action_roles in _url_dict_candidates(cls, app)[1]
+            if action_roles is None or not action_roles.isdisjoint(roles)
+        )
+    return actions
+
+
+def _url_dict_actions_for(obj: Any) -> tuple[str, ...]:
+    """Return actions available in :class:`UrlDict` for an object."""
+    cls = type(obj)
+    app = current_app_object()
+    relevant_roles = _url_dict_candidates(cls, app)[0]
+    if relevant_roles:
+        # Only check for roles that make a difference to the available actions
+        current_roles = (
+            obj.current_roles
+            if app is not None
+            else obj.roles_for(current_auth.actor, current_auth.anchors)
+        )
+        roles = frozenset(role for role in relevant_roles if role in current_roles)
+    else:
+        roles = frozenset()
+    return _url_dict_actions(cls, app, roles)
 
 
 class UrlDictStub:
@@ -475,26 +652,13 @@ class UrlDict(abc.Mapping, Generic[_UR]):
             raise KeyError(key) from exc
 
     def __len__(self) -> int:
-        capp = current_app_object()
-        return len(self.obj.url_for_endpoints[None]) + (
-            len(self.obj.url_for_endpoints.get(capp, {})) if capp else 0
-        )
+        return len(_url_dict_actions_for(self.obj))
 
     def __iter__(self) -> Iterator[str]:
-        # 1. Iterate through all actions available to the None app and to current_app
-        # 2. If the action requires specific roles, confirm overlap with current_roles
-        # 3. Confirm the action does not require additional parameters
-        # 4. Yield whatever passes the tests
-        current_roles = self.obj.roles_for(current_auth.actor, current_auth.anchors)
-        capp = current_app_object()
-        for app, app_actions in self.obj.url_for_endpoints.items():
-            if app is None or app is capp:
-                for action, endpoint_data in app_actions.items():
-                    if not endpoint_data.requires_kwargs and (
-                        endpoint_data.roles is None
-                        or current_roles.has_any(endpoint_data.roles)
-                    ):
-                        yield action
+        # Actions available to the None app and to current_app, that do not require
+        # additional parameters, and whose roles (if any) overlap with current_roles.
+        # These are cached for each combination of class, app and relevant roles
+        return iter(_url_dict_actions_for(self.obj))
 
 
 class UrlForMixin:
@@ -511,48 +675,89 @@ class UrlForMixin:
     view_for_endpoints: ClassVar[
         dict[Optional[SansIoApp], dict[str, tuple[Any, str]]]
     ] = {}
+    #: Roles and candidate actions for :class:`UrlDict` per app (set on use)
+    _url_dict_candidates_cache: ClassVar[dict[Optional[SansIoApp], _UrlDictCandidates]]
+    #: Actions available in :class:`UrlDict` per app and roles (set on use)
+    _url_dict_actions_cache: ClassVar[
+        dict[tuple[Optional[SansIoApp], frozenset[str]], tuple[str, ...]]
+    ]
 
     #: Dictionary of URLs available on this object
     urls = UrlDictStub()
 
+    @classmethod
+    def _url_endpoint_data(cls, action: str, kwargs: dict[str, Any]) -> UrlEndpointData:
+        """Return endpoint data for an action in the current app."""
+        app = current_app_object()
+        if app is not None and action in cls.url_for_endpoints.get(app, {}):
+            return cls.url_for_endpoints[app][action]
+        try:
+            return cls.url_for_endpoints[None][action]
+        except KeyError as exc:
+            raise BuildError(action, kwargs, 'GET') from exc
+
     def url_for(self, action: str = 'view', **kwargs) -> str:
         """Return public URL to this instance for a given action (default 'view')."""
-        app = current_app_object()
-        if app is not None and action in self.url_for_endpoints.get(app, {}):
-            endpoint_data = self.url_for_endpoints[app][action]
-        else:
-            try:
-                endpoint_data = self.url_for_endpoints[None][action]
-            except KeyError as exc:
-                raise BuildError(action, kwargs, 'GET') from exc
-        params = {}
-        for param, attr in list(endpoint_data.paramattrs.items()):
-            if isinstance(attr, tuple):
-                # attr is a tuple containing:
-                # 1. ('parent', 'name') --> self.parent.name
-                # 2. ('**entity', 'name') --> kwargs['entity'].name
-                if attr[0].startswith('**'):
-                    item = kwargs.pop(attr[0][2:])
-                    attr = attr[1:]  # noqa: PLW2901
-                else:
-                    item = self
-                for subattr in attr:
-                    item = getattr(item, subattr)
-                params[param] = item
-            elif callable(attr):
-                # TODO: Support callables expecting kwargs
-                params[param] = attr(self)  # type: ignore[type-var]
-            else:
-                params[param] = getattr(self, attr)
+        endpoint_data = self._url_endpoint_data(action, kwargs)
+        params = endpoint_data.params(self, kwargs)
         if endpoint_data.external is not None:
-            params['_external'] = endpoint_data.external
-
-        # FIXME: Why do we have this? It needs test coverage
-        params.update(kwargs)  # Let kwargs override params
-
+            params.setdefault('_external', endpoint_data.external)
         # url_for from flask
         return url_for(endpoint_data.endpoint, **params)
 
+    @classmethod
+    def url_for_many(
+        cls,
+        objs: Iterable[Any],
+        action: str = 'view',
+        _external: Optional[bool] = None,
+        **kwargs,
+    ) -> list[str]:
+        """
+        Return URLs for many instances for a given action (default 'view').
+
+        This is faster than calling :meth:`url_for` on each instance, as the URL
+        adapter is looked up once for all instances.
+
+        :param objs: Instances of this model
+        :param action: Action to build URLs for
+        :param _external: Make external URLs, overriding the endpoint's default
+        :param kwargs: Additional parameters, as accepted by :meth:`url_for`
+        """
+        endpoint_data = cls._url_endpoint_data(action, kwargs)
+        return url_for_many(
+            endpoint_data.endpoint,
+            (endpoint_data.params(obj, dict(kwargs)) for obj in objs),
+            _external=endpoint_data.external if _external is None else _external,
+        )
+
+    @classmethod
+    def urls_for_many(cls, objs: Iterable[Any]) -> list[dict[str, str]]:
+        """
+        Return a dictionary of URLs for each of the given instances.
+
+        Each dictionary is the same as ``dict(obj.urls)``, but URLs are built with
+        :meth:`url_for_many` for all instances that share an action.
+
+        :param objs: Instances of this model
+        """
+        objs = list(objs)
+        obj_actions = [_url_dict_actions_for(obj) for obj in objs]
+        results: list[dict[str, str]] = [
+            dict.fromkeys(actions, '') for actions in obj_actions
+        ]
+        indexes_for_action: dict[str, list[int]] = {}
+        for index, actions in enumerate(obj_actions):
+            for action in actions:
+                indexes_for_action.setdefault(action, []).append(index)
+        for action, indexes in indexes_for_action.items():
+            urls = cls.url_for_many(
+                [objs[index] for index in indexes], action, _external=True
+            )
+            for index, url in zip(indexes, urls):
+                results[index][action] = url
+        return results
+
     @property
     def absolute_url(self) -> Optional[str]:
         """Absolute URL to this object."""
@@ -600,7 +805,7 @@ class UrlForMixin:
         *,
         endpoint: str,
         app: Optional[SansIoApp],
-        paramattrs: Mapping[str, Union[str, tuple[str, ...], Callable[[Any], str]]],
+        paramattrs: Union[_ParamAttrs, Callable[[], _ParamAttrs]],
         roles: Optional[Collection[str]] = None,
         external: Optional[bool] = None,
     ) -> None:
@@ -613,29 +818,42 @@ class UrlForMixin:
         :param app: Flask or Quart app (default: `None`)
         :param external: If `True`, URLs are assumed to be external-facing by default
         :param roles: Roles to which this URL is available, required by :class:`UrlDict`
-        :param dict paramattrs: Mapping of URL parameter to attribute name on the object
+        :param dict paramattrs: Mapping of URL parameter to attribute name on the
+            object, or a callable that returns this mapping when it is first needed
         """
         if 'url_for_endpoints' not in cls.__dict__:
             # Stick it into the class with the first endpoint
             cls.url_for_endpoints = {None: {}}
+        # Available actions for UrlDict are cached in each class, so reset the cache
+        # here and in subclasses, which may share this class's endpoints
+        pending: list[type[UrlForMixin]] = [cls]
+        while pending:
+            reset_cls = pending.pop()
+            for cache_attr in ('_url_dict_candidates_cache', '_url_dict_actions_cache'):
+                if cache_attr in reset_cls.__dict__:
+                    delattr(reset_cls, cache_attr)
+            pending.extend(reset_cls.__subclasses__())
         cls.url_for_endpoints.setdefault(app, {})
 
-        paramattrs = dict(paramattrs)
-        for keyword, attrs in paramattrs.items():
-            if isinstance(attrs, str) and '.' in attrs:
-                paramattrs[keyword] = tuple(attrs.split('.'))
-        requires_kwargs = False
-        for attrs in paramattrs.values():
-            if isinstance(attrs, tuple) and attrs[0].startswith('**'):
-                requires_kwargs = True
-                break
-        cls.url_for_endpoints[app][action] = UrlEndpointData(
+        if callable(paramattrs):
+            load_paramattrs = paramattrs
+        else:
+            paramattrs = dict(paramattrs)
+
+            def load_paramattrs() -> _ParamAttrs:
+                return paramattrs
+
+        endpoint_data = UrlEndpointData(
             endpoint=endpoint,
-            paramattrs=paramattrs,
             external=external,
             roles=roles,
-            requires_kwargs=requires_kwargs,
+            load_paramattrs=load_paramattrs,
         )
+        if not callable(paramattrs):
+            # A mapping needs no URL rule, so compile its getters now to report errors
+            # at registration instead of when a URL is first built
+            endpoint_data.getters  # noqa: B018
+        cls.url_for_endpoints[app][action] = endpoint_data
 
     @classmethod
     def register_view_for(
@@ -686,6 +904,234 @@ class BaseMixin(IdMixin[PkeyType], NoIdMixin[ActorType]):
     """Base mixin class for all tables that have an id column."""
 
 
+def _parent_column_values(cls: type[Any], parent: Any) -> Optional[dict[str, Any]]:
+    """
+    Return column attributes and values that refer to a parent instance.
+
+    Returns `None` if the ``parent`` attribute is not a relationship (or a synonym to
+    one), or if the parent does not have a primary key yet.
+    """
+    mapper = sa.inspect(cls)
+    prop = mapper.get_property('parent')
+    while isinstance(prop, sa_orm.SynonymProperty):
+        prop = mapper.get_property(prop.name)
+    if (
+        not isinstance(prop, sa_orm.RelationshipProperty)
+        or prop.local_remote_pairs is None
+    ):
+        return None
+    parent_mapper = sa.inspect(parent).mapper
+    values = {
+        mapper.get_property_by_column(local).key: getattr(
+            parent, parent_mapper.get_property_by_column(remote).key
+        )
+        for local, remote in prop.local_remote_pairs
+    }
+    if any(value is None for value in values.values()):
+        return None
+    return values
+
+
+def _has_unique_constraint(table: Any, columns: set[Any]) -> bool:
+    """Check for a unique constraint or index on exactly these columns."""
+    for constraint in table.constraints:
+        if (
+            isinstance(constraint, (sa.PrimaryKeyConstraint, sa.UniqueConstraint))
+            and set(constraint.columns) == columns
+        ):
+            return True
+    return any(
+        index.unique
+        and set(index.expressions) == columns
+        and not any(
+            key.endswith('_where') and value is not None
+            for key, value in index.dialect_kwargs.items()
+        )
+        for index in table.indexes
+    )
+
+
+def _native_upsert(
+    cls: type[Any], index_elements: Collection[str], rows: list[dict[str, Any]]
+) -> Optional[list[Any]]:
+    """
+    Insert or update rows with ``INSERT ... ON CONFLICT DO UPDATE ... RETURNING``.
+
+    All rows must have the same keys. Returns instances in the order of the rows, or
+    `None` if the database does not support this, if a key is not a column attribute
+    or has ``set`` event listeners (such as validators and immutable annotations) that
+    would be bypassed, if a column that requires a value is missing, if the model has
+    insert or update event listeners other than Coaster's own, or if there is no
+    unique constraint on exactly the ``index_elements`` columns. The caller must then
+    fall back to updating via the ORM.
+
+    Rows are inserted without constructing instances, so the model's ``__init__`` is
+    not called. Defaults must be column defaults to apply to new rows.
+
+    :param cls: Model
+    :param index_elements: Attributes in the unique constraint that may conflict
+    :param rows: Values for each row, keyed by attribute name
+    """
+    session = cls.query.session
+    mapper = sa.inspect(cls)
+    base_insert = on_conflict_insert(session, cls)
+    if base_insert is None:
+        return None
+    dispatch = mapper.dispatch
+    if (
+        len(dispatch.before_insert)
+        > sum(
+            1 for mixin, _listener in _BEFORE_INSERT_LISTENERS if issubclass(cls, mixin)
+        )
+        or dispatch.after_insert
+        or dispatch.before_update
+        or dispatch.after_update
+    ):
+        return None
+    manager = sa_orm.attributes.manager_of_class(cls)
+    columns: dict[str, NamedColumn[Any]] = {}
+    for key in rows[0]:
+        prop = mapper.attrs.get(key)
+        if (
+            not isinstance(prop, sa_orm.ColumnProperty)
+            or len(prop.columns) != 1
+            or manager[key].dispatch.set
+        ):
+            return None
+        columns[key] = prop.columns[0]
+    if not _has_unique_constraint(
+        mapper.local_table, {columns[key] for key in index_elements}
+    ):
+        return None
+    table_columns = set(columns.values())
+    for column in mapper.local_table.columns:
+        if (
+            column not in table_columns
+            and not column.nullable
+            and column.default is None
+            and column.server_default is None
+            and column.autoincrement is not True
+            and not (column.primary_key and column.autoincrement == 'auto')
+        ):
+            # The database checks constraints on the row before looking for a
+            # conflict, so values are required even if the row will be updated
+            return None
+
+    insert = base_insert.values(rows)
+    set_: dict[Any, Any] = {
+        column: insert.excluded[column.key]
+        for key, column in columns.items()
+        if key not in index_elements
+    }
+    for column in mapper.local_table.columns:
+        if (
+            column not in set_
+            and column.onupdate is not None
+            and column.onupdate.is_clause_element
+        ):
+            set_[column] = column.onupdate.arg
+    if not set_:
+        # Update a conflicting row with its own values so that it is returned
+        set_ = {
+            columns[key]: insert.excluded[columns[key].key] for key in index_elements
+        }
+    instances = session.scalars(
+        insert.on_conflict_do_update(
+            index_elements=[columns[key] for key in index_elements], set_=set_
+        ).returning(cls),
+        execution_options={'populate_existing': True},
+    ).all()
+    by_key = {
+        tuple(getattr(instance, key) for key in index_elements): instance
+        for instance in instances
+    }
+    return [by_key[tuple(row[key] for key in index_elements)] for row in rows]
+
+
+def _group_rows(rows: Iterable[dict[str, Any]]) -> dict[frozenset[str], list[dict]]:
+    """Group rows for :func:`_native_upsert` by their keys."""
+    groups: dict[frozenset[str], list[dict[str, Any]]] = {}
+    for row in rows:
+        groups.setdefault(frozenset(row), []).append(row)
+    return groups
+
+
+#: Names with up to this many digits of counter suffix are fetched in one query
+_MAKE_NAME_PREFETCH_DIGITS = 4
+#: Maximum number of existing names fetched in that query
+_MAKE_NAME_PREFETCH_LIMIT = 1000
+
+
+def _make_name_checkused(
+    query: Query,
+    column: sa_orm.InstrumentedAttribute[str],
+    text: str,
+    maxlength: int,
+    reserved: Collection[str],
+) -> Callable[[str], bool]:
+    """
+    Return a ``checkused`` callback for :func:`~coaster.utils.make_name`.
+
+    Instead of querying the database for each candidate, this fetches existing names
+    that :func:`~coaster.utils.make_name` may generate with a counter suffix of up to
+    :data:`_MAKE_NAME_PREFETCH_DIGITS` digits, in a single query limited to
+    :data:`_MAKE_NAME_PREFETCH_LIMIT` rows. Other candidates, and all candidates if the
+    limit was reached, are checked individually.
+
+    :param query: Query for existing rows that may conflict, filtered to the scope
+    :param column: Name column
+    :param text: Text that the name is generated from
+    :param maxlength: Maximum length of the name
+    :param reserved: Names that are unavailable even if not in the database
+    """
+    candidate = make_name(text, maxlength=maxlength)
+    # The untruncated name is only needed up to `maxlength`, and the next character
+    # guards against a trailing delimiter being stripped from within that length
+    name = make_name(text, maxlength=maxlength + 1)
+    # Candidates with a counter of `digits` digits are `name[:maxlength - digits]`
+    # followed by the counter, as generated by make_name
+    bases = {
+        digits: name[: maxlength - digits]
+        for digits in range(1, _MAKE_NAME_PREFETCH_DIGITS + 1)
+    }
+    prefix = name[: maxlength - _MAKE_NAME_PREFETCH_DIGITS]
+    used = set(reserved)
+    rows = (
+        query.filter(
+            column.startswith(prefix, autoescape=True),
+            sa.or_(
+                column == candidate,
+                *(
+                    column.regexp_match(f'^{re.escape(base)}[0-9]{{{digits}}}$')
+                    for digits, base in bases.items()
+                ),
+            ),
+        )
+        .with_entities(column)
+        .limit(_MAKE_NAME_PREFETCH_LIMIT)
+        .all()
+    )
+    used.update(existing for (existing,) in rows)
+    complete = len(rows) < _MAKE_NAME_PREFETCH_LIMIT
+
+    def prefetched(c: str) -> bool:
+        if c == candidate:
+            return True
+        for digits, base in bases.items():
+            if c[-digits:].isdigit() and c[:-digits] == base:
+                return True
+        return False
+
+    def checkused(c: str) -> bool:
+        if c in used:
+            return True
+        if complete and prefetched(c):
+            return False
+        return query.filter(column == c).notempty()
+
+    return checkused
+
+
 @declarative_mixin
 class BaseNameMixin(BaseMixin[PkeyType, ActorType]):
     """
@@ -768,12 +1214,30 @@ class BaseNameMixin(BaseMixin[PkeyType, ActorType]):
 
     @classmethod
     def get(cls, name: str) -> Optional[Self]:
-        """Get an instance matching the name."""
-        return cls.query.filter_by(name=name).one_or_none()
+        """Get an instance matching the name (cached for the request)."""
+        filters = {'name': name}
+        instance = get_cached_instance(cls, filters)
+        if instance is None:
+            instance = cls.query.filter_by(**filters).one_or_none()
+            if instance is not None:
+                cache_instance(cls, filters, instance)
+        return instance
 
     @classmethod
     def upsert(cls, name: str, **fields) -> Self:
-        """Insert or update an instance."""
+        """
+        Insert or update an instance.
+
+        On PostgreSQL and SQLite, this is a single ``INSERT ... ON CONFLICT (name) DO
+        UPDATE`` statement if all fields are columns without validators or other ``set``
+        event listeners, all columns that require a value are included, ``name`` has a
+        unique constraint, and the model has no insert or update event listeners
+        besides Coaster's. A new row is then inserted without calling ``__init__``.
+        Otherwise the instance is loaded and updated, or added in a savepoint.
+        """
+        instances = _native_upsert(cls, ('name',), [{'name': name, **fields}])
+        if instances is not None:
+            return instances[0]
         instance = cls.get(name)
         if instance is not None:
             instance._set_fields(fields)  # pylint: disable=protected-access
@@ -782,6 +1246,26 @@ class BaseNameMixin(BaseMixin[PkeyType, ActorType]):
             instance = failsafe_add(cls.query.session, instance, name=name)
         return instance
 
+    @classmethod
+    def upsert_many(cls, rows: Iterable[Mapping[str, Any]]) -> list[Self]:
+        """
+        Insert or update many instances, as in :meth:`upsert`.
+
+        Rows with the same keys are upserted in a single statement where supported.
+        Names must not repeat.
+
+        :param rows: Field values for each instance, including ``name``
+        :return: Instances in the order of the rows
+        """
+        row_dicts = [dict(row) for row in rows]
+        results: dict[str, Self] = {}
+        for group in _group_rows(row_dicts).values():
+            instances = _native_upsert(cls, ('name',), group)
+            if instances is None:
+                instances = [cls.upsert(**row) for row in group]
+            results.update(zip((row['name'] for row in group), instances))
+        return [results[row['name']] for row in row_dicts]
+
     def make_name(self, reserved: Collection[str] = ()) -> None:
         """
         Autogenerate :attr:`name` from the :attr:`title` (via :attr:`title_for_name`).
@@ -794,32 +1278,23 @@ class BaseNameMixin(BaseMixin[PkeyType, ActorType]):
             :attr:`reserved_names` collection.
         """
         if self.title:  # pylint: disable=using-constant-test
+            cls = self.__class__
+            query = cls.query
             if sa.inspect(self).has_identity:  # type: ignore[union-attr]
-
-                def checkused(c: str) -> bool:
-                    # pylint: disable=comparison-with-callable
-                    return bool(
-                        c in reserved
-                        or c in self.reserved_names
-                        or self.__class__.query.filter(self.__class__.id != self.id)
-                        .filter_by(name=c)
-                        .notempty()
-                    )
-
-            else:
-
-                def checkused(c: str) -> bool:
-                    return bool(
-                        c in reserved
-                        or c in self.reserved_names
-                        or self.__class__.query.filter_by(name=c).notempty()
-                    )
-
-            with self.__class__.query.session.no_autoflush:
+                # pylint: disable=comparison-with-callable
+                query = query.filter(cls.id != self.id)
+            maxlength = self.__name_length__ or 50
+            with cls.query.session.no_autoflush:
                 self.name = make_name(
                     self.title_for_name,
-                    maxlength=self.__name_length__ or 50,
-                    checkused=checkused,
+                    maxlength=maxlength,
+                    checkused=_make_name_checkused(
+                        query,
+                        cls.name,
+                        self.title_for_name,
+                        maxlength,
+                        {*reserved, *self.reserved_names},
+                    ),
                 )
 
 
@@ -912,12 +1387,65 @@ class BaseScopedNameMixin(BaseMixin[PkeyType, ActorType]):
 
     @classmethod
     def get(cls, parent: Any, name: str) -> Optional[Self]:
-        """Get an instance matching the parent and name."""
-        return cls.query.filter_by(parent=parent, name=name).one_or_none()
+        """Get an instance matching the parent and name (cached for the request)."""
+        filters = {'parent': parent, 'name': name}
+        instance = get_cached_instance(cls, filters)
+        if instance is None:
+            instance = cls.query.filter_by(**filters).one_or_none()
+            if instance is not None:
+                cache_instance(cls, filters, instance)
+        return instance
 
     @classmethod
     def upsert(cls, parent: Any, name: str, **fields) -> Self:
-        """Insert or update an instance."""
+        """
+        Insert or update an instance.
+
+        On PostgreSQL and SQLite, this is a single ``INSERT ... ON CONFLICT (parent,
+        name) DO UPDATE`` statement if all fields are columns without validators or
+        other ``set`` event listeners, all columns that require a value are included,
+        there is a unique constraint on the columns referring to the parent and name,
+        and the model has no insert or update event listeners besides Coaster's. A new
+        row is then inserted without calling ``__init__``. Otherwise the instance is
+        loaded and updated, or added in a savepoint.
+        """
+        return cls._upsert_many(parent, [{'name': name, **fields}])[0]
+
+    @classmethod
+    def upsert_many(cls, parent: Any, rows: Iterable[Mapping[str, Any]]) -> list[Self]:
+        """
+        Insert or update many instances in a parent, as in :meth:`upsert`.
+
+        Rows with the same keys are upserted in a single statement where supported.
+        Names must not repeat.
+
+        :param parent: Parent of all the instances
+        :param rows: Field values for each instance, including ``name``
+        :return: Instances in the order of the rows
+        """
+        return cls._upsert_many(parent, [dict(row) for row in rows])
+
+    @classmethod
+    def _upsert_many(cls, parent: Any, rows: list[dict[str, Any]]) -> list[Self]:
+        """Upsert rows, using :func:`_native_upsert` where possible."""
+        parent_values: dict[str, Any] = _parent_column_values(cls, parent) or {}
+        results: dict[str, Self] = {}
+        for group in _group_rows(rows).values():
+            instances: Optional[list[Self]] = None
+            if parent_values and not parent_values.keys() & group[0]:
+                instances = _native_upsert(
+                    cls,
+                    (*parent_values, 'name'),
+                    [parent_values | row for row in group],
+                )
+            if instances is None:
+                instances = [cls._upsert_orm(parent, **row) for row in group]
+            results.update(zip((row['name'] for row in group), instances))
+        return [results[row['name']] for row in rows]
+
+    @classmethod
+    def _upsert_orm(cls, parent: Any, name: str, **fields) -> Self:
+        """Upsert an instance by loading it, or adding it in a savepoint."""
         instance = cls.get(parent, name)
         if instance is not None:
             instance._set_fields(fields)  # pylint: disable=protected-access
@@ -938,35 +1466,22 @@ class BaseScopedNameMixin(BaseMixin[PkeyType, ActorType]):
         found.
         """
         if self.title:  # pylint: disable=using-constant-test
+            cls = self.__class__
+            query = cls.query.filter_by(parent=self.parent)
             if sa.inspect(self).has_identity:  # type: ignore[union-attr]
-
-                def checkused(c: str) -> bool:
-                    return bool(
-                        c in reserved
-                        or c in self.reserved_names
-                        or self.__class__.query.filter(
-                            self.__class__.id != self.id  # pylint: disable=W0143
-                        )
-                        .filter_by(name=c, parent=self.parent)
-                        .notempty()
-                    )
-
-            else:
-
-                def checkused(c: str) -> bool:
-                    return bool(
-                        c in reserved
-                        or c in self.reserved_names
-                        or self.__class__.query.filter_by(
-                            name=c, parent=self.parent
-                        ).notempty()
-                    )
-
-            with self.__class__.query.session.no_autoflush:
+                query = query.filter(cls.id != self.id)  # pylint: disable=W0143
+            maxlength = self.__name_length__ or 250
+            with cls.query.session.no_autoflush:
                 self.name = make_name(
                     self.title_for_name,
-                    maxlength=self.__name_length__ or 250,
-                    checkused=checkused,
+                    maxlength=maxlength,
+                    checkused=_make_name_checkused(
+                        query,
+                        cls.name,
+                        self.title_for_name,
+                        maxlength,
+                        {*reserved, *self.reserved_names},
+                    ),
                 )
 
     @property
@@ -1127,6 +1642,124 @@ class BaseIdNameMixin(BaseMixin[PkeyType, ActorType]):
         )
 
 
+class ScopedIdCounter:
+    """
+    Allocate ids for :class:`BaseScopedIdMixin` models from a per-parent counter.
+
+    The default allocator sets :attr:`~BaseScopedIdMixin.url_id` to ``max(url_id) + 1``
+    in a subquery at insert time, which causes concurrent inserts under the same parent
+    to fail on the unique constraint, and needs a scan of the parent's rows for every
+    insert. This allocator instead keeps the last allocated id for each parent in a
+    counter table, which it increments with ``UPDATE ... RETURNING``, reserving a block
+    of ids for bulk inserts. The counter is seeded from existing rows the first time it
+    is used for a parent.
+
+    The counter table is added to the given metadata and needs a migration. One table
+    can be shared by all models::
+
+        scoped_id_counter = ScopedIdCounter(Model.metadata)
+
+
+        class Issue(BaseScopedIdMixin, Model):
+            __tablename__ = 'issue'
+            __scoped_id_counter__ = scoped_id_counter
+            ...
+
+
+        # Reserve ids for a bulk import
+        for url_id, data in zip(Issue.reserve_scoped_ids(event, len(rows)), rows):
+            db.session.add(Issue(event=event, url_id=url_id, **data))
+
+    Instances added to the session without a :attr:`~BaseScopedIdMixin.url_id` are also
+    allocated ids in blocks per parent when the session is flushed.
+
+    :param metadata: Metadata to add the counter table to
+    :param name: Name of the counter table
+    """
+
+    def __init__(self, metadata: sa.MetaData, name: str = 'scoped_id_counter') -> None:
+        self.table = sa.Table(
+            name,
+            metadata,
+            # Table of the model, as scoped ids are unique per table
+            sa.Column('table_name', sa.Unicode(250), primary_key=True),
+            # Primary key of the parent, with multi-column keys joined with commas
+            sa.Column('parent_key', sa.Unicode(250), primary_key=True),
+            # Last allocated id
+            sa.Column('url_id', sa.Integer, nullable=False),
+        )
+        # Sessions only need to look for new instances once a model may use a counter
+        if not event.contains(sa_orm.Session, 'before_flush', _reserve_scoped_ids):
+            event.listen(sa_orm.Session, 'before_flush', _reserve_scoped_ids)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__qualname__}({self.table.name!r})'
+
+    @staticmethod
+    def parent_key(parent: Any) -> Optional[str]:
+        """Return the counter key for a parent, or `None` if it is not saved yet."""
+        pkey = sa.inspect(parent).mapper.primary_key_from_instance(parent)
+        if any(value is None for value in pkey):
+            return None
+        return ','.join(str(value) for value in pkey)
+
+    def reserve(
+        self,
+        connection: sa.Connection,
+        model: type[BaseScopedIdMixin[Any, Any]],
+        parent: Any,
+        count: int = 1,
+    ) -> range:
+        """
+        Reserve a block of ids for a parent and return them.
+
+        :param connection: Database connection, in the transaction that will insert
+            rows with these ids
+        :param model: Model the ids are for
+        :param parent: Parent instance, which must have a primary key
+        :param count: Number of ids to reserve
+        """
+        if count < 1:
+            raise ValueError("Count must be at least 1")
+        parent_key = self.parent_key(parent)
+        if parent_key is None:
+            raise ValueError(f"{parent!r} must be saved before reserving scoped ids")
+        table = self.table
+        table_name = sa_orm.class_mapper(model).base_mapper.tables[0].name
+        update = (
+            sa.update(table)
+            .where(table.c.table_name == table_name, table.c.parent_key == parent_key)
+            .values(url_id=table.c.url_id + count)
+            .returning(table.c.url_id)
+        )
+        last_id = connection.execute(update).scalar()
+        if last_id is None:
+            # Seed the counter from existing rows. This happens in a savepoint as a
+            # parallel transaction may be doing the same, in which case we can use the
+            # counter it created
+            # pylint: disable=not-callable
+            last_id = (
+                connection.execute(
+                    select(func.coalesce(func.max(model.url_id), 0)).where(
+                        model.parent == parent
+                    )
+                ).scalar_one()
+                + count
+            )
+            try:
+                with connection.begin_nested():
+                    connection.execute(
+                        sa.insert(table).values(
+                            table_name=table_name,
+                            parent_key=parent_key,
+                            url_id=last_id,
+                        )
+                    )
+            except sa.exc.IntegrityError:
+                last_id = connection.execute(update).scalar_one()
+        return range(last_id - count + 1, last_id + 1)
+
+
 @declarative_mixin
 class BaseScopedIdMixin(BaseMixin[PkeyType, ActorType]):
     """
@@ -1148,6 +1781,9 @@ class BaseScopedIdMixin(BaseMixin[PkeyType, ActorType]):
     #: Specify expected type for a 'parent' attr
     parent: Any
 
+    #: Allocate ids from this counter instead of ``max(url_id) + 1``
+    __scoped_id_counter__: ClassVar[Optional[ScopedIdCounter]] = None
+
     # FIXME: Rename this to `scoped_id` and provide a migration guide.
     @classmethod
     def __url_id(cls) -> Mapped[int]:
@@ -1173,9 +1809,48 @@ class BaseScopedIdMixin(BaseMixin[PkeyType, ActorType]):
         """Get an instance matching the parent and url_id."""
         return cls.query.filter_by(parent=parent, url_id=url_id).one_or_none()
 
-    def make_scoped_id(self) -> None:
-        """Create a new scoped id that is unique to the parent container."""
-        if self.url_id is None:  # Set id only if empty
+    @classmethod
+    def reserve_scoped_ids(cls, parent: Any, count: int) -> range:
+        """
+        Reserve a block of ids for new instances under a parent, for bulk inserts.
+
+        The ids are allocated from :attr:`__scoped_id_counter__`, which is required.
+        The counter is updated in the session's transaction, so the ids are released
+        if the transaction is rolled back, and other transactions reserving ids for the
+        same parent will wait until it ends.
+
+        :param parent: Parent instance
+        :param count: Number of ids to reserve
+        """
+        counter = cls.__scoped_id_counter__
+        if counter is None:
+            raise TypeError(f"{cls.__qualname__} does not have a __scoped_id_counter__")
+        session = cls.query.session
+        if counter.parent_key(parent) is None:
+            session.flush()
+        return counter.reserve(session.connection(), cls, parent, count)
+
+    def make_scoped_id(self, connection: Optional[sa.Connection] = None) -> None:
+        """
+        Create a new scoped id that is unique to the parent container.
+
+        If the model has a :attr:`__scoped_id_counter__`, the id is allocated when a
+        connection is available, which is either given or from the instance's session.
+        Otherwise it is left empty, to be allocated when the instance is inserted.
+
+        :param connection: Database connection to allocate the id with
+        """
+        if self.url_id is not None:  # Set id only if empty
+            return
+        counter = self.__scoped_id_counter__
+        if counter is not None:
+            if connection is None:
+                session = sa_orm.object_session(self)
+                if session is None or counter.parent_key(self.parent) is None:
+                    return
+                connection = session.connection()
+            self.url_id = counter.reserve(connection, self.__class__, self.parent).start
+        else:
             self.url_id = (
                 # pylint: disable=not-callable
                 select(func.coalesce(func.max(self.__class__.url_id + 1), 1))
@@ -1412,14 +2087,59 @@ def _make_scoped_name(
         target.make_name()  # type: ignore[unreachable]
 
 
-def _make_scoped_id(_mapper: Any, _connection: Any, target: BaseScopedIdMixin) -> None:
+def _make_scoped_id(
+    _mapper: Any, connection: sa.Connection, target: BaseScopedIdMixin
+) -> None:
     if target.url_id is None and target.parent is not None:  # type: ignore[unreachable]
-        target.make_scoped_id()  # type: ignore[unreachable]
+        target.make_scoped_id(connection)  # type: ignore[unreachable]
+
+
+def _reserve_scoped_ids(
+    session: sa_orm.Session, _flush_context: Any, _instances: Any
+) -> None:
+    """Allocate ids for new instances from a :class:`ScopedIdCounter` in blocks."""
+    pending: dict[tuple[ScopedIdCounter, type, int], list[BaseScopedIdMixin]] = {}
+    parents: dict[int, Any] = {}
+    for obj in session.new:
+        if not isinstance(obj, BaseScopedIdMixin):
+            continue
+        counter = obj.__scoped_id_counter__
+        # `url_id` is typed as int, but is None until allocated
+        url_id: Optional[int] = obj.url_id
+        if (
+            counter is not None
+            and url_id is None
+            and obj.parent is not None
+            and counter.parent_key(obj.parent) is not None
+        ):
+            parents[id(obj.parent)] = obj.parent
+            pending.setdefault(
+                (
+                    counter,
+                    sa_orm.class_mapper(type(obj)).base_mapper.class_,
+                    id(obj.parent),
+                ),
+                [],
+            ).append(obj)
+    if not pending:
+        return
+    connection = session.connection()
+    for (counter, model, parent_id), objs in pending.items():
+        for obj, url_id in zip(
+            objs, counter.reserve(connection, model, parents[parent_id], len(objs))
+        ):
+            obj.url_id = url_id
+
 
+#: Coaster's own ``before_insert`` listeners, counted by :func:`_native_upsert`
+_BEFORE_INSERT_LISTENERS: tuple[tuple[type[Any], Callable[..., None]], ...] = (
+    (BaseNameMixin, _make_name),
+    (BaseIdNameMixin, _make_name),
+    (BaseScopedIdMixin, _make_scoped_id),
+    (BaseScopedNameMixin, _make_scoped_name),
+    (BaseScopedIdNameMixin, _make_scoped_id),
+    (BaseScopedIdNameMixin, _make_name),
+)
 
-event.listen(BaseNameMixin, 'before_insert', _make_name, propagate=True)
-event.listen(BaseIdNameMixin, 'before_insert', _make_name, propagate=True)
-event.listen(BaseScopedIdMixin, 'before_insert', _make_scoped_id, propagate=True)
-event.listen(BaseScopedNameMixin, 'before_insert', _make_scoped_name, propagate=True)
-event.listen(BaseScopedIdNameMixin, 'before_insert', _make_scoped_id, propagate=True)
-event.listen(BaseScopedIdNameMixin, 'before_insert', _make_name, propagate=True)
+for _mixin, _listener in _BEFORE_INSERT_LISTENERS:
+    event.listen(_mixin, 'before_insert', _listener, propagate=True)
@@ -6,15 +6,37 @@ This module is borrowed from Flask-SQLAlchemy and updated for async and type hin
 
 from __future__ import annotations
 
+import asyncio
+import binascii
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
 from collections.abc import Iterator, Sequence
+from copy import copy
+from datetime import date, datetime
+from decimal import Decimal
 from math import ceil
-from typing import TYPE_CHECKING, Any, Final, Generic, Optional, TypeVar, Union
+from threading import Lock
+from time import monotonic
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Final,
+    Generic,
+    Literal,
+    Optional,
+    TypeVar,
+    Union,
+    get_args,
+)
 from typing_extensions import Self
+from uuid import UUID
 
 import sqlalchemy as sa
 import sqlalchemy.orm as sa_orm
 from sqlalchemy import func as sa_func, select as sa_select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+from sqlalchemy.ext.compiler import compiles
 
 from ..compat import abort, request
 
@@ -22,7 +44,23 @@ _O = TypeVar('_O', bound=object)
 
 MAX_PER_PAGE_DEFAULT: Final[int] = 100
 
-__all__ = ['SelectPagination', 'QueryPagination']
+#: How the total number of items is calculated: ``exact`` runs a count query,
+#: ``estimate`` asks the PostgreSQL planner, and ``cached`` memoizes exact counts
+CountMode = Literal['exact', 'estimate', 'cached']
+
+#: Seconds to memoize counts for with ``count_mode='cached'``
+COUNT_CACHE_TTL: float = 60.0
+#: Maximum number of memoized counts
+COUNT_CACHE_SIZE: int = 1024
+
+__all__ = [
+    'CountMode',
+    'SelectPagination',
+    'QueryPagination',
+    'KeysetPagination',
+    'SelectKeysetPagination',
+    'QueryKeysetPagination',
+]
 
 
 class Pagination(Generic[_O]):
@@ -48,6 +86,12 @@ class Pagination(Generic[_O]):
     :param count: Calculate the total number of values by issuing an extra count
         query. For very complex queries this may be inaccurate or slow, so it can be
         disabled and set manually if necessary.
+    :param count_mode: How to calculate the total when ``count`` is true. ``exact``
+        (the default) runs a count query. ``estimate`` uses PostgreSQL's table
+        statistics for an unfiltered table, or the query planner's row estimate,
+        and falls back to an exact count on other databases. ``cached`` memoizes
+        exact counts for :data:`COUNT_CACHE_TTL` seconds, keyed by the compiled
+        statement and its parameters.
     :param kwargs: Information about the query to paginate. Different subclasses will
         require different arguments.
     """
@@ -63,6 +107,11 @@ class Pagination(Generic[_O]):
     items: Sequence[_O]
     #: The total number of items across all pages
     total: Optional[int]
+    #: How the total was calculated
+    count_mode: CountMode
+    #: ``True`` if :attr:`total` is a planner estimate or a memoized count, and may
+    #: not match the current number of items
+    is_estimate: bool
 
     def __init__(
         self,
@@ -72,11 +121,16 @@ class Pagination(Generic[_O]):
         per_page: int,
         max_per_page: Optional[int] = MAX_PER_PAGE_DEFAULT,
         error_out: bool = True,
+        count: bool = True,  # noqa: ARG002
+        count_mode: CountMode = 'exact',
+        _is_estimate: bool = False,
         **kwargs: Any,
     ) -> None:
         # Keep kwargs to subclasses for navigation between pages
         self._subcls_kwargs = kwargs
         self.total = _total
+        self.count_mode = count_mode
+        self.is_estimate = _is_estimate
         self.max_per_page = max_per_page
         self.page = page
         self.per_page = per_page
@@ -185,25 +239,11 @@ class Pagination(Generic[_O]):
             and ``page`` is not 1, or if ``page`` or ``per_page`` is less than 1, or if
             either are not ints.
         """
-        return self.__class__(
-            page=self.page - 1,
-            per_page=self.per_page,
-            error_out=error_out,
-            count=False,
-            _total=self.total,
-            **self._subcls_kwargs,
-        )
+        return self.__class__(**self._page_kwargs(self.page - 1, error_out))
 
     async def aprev(self, *, error_out: bool = False) -> Self:
         """Async implementation of :meth:`prev`."""
-        return await self.anew(
-            page=self.page - 1,
-            per_page=self.per_page,
-            error_out=error_out,
-            count=False,
-            _total=self.total,
-            **self._subcls_kwargs,
-        )
+        return await self.anew(**self._page_kwargs(self.page - 1, error_out))
 
     @property
     def has_next(self) -> bool:
@@ -225,27 +265,25 @@ class Pagination(Generic[_O]):
             and ``page`` is not 1, or if ``page`` or ``per_page`` is less than 1, or if
             either are not ints.
         """
-        return self.__class__(
-            page=self.page + 1,
-            per_page=self.per_page,
-            max_per_page=self.max_per_page,
-            error_out=error_out,
-            count=False,
-            _total=self.total,
-            **self._subcls_kwargs,
-        )
+        return self.__class__(**self._page_kwargs(self.page + 1, error_out))
 
     async def anext(self, *, error_out: bool = False) -> Self:
         """Async implementation of :meth:`next`."""
-        return await self.anew(
-            page=self.page + 1,
-            per_page=self.per_page,
-            max_per_page=self.max_per_page,
-            error_out=error_out,
-            count=False,
-            _total=self.total,
+        return await self.anew(**self._page_kwargs(self.page + 1, error_out))
+
+    def _page_kwargs(self, page: int, error_out: bool) -> dict[str, Any]:
+        """Return parameters for another page, re-using the total."""
+        return {
+            'page': page,
+            'per_page': self.per_page,
+            'max_per_page': self.max_per_page,
+            'error_out': error_out,
+            'count': False,
+            'count_mode': self.count_mode,
+            '_total': self.total,
+            '_is_estimate': self.is_estimate,
             **self._subcls_kwargs,
-        )
+        }
 
     def iter_pages(
         self,
@@ -305,12 +343,187 @@ class Pagination(Generic[_O]):
         yield from self.items
 
 
+def _count_select(select: sa.Select) -> sa.Select[tuple[int]]:
+    """Return a statement that counts the rows of a select."""
+    sub = select.options(sa_orm.lazyload('*')).order_by(None).subquery()
+    return sa_select(sa_func.count()).select_from(sub)  # pylint: disable=not-callable
+
+
+# --- Estimated and cached counts ------------------------------------------------------
+
+_count_cache: dict[tuple[str, str, str], tuple[float, int]] = {}
+_count_cache_lock = Lock()
+
+
+class _Explain(sa.sql.expression.Executable, sa.sql.expression.ClauseElement):
+    """Query plan for a statement, as JSON."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: sa.Select) -> None:
+        self.statement = statement
+
+
+@compiles(_Explain, 'postgresql')
+def _explain_postgresql(element: _Explain, compiler: Any, **kwargs: Any) -> str:
+    return 'EXPLAIN (FORMAT JSON) ' + compiler.process(element.statement, **kwargs)
+
+
+def _plan_rows(plan: Any) -> int:
+    """Return the estimated number of rows from a JSON query plan."""
+    if isinstance(plan, (str, bytes)):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+def _stats_table(select: sa.Select) -> Optional[sa.Table]:
+    """
+    Return the table if the select is for all rows of a single mapped table.
+
+    Returns `None` if the ORM may add criteria that are not in the select's WHERE
+    clause, from :func:`~sqlalchemy.orm.with_loader_criteria` options or from the
+    discriminator of a polymorphic entity.
+    """
+    # pylint: disable=protected-access
+    if (
+        select.whereclause is not None
+        or select._group_by_clauses
+        or select._having_criteria
+        or select._distinct
+        or select._limit_clause is not None
+        or select._offset_clause is not None
+    ):
+        return None
+    froms = select.get_final_froms()
+    if len(froms) != 1 or not isinstance(froms[0], sa.Table):
+        return None
+    if any(
+        isinstance(option, sa_orm.util.LoaderCriteriaOption)
+        for option in select._with_options
+    ):
+        return None
+    for desc in select.column_descriptions:
+        entity = desc.get('entity')
+        if entity is None:
+            return None
+        mapper = sa.inspect(entity).mapper
+        if (
+            mapper.local_table is not froms[0]
+            or mapper.inherits is not None
+            or mapper.polymorphic_on is not None
+        ):
+            return None
+    return froms[0]
+
+
+def _reltuples_select(bind: Any, table: sa.Table) -> sa.TextClause:
+    """Return a statement for PostgreSQL's estimate of the rows in a table."""
+    return sa.text(
+        'SELECT reltuples FROM pg_class WHERE oid = to_regclass(:name)'
+    ).bindparams(name=bind.dialect.identifier_preparer.format_table(table))
+
+
+def _reltuples(value: Optional[float]) -> Optional[int]:
+    # PostgreSQL reports -1 (or 0 before 14) for tables that were never analyzed
+    if value is None or value <= 0:
+        return None
+    return int(value)
+
+
+def _count_cache_key(bind: Any, select: sa.Select) -> tuple[str, str, str]:
+    compiled = select.compile(bind, compile_kwargs={'render_postcompile': True})
+    return (str(bind.engine.url), str(compiled), repr(compiled.params))
+
+
+def _get_cached_count(key: tuple[str, str, str]) -> Optional[int]:
+    with _count_cache_lock:
+        entry = _count_cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] < monotonic():
+            del _count_cache[key]
+            return None
+        return entry[1]
+
+
+def _set_cached_count(key: tuple[str, str, str], total: int) -> None:
+    now = monotonic()
+    with _count_cache_lock:
+        if len(_count_cache) >= COUNT_CACHE_SIZE:
+            for expired in [k for k, (exp, _v) in _count_cache.items() if exp < now]:
+                del _count_cache[expired]
+            if len(_count_cache) >= COUNT_CACHE_SIZE:
+                # Drop the oldest entry
+                del _count_cache[next(iter(_count_cache))]
+        _count_cache[key] = (now + COUNT_CACHE_TTL, total)
+
+
+def _check_count_mode(count_mode: str) -> None:
+    if count_mode not in get_args(CountMode):
+        raise ValueError(f"Unknown count mode: {count_mode!r}")
+
+
+def _get_total(
+    session: Union[sa_orm.Session, sa_orm.scoped_session[Any]],
+    select: sa.Select,
+    count_mode: CountMode,
+    exact: Callable[[], Optional[int]],
+) -> tuple[Optional[int], bool]:
+    """Return the total for a select and whether it is an estimate."""
+    _check_count_mode(count_mode)
+    bind = session.get_bind()
+    if count_mode == 'estimate' and bind.dialect.name == 'postgresql':
+        table = _stats_table(select)
+        if table is not None:
+            total = _reltuples(session.execute(_reltuples_select(bind, table)).scalar())
+            if total is not None:
+                return total, True
+        return _plan_rows(session.execute(_Explain(select)).scalar()), True
+    if count_mode == 'cached':
+        key = _count_cache_key(bind, select)
+        total = _get_cached_count(key)
+        if total is not None:
+            return total, True
+        total = exact()
+        if total is not None:
+            _set_cached_count(key, total)
+        return total, False
+    return exact(), False
+
+
+async def _aget_total(
+    session: AsyncSession, select: sa.Select, count_mode: CountMode
+) -> tuple[Optional[int], bool]:
+    """Async implementation of :func:`_get_total`."""
+    _check_count_mode(count_mode)
+    bind = session.get_bind()
+    if count_mode == 'estimate' and bind.dialect.name == 'postgresql':
+        table = _stats_table(select)
+        if table is not None:
+            total = _reltuples(
+                (await session.execute(_reltuples_select(bind, table))).scalar()
+            )
+            if total is not None:
+                return total, True
+        return _plan_rows((await session.execute(_Explain(select))).scalar()), True
+    if count_mode == 'cached':
+        key = _count_cache_key(bind, select)
+        total = _get_cached_count(key)
+        if total is not None:
+            return total, True
+        total = (await session.execute(_count_select(select))).scalar()
+        if total is not None:
+            _set_cached_count(key, total)
+        return total, False
+    return (await session.execute(_count_select(select))).scalar(), False
+
+
 class SelectPagination(Pagination[_O]):
     """Returned by :meth:`.SQLAlchemy.paginate`."""
 
     def __init__(
         self,
-        session: Union[sa_orm.Session, AsyncSession],
+        session: Union[sa_orm.Session, sa_orm.scoped_session[Any], AsyncSession],
         select: sa.Select[tuple[_O]],
         *,
         page: Optional[int] = None,
@@ -318,17 +531,19 @@ class SelectPagination(Pagination[_O]):
         max_per_page: Optional[int] = MAX_PER_PAGE_DEFAULT,
         error_out: bool = True,
         count: bool = True,
-        _page_items: Sequence[_O] = (),
+        count_mode: CountMode = 'exact',
+        _page_items: Optional[Sequence[_O]] = None,
         _total: Optional[int] = None,
+        _is_estimate: bool = False,
     ) -> None:
-        if (not _page_items or (count and _total is None)) and isinstance(
+        if (_page_items is None or (count and _total is None)) and isinstance(
             session, AsyncSession
         ):
             raise TypeError(
                 f"Use {self.__class__.__qualname__}.anew() with an async session"
             )
         if TYPE_CHECKING:
-            assert isinstance(session, sa_orm.Session)  # nosec B101
+            assert not isinstance(session, AsyncSession)  # nosec B101
 
         if page is None or per_page is None:
             page, per_page = self._prepare_page_args(
@@ -338,18 +553,18 @@ class SelectPagination(Pagination[_O]):
                 error_out=error_out,
             )
 
-        if not _page_items:
+        if _page_items is None:
             item_select = select.limit(per_page).offset(
                 self._get_offset(page, per_page)
             )
             _page_items = list(session.execute(item_select).unique().scalars())
         if count and _total is None:
-            sub = select.options(sa_orm.lazyload('*')).order_by(None).subquery()
-            _total = session.execute(
-                sa_select(
-                    sa_func.count()  # pylint: disable=not-callable
-                ).select_from(sub)
-            ).scalar()
+            _total, _is_estimate = _get_total(
+                session,
+                select,
+                count_mode,
+                lambda: session.execute(_count_select(select)).scalar(),
+            )
         self.items = _page_items
         super().__init__(
             page=page,
@@ -357,7 +572,9 @@ class SelectPagination(Pagination[_O]):
             max_per_page=max_per_page,
             error_out=error_out,
             count=count,
+            count_mode=count_mode,
             _total=_total,
+            _is_estimate=_is_estimate,
             select=select,
             session=session,
         )
@@ -373,9 +590,18 @@ class SelectPagination(Pagination[_O]):
         max_per_page: Optional[int] = 100,
         error_out: bool = True,
         count: bool = True,
+        count_mode: CountMode = 'exact',
+        concurrent_count: bool = False,
         _total: Optional[int] = None,
+        _is_estimate: bool = False,
     ) -> Self:
-        """Async init. Accepts the same parameters as :meth:`__init__`."""
+        """
+        Async init. Accepts the same parameters as :meth:`__init__`.
+
+        :param concurrent_count: Run the count query on a separate connection from
+            the engine's pool, concurrently with the query for items. The count will
+            not see changes that are not yet committed in ``session``
+        """
         page, per_page = cls._prepare_page_args(
             page=page,
             per_page=per_page,
@@ -383,16 +609,25 @@ class SelectPagination(Pagination[_O]):
             error_out=error_out,
         )
         item_select = select.limit(per_page).offset(cls._get_offset(page, per_page))
-        items = list((await session.execute(item_select)).unique().scalars())
-        if count and _total is None:
-            sub = select.options(sa_orm.lazyload('*')).order_by(None).subquery()
-            _total = (
-                await session.execute(
-                    sa_select(
-                        sa_func.count()  # pylint: disable=not-callable
-                    ).select_from(sub)
+        if count and _total is None and concurrent_count:
+            items_task = asyncio.ensure_future(session.execute(item_select))
+            count_task = asyncio.ensure_future(
+                cls._aget_total_separately(session, select, count_mode)
+            )
+            try:
+                result, (_total, _is_estimate) = await asyncio.gather(
+                    items_task, count_task
                 )
-            ).scalar()
+            except BaseException:
+                count_task.cancel()
+                # Don't return while the session is still busy with the items query
+                await asyncio.wait([items_task])
+                raise
+            items = list(result.unique().scalars())
+        else:
+            items = list((await session.execute(item_select)).unique().scalars())
+            if count and _total is None:
+                _total, _is_estimate = await _aget_total(session, select, count_mode)
         return cls(
             select=select,
             session=session,
@@ -401,10 +636,26 @@ class SelectPagination(Pagination[_O]):
             max_per_page=max_per_page,
             error_out=error_out,
             count=count,
+            count_mode=count_mode,
             _page_items=items,
             _total=_total,
+            _is_estimate=_is_estimate,
         )
 
+    @staticmethod
+    async def _aget_total_separately(
+        session: AsyncSession, select: sa.Select, count_mode: CountMode
+    ) -> tuple[Optional[int], bool]:
+        """Get the total using a new session on the same engine."""
+        bind: Optional[Union[AsyncConnection, AsyncEngine]] = session.bind
+        engine = bind.engine if isinstance(bind, AsyncConnection) else bind
+        if engine is None:
+            # The session has binds per mapper or table, which are not exposed as
+            # async engines, so wrap the sync engine for the select
+            engine = AsyncEngine(session.get_bind(clause=select).engine)
+        async with AsyncSession(engine) as count_session:
+            return await _aget_total(count_session, select, count_mode)
+
 
 class QueryPagination(Pagination[_O]):
     """Returned by :meth:`.Query.paginate`."""
@@ -418,8 +669,10 @@ class QueryPagination(Pagination[_O]):
         max_per_page: Optional[int] = MAX_PER_PAGE_DEFAULT,
         error_out: bool = True,
         count: bool = True,
+        count_mode: CountMode = 'exact',
         _page_items: Sequence[_O] = (),
         _total: Optional[int] = None,
+        _is_estimate: bool = False,
         **kwargs: Any,
     ) -> None:
         if page is None or per_page is None:
@@ -434,7 +687,15 @@ class QueryPagination(Pagination[_O]):
                 query.limit(per_page).offset(self._get_offset(page, per_page)).all()
             )
         if count and _total is None:
-            _total = query.order_by(None).count()
+            statement = query.statement
+            if isinstance(statement, sa.Select):
+                _total, _is_estimate = _get_total(
+                    query.session, statement, count_mode, query.order_by(None).count
+                )
+            else:
+                # A query from a textual statement can only be counted exactly
+                _check_count_mode(count_mode)
+                _total = query.order_by(None).count()
         self.items = _page_items
         super().__init__(
             page=page,
@@ -442,7 +703,467 @@ class QueryPagination(Pagination[_O]):
             max_per_page=max_per_page,
             error_out=error_out,
             count=count,
-            _page_items=_page_items,
+            count_mode=count_mode,
             _total=_total,
+            _is_estimate=_is_estimate,
+            query=query,
             **kwargs,
         )
+
+
+# --- Keyset pagination ----------------------------------------------------------------
+
+#: Ordering for keyset pagination, as pairs of column and descending flag
+_KeysetOrder = tuple[tuple[sa.ColumnElement[Any], bool], ...]
+
+
+def _keyset_order(order_by: Sequence[Any]) -> _KeysetOrder:
+    """Split ``order_by`` clauses into columns and their direction."""
+    order: list[tuple[sa.ColumnElement[Any], bool]] = []
+    for clause in order_by:
+        element = sa.sql.coercions.expect(sa.sql.roles.OrderByRole, clause)
+        if (
+            isinstance(element, sa.UnaryExpression)
+            and element.modifier is sa.sql.operators.desc_op
+        ):
+            order.append((element.element, True))
+        elif (
+            isinstance(element, sa.UnaryExpression)
+            and element.modifier is sa.sql.operators.asc_op
+        ):
+            order.append((element.element, False))
+        else:
+            order.append((element, False))
+    if not order:
+        raise ValueError("Keyset pagination requires an order_by")
+    return tuple(order)
+
+
+def _keyset_order_by(order: _KeysetOrder, forward: bool) -> list[Any]:
+    """Return order_by clauses, reversed if going backward."""
+    return [
+        column.desc() if descending == forward else column.asc()
+        for column, descending in order
+    ]
+
+
+def _keyset_filter(
+    order: _KeysetOrder, values: Sequence[Any], forward: bool
+) -> sa.ColumnElement[bool]:
+    """Return a filter for rows after (or before, if not forward) the given keys."""
+    clauses = []
+    for index, (column, descending) in enumerate(order):
+        equals = [col == value for (col, _desc), value in zip(order, values[:index])]
+        after = (
+            column < values[index] if descending == forward else column > values[index]
+        )
+        clauses.append(sa.and_(*equals, after))
+    return sa.or_(*clauses)
+
+
+def _encode_cursor_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {'dt': value.isoformat()}
+    if isinstance(value, date):
+        return {'d': value.isoformat()}
+    if isinstance(value, UUID):
+        return {'u': value.hex}
+    if isinstance(value, Decimal):
+        return {'n': str(value)}
+    return value
+
+
+def _decode_cursor_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        ((kind, data),) = value.items()
+        return _CURSOR_DECODERS[kind](data)
+    return value
+
+
+_CURSOR_DECODERS: dict[str, Any] = {
+    'dt': datetime.fromisoformat,
+    'd': date.fromisoformat,
+    'u': UUID,
+    'n': Decimal,
+}
+
+
+def _encode_cursor(forward: bool, values: Sequence[Any]) -> str:
+    """Encode a keyset cursor as an opaque URL-safe token."""
+    payload = [1 if forward else 0, [_encode_cursor_value(v) for v in values]]
+    return (
+        urlsafe_b64encode(json.dumps(payload, separators=(',', ':')).encode())
+        .rstrip(b'=')
+        .decode()
+    )
+
+
+def _decode_cursor(cursor: str, length: int) -> tuple[bool, list[Any]]:
+    """Decode a keyset cursor, raising :exc:`ValueError` if it is invalid."""
+    try:
+        forward, values = json.loads(
+            urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        )
+        values = [_decode_cursor_value(v) for v in values]
+    except (TypeError, ValueError, KeyError, binascii.Error) as exc:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from exc
+    if len(values) != length:
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return bool(forward), values
+
+
+class KeysetPagination(Generic[_O]):
+    """
+    Paginate a query using the values of the last item on a page (keyset pagination).
+
+    Unlike :class:`Pagination`, which uses ``OFFSET`` and slows down on deep pages,
+    this filters for items after (or before) the keys of the current page. The order
+    must be over indexed, non-null columns that together are unique, such as
+    ``(Model.created_at, Model.id)``. Pages are identified by opaque cursor tokens
+    instead of page numbers.
+
+    Don't create pagination objects manually. They are created by
+    :class:`SelectKeysetPagination` and :meth:`.Query.keyset_paginate`.
+
+    :param cursor: Cursor for the page, from :attr:`next_cursor` or
+        :attr:`prev_cursor` of another page. Defaults to the ``cursor`` query arg during
+        a request, or the first page otherwise
+    :param per_page: The maximum number of items on a page. Defaults to the
+        ``per_page`` query arg during a request, or 20 otherwise
+    :param max_per_page: The maximum allowed value for ``per_page``, to limit a
+        user-provided value. Use ``None`` for no limit. Defaults to 100
+    :param error_out: Abort with a ``404 Not Found`` error if the cursor is invalid, or
+        if a cursor is given and no items are returned
+    :param count: Calculate the total number of values with an extra count query
+    """
+
+    #: The cursor for the current page, or `None` for the first page
+    cursor: Optional[str]
+    #: The maximum number of items on a page
+    per_page: int
+    #: The maximum allowed value for ``per_page``
+    max_per_page: Optional[int]
+    #: The items on the current page. Iterating over the pagination object is
+    #: equivalent to iterating over the items
+    items: Sequence[_O]
+    #: The total number of items, if counted
+    total: Optional[int]
+    #: ``True`` if there are items after this page
+    has_next: bool
+    #: ``True`` if there are items before this page
+    has_prev: bool
+
+    def __init__(
+        self,
+        _rows: Sequence[Sequence[Any]],  # Internal parameter, passed by subclasses
+        _total: Optional[int],  # Internal parameter, passed by subclasses
+        *,
+        cursor: Optional[str],
+        forward: bool,
+        per_page: int,
+        max_per_page: Optional[int],
+        error_out: bool,
+        **kwargs: Any,
+    ) -> None:
+        # Keep kwargs to subclasses for navigation between pages
+        self._subcls_kwargs = kwargs
+        self.cursor = cursor
+        self.per_page = per_page
+        self.max_per_page = max_per_page
+        self.total = _total
+        has_more = len(_rows) > per_page
+        rows = list(_rows[:per_page])
+        if not forward:
+            rows.reverse()
+        self.items = [row[0] for row in rows]
+        self._first_keys = tuple(rows[0][1:]) if rows else None
+        self._last_keys = tuple(rows[-1][1:]) if rows else None
+        if forward:
+            self.has_next = has_more
+            self.has_prev = cursor is not None
+        else:
+            self.has_next = True
+            self.has_prev = has_more
+        if not self.items and cursor is not None and error_out:
+            abort(404)
+
+    @classmethod
+    def _prepare_args(
+        cls,
+        *,
+        order: _KeysetOrder,
+        cursor: Optional[str],
+        per_page: Optional[int],
+        max_per_page: Optional[int],
+        error_out: bool,
+    ) -> tuple[Optional[str], bool, Optional[list[Any]], int]:
+        """Return cursor, direction, keys and the number of items per page."""
+        _page, per_page = Pagination._prepare_page_args(
+            page=1, per_page=per_page, max_per_page=max_per_page, error_out=error_out
+        )
+        if cursor is None and request:
+            cursor = request.args.get('cursor') or None
+        if cursor is None:
+            return None, True, None, per_page
+        try:
+            forward, values = _decode_cursor(cursor, len(order))
+        except ValueError:
+            if error_out:
+                abort(404)
+            return None, True, None, per_page
+        return cursor, forward, values, per_page
+
+    @staticmethod
+    def _page_select(
+        select: Any,
+        order: _KeysetOrder,
+        forward: bool,
+        values: Optional[Sequence[Any]],
+        per_page: int,
+    ) -> Any:
+        """Return a select or query for a page, with the keys as extra columns."""
+        select = select.add_columns(*(column for column, _desc in order))
+        if values is not None:
+            select = select.filter(_keyset_filter(order, values, forward))
+        return (
+            select.order_by(None)
+            .order_by(*_keyset_order_by(order, forward))
+            .limit(per_page + 1)
+        )
+
+    @property
+    def next_cursor(self) -> Optional[str]:
+        """Cursor for the next page, or `None` if this is the last page."""
+        if not self.has_next or self._last_keys is None:
+            return None
+        return _encode_cursor(True, self._last_keys)
+
+    @property
+    def prev_cursor(self) -> Optional[str]:
+        """Cursor for the previous page, or `None` if this is the first page."""
+        if not self.has_prev or self._first_keys is None:
+            return None
+        return _encode_cursor(False, self._first_keys)
+
+    def _navigate_kwargs(self, cursor: str, error_out: bool) -> dict[str, Any]:
+        return {
+            'cursor': cursor,
+            'per_page': self.per_page,
+            'max_per_page': self.max_per_page,
+            'error_out': error_out,
+            'count': False,
+            '_total': self.total,
+            **self._subcls_kwargs,
+        }
+
+    def _empty_page(self, error_out: bool) -> Self:
+        """Return an empty page, for navigating past the first or last page."""
+        if error_out:
+            abort(404)
+        page = copy(self)
+        page.items = []
+        page._first_keys = page._last_keys = None
+        page.has_next = page.has_prev = False
+        return page
+
+    def next(self, *, error_out: bool = False) -> Self:
+        """Query the pagination object for the next page.
+
+        Returns an empty page if this is the last page.
+
+        :param error_out: Abort with a ``404 Not Found`` error if no items are returned
+        """
+        cursor = self.next_cursor
+        if cursor is None:
+            return self._empty_page(error_out)
+        return self.__class__(**self._navigate_kwargs(cursor, error_out))
+
+    async def anext(self, *, error_out: bool = False) -> Self:
+        """Async implementation of :meth:`next`."""
+        cursor = self.next_cursor
+        if cursor is None:
+            return self._empty_page(error_out)
+        return await self.anew(**self._navigate_kwargs(cursor, error_out))
+
+    def prev(self, *, error_out: bool = False) -> Self:
+        """Query the pagination object for the previous page.
+
+        Returns an empty page if this is the first page.
+
+        :param error_out: Abort with a ``404 Not Found`` error if no items are returned
+        """
+        cursor = self.prev_cursor
+        if cursor is None:
+            return self._empty_page(error_out)
+        return self.__class__(**self._navigate_kwargs(cursor, error_out))
+
+    async def aprev(self, *, error_out: bool = False) -> Self:
+        """Async implementation of :meth:`prev`."""
+        cursor = self.prev_cursor
+        if cursor is None:
+            return self._empty_page(error_out)
+        return await self.anew(**self._navigate_kwargs(cursor, error_out))
+
+    @classmethod
+    async def anew(cls, *args, **kwargs) -> Self:
+        """Async init, to be overridden in subclasses as needed."""
+        return cls(*args, **kwargs)
+
+    def __iter__(self) -> Iterator[Any]:
+        yield from self.items
+
+
+class SelectKeysetPagination(KeysetPagination[_O]):
+    """
+    Keyset pagination for a select statement.
+
+    :param session: Database session. Use :meth:`anew` with an async session
+    :param select: Select statement, which must be for a single entity or column
+    :param order_by: Columns to order by, optionally with ``.desc()``, which together
+        must be unique
+    """
+
+    def __init__(
+        self,
+        session: Union[sa_orm.Session, sa_orm.scoped_session[Any], AsyncSession],
+        select: sa.Select[tuple[_O]],
+        order_by: Sequence[Any],
+        *,
+        cursor: Optional[str] = None,
+        per_page: Optional[int] = None,
+        max_per_page: Optional[int] = MAX_PER_PAGE_DEFAULT,
+        error_out: bool = True,
+        count: bool = False,
+        _rows: Optional[Sequence[Sequence[Any]]] = None,
+        _forward: Optional[bool] = None,
+        _total: Optional[int] = None,
+    ) -> None:
+        order = _keyset_order(order_by)
+        if _rows is None or _forward is None:
+            if isinstance(session, AsyncSession):
+                raise TypeError(
+                    f"Use {self.__class__.__qualname__}.anew() with an async session"
+                )
+            cursor, _forward, values, per_page = self._prepare_args(
+                order=order,
+                cursor=cursor,
+                per_page=per_page,
+                max_per_page=max_per_page,
+                error_out=error_out,
+            )
+            _rows = (
+                session.execute(
+                    self._page_select(select, order, _forward, values, per_page)
+                )
+                .unique()
+                .all()
+            )
+            if count and _total is None:
+                _total = session.execute(_count_select(select)).scalar()
+        elif per_page is None:
+            raise TypeError("per_page is required with _rows")
+        super().__init__(
+            _rows,
+            _total,
+            cursor=cursor,
+            forward=_forward,
+            per_page=per_page,
+            max_per_page=max_per_page,
+            error_out=error_out,
+            session=session,
+            select=select,
+            order_by=order_by,
+        )
+
+    @classmethod
+    async def anew(  # pylint: disable=arguments-differ
+        cls,
+        session: AsyncSession,
+        select: sa.Select[tuple[_O]],
+        order_by: Sequence[Any],
+        *,
+        cursor: Optional[str] = None,
+        per_page: Optional[int] = None,
+        max_per_page: Optional[int] = MAX_PER_PAGE_DEFAULT,
+        error_out: bool = True,
+        count: bool = False,
+        _total: Optional[int] = None,
+    ) -> Self:
+        """Async init. Accepts the same parameters as :meth:`__init__`."""
+        order = _keyset_order(order_by)
+        cursor, forward, values, per_page = cls._prepare_args(
+            order=order,
+            cursor=cursor,
+            per_page=per_page,
+            max_per_page=max_per_page,
+            error_out=error_out,
+        )
+        rows = (
+            (
+                await session.execute(
+                    cls._page_select(select, order, forward, values, per_page)
+                )
+            )
+            .unique()
+            .all()
+        )
+        if count and _total is None:
+            _total = (await session.execute(_count_select(select))).scalar()
+        return cls(
+            session,
+            select,
+            order_by,
+            cursor=cursor,
+            per_page=per_page,
+            max_per_page=max_per_page,
+            error_out=error_out,
+            count=count,
+            _rows=rows,
+            _forward=forward,
+            _total=_total,
+        )
+
+
+class QueryKeysetPagination(KeysetPagination[_O]):
+    """
+    Keyset pagination for a query. Returned by :meth:`.Query.keyset_paginate`.
+
+    :param query: Query, which must be for a single entity or column
+    :param order_by: Columns to order by, optionally with ``.desc()``, which together
+        must be unique
+    """
+
+    def __init__(
+        self,
+        query: sa_orm.Query[_O],
+        order_by: Sequence[Any],
+        *,
+        cursor: Optional[str] = None,
+        per_page: Optional[int] = None,
+        max_per_page: Optional[int] = MAX_PER_PAGE_DEFAULT,
+        error_out: bool = True,
+        count: bool = False,
+        _total: Optional[int] = None,
+    ) -> None:
+        order = _keyset_order(order_by)
+        cursor, forward, values, per_page = self._prepare_args(
+            order=order,
+            cursor=cursor,
+            per_page=per_page,
+            max_per_page=max_per_page,
+            error_out=error_out,
+        )
+        rows = self._page_select(query, order, forward, values, per_page).all()
+        if count and _total is None:
+            _total = query.order_by(None).count()
+        super().__init__(
+            rows,
+            _total,
+            cursor=cursor,
+            forward=forward,
+            per_page=per_page,
+            max_per_page=max_per_page,
+            error_out=error_out,
+            query=query,
+            order_by=order_by,
+        )
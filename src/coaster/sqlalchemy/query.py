@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import warnings
-from collections.abc import Collection
+from collections.abc import Collection, Iterable, Iterator, Mapping, Sequence
 from functools import wraps
+from itertools import islice
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -17,20 +18,22 @@ from typing import (
 )
 from typing_extensions import ParamSpec
 
-from sqlalchemy import ColumnExpressionArgument
+from sqlalchemy import ColumnElement, ColumnExpressionArgument, Row, inspect
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.orm import (
     DynamicMapped as DynamicMappedBase,
     InstrumentedAttribute,
     Query as QueryBase,
     Relationship as RelationshipBase,
+    Session,
     backref as backref_base,
     relationship as relationship_base,
+    scoped_session,
 )
 from sqlalchemy.orm.dynamic import AppenderMixin
 
 from ..compat import abort
-from .pagination import QueryPagination
+from .pagination import CountMode, QueryKeysetPagination, QueryPagination
 
 __all__ = [
     'BackrefWarning',
@@ -58,6 +61,43 @@ class BackrefWarning(UserWarning):
 ModelWarning = BackrefWarning
 
 
+# --- Chunked iteration ----------------------------------------------------------------
+
+
+def _iter_chunks(
+    session: Union[Session, scoped_session],
+    chunks: Iterable[Sequence[Any]],
+    *,
+    expunge: bool,
+    access_for: Optional[Mapping[str, Any]],
+) -> Iterator[list[Any]]:
+    """Yield chunks, wrapped in access proxies, expunging them once processed."""
+    for chunk in chunks:
+        if access_for is not None:
+            yield [item.access_for(**access_for) for item in chunk]
+        else:
+            yield list(chunk)
+        if expunge:
+            for item in chunk:
+                for obj in item if isinstance(item, Row) else (item,):
+                    if inspect(obj, raiseerr=False) is not None and obj in session:
+                        session.expunge(obj)
+
+
+def _exists_many(
+    fetch: Callable[[list[Any]], Iterable[Any]],
+    values: Iterable[Any],
+    chunk_size: int,
+) -> set[Any]:
+    """Return values that are present, calling ``fetch`` with chunks of values."""
+    # Remove duplicates and NULL, which never matches in an IN clause
+    unique = [value for value in dict.fromkeys(values) if value is not None]
+    found: set[Any] = set()
+    for start in range(0, len(unique), chunk_size):
+        found.update(fetch(unique[start : start + chunk_size]))
+    return found
+
+
 # --- Query class and property ---------------------------------------------------------
 # Change Query's Generic type to be covariant. This needed because:
 # 1. When using SQLAlchemy polymorphism, a query on the base type may return a subtype.
@@ -159,6 +199,69 @@ class Query(QueryBase[_T_co]):  # type: ignore[type-var]
         """
         return not self.session.query(self.exists()).scalar()
 
+    def exists_many(
+        self,
+        column: Union[ColumnElement[Any], InstrumentedAttribute[Any]],
+        values: Iterable[Any],
+        chunk_size: int = 500,
+    ) -> set[Any]:
+        """
+        Return the subset of ``values`` that are present in ``column``.
+
+        Does the equivalent of calling :meth:`notempty` for each value, but with a
+        single ``IN`` query per chunk of values, respecting the query's filters::
+
+            taken = Model.query.exists_many(Model.name, names)
+
+        :param column: Column to look for values in
+        :param values: Values to look for
+        :param chunk_size: Maximum number of values per query, to stay within the
+            database's limit on bind parameters
+        """
+        query = self.with_entities(column).order_by(None).distinct()
+        return _exists_many(
+            lambda chunk: (row[0] for row in query.filter(column.in_(chunk))),
+            values,
+            chunk_size,
+        )
+
+    def iter_chunks(
+        self,
+        size: int = 1000,
+        *,
+        expunge: bool = False,
+        access_for: Optional[Mapping[str, Any]] = None,
+    ) -> Iterator[list[_T_co]]:
+        """
+        Iterate over the results in lists of ``size`` items, to process large tables.
+
+        Rows are fetched with :meth:`~sqlalchemy.orm.Query.yield_per`, which uses a
+        server-side cursor where the database driver supports it, so only one chunk
+        is held in memory at a time. Eager loading of collections with
+        :func:`~sqlalchemy.orm.joinedload` is not supported, but
+        :func:`~sqlalchemy.orm.selectinload` is::
+
+            for chunk in Model.query.order_by(Model.id).iter_chunks(500, expunge=True):
+                for item in chunk:
+                    export(item)
+
+        The session's connection is busy with the cursor until iteration completes,
+        so commits must wait until then.
+
+        :param size: Number of items per chunk
+        :param expunge: Remove each chunk's instances from the session after it is
+            processed, so they can be garbage collected
+        :param access_for: Wrap each item in a :meth:`~.RoleMixin.access_for` proxy,
+            passing these parameters, such as ``{'actor': user, 'datasets': ...}``
+        """
+        rows = iter(self.yield_per(size))
+        yield from _iter_chunks(
+            self.session,
+            iter(lambda: list(islice(rows, size)), []),
+            expunge=expunge,
+            access_for=access_for,
+        )
+
     # TODO: Pagination may not preserve model type information, affecting downstream
     # type validation
     def paginate(
@@ -169,6 +272,7 @@ class Query(QueryBase[_T_co]):  # type: ignore[type-var]
         max_per_page: int | None = None,
         error_out: bool = True,
         count: bool = True,
+        count_mode: CountMode = 'exact',
     ) -> QueryPagination[_T_co]:
         """
         Apply an offset and limit to the query, returning a Pagination object.
@@ -186,6 +290,10 @@ class Query(QueryBase[_T_co]):  # type: ignore[type-var]
         :param count: Calculate the total number of values by issuing an extra count
             query. For very complex queries this may be inaccurate or slow, so it can be
             disabled and set manually if necessary
+        :param count_mode: ``exact`` (default) to count with a query, ``estimate`` to
+            use PostgreSQL's row estimate, or ``cached`` to memoize exact counts for a
+            short while. The pagination object's ``is_estimate`` flag is set if the
+            count may be inexact
         """
         return QueryPagination(
             query=self,
@@ -194,6 +302,48 @@ class Query(QueryBase[_T_co]):  # type: ignore[type-var]
             max_per_page=max_per_page,
             error_out=error_out,
             count=count,
+            count_mode=count_mode,
+        )
+
+    def keyset_paginate(
+        self,
+        *order_by: Any,
+        cursor: str | None = None,
+        per_page: int | None = None,
+        max_per_page: int | None = None,
+        error_out: bool = True,
+        count: bool = False,
+    ) -> QueryKeysetPagination[_T_co]:
+        """
+        Filter the query by the keys of an adjacent page, returning a Pagination object.
+
+        Unlike :meth:`paginate`, this does not use an offset and remains fast on deep
+        pages. The order must be over columns that together are unique, and any
+        existing order on the query is replaced::
+
+            page = Model.query.keyset_paginate(Model.created_at.desc(), Model.id.desc())
+            next_page = page.next()
+
+        :param order_by: Columns to order by, optionally with ``.desc()``
+        :param cursor: Cursor for the page, from the ``next_cursor`` or ``prev_cursor``
+            of another page. Defaults to the ``cursor`` query arg during a request, or
+            the first page otherwise
+        :param per_page: The maximum number of items on a page. Defaults to the
+            ``per_page`` query arg during a request, or 20 otherwise
+        :param max_per_page: The maximum allowed value for ``per_page``, to limit a
+            user-provided value. Use ``None`` for no limit. Defaults to 100
+        :param error_out: Abort with a ``404 Not Found`` error if the cursor is invalid
+            or no items are returned for it
+        :param count: Calculate the total number of values with an extra count query
+        """
+        return QueryKeysetPagination(
+            query=self,
+            order_by=order_by,
+            cursor=cursor,
+            per_page=per_page,
+            max_per_page=max_per_page,
+            error_out=error_out,
+            count=count,
         )
 
 
@@ -13,6 +13,18 @@ _P = ParamSpec('_P')
 _R_co = TypeVar('_R_co', covariant=True)
 
 
+class AsyncMethod(Protocol[_P, _R_co]):
+    """Protocol for an async instance method."""
+
+    # pylint: disable=no-self-argument
+    def __call__(  # noqa: D102,RUF100
+        __self,  # noqa: N805
+        self: Any,
+        *args: _P.args,
+        **kwargs: _P.kwargs,
+    ) -> Coroutine[Any, Any, _R_co]: ...
+
+
 class Method(Protocol[_P, _R_co]):
     """Protocol for an instance method (sync or async)."""
 
@@ -0,0 +1,77 @@
+"""Internal helpers shared between view modules. Not part of the public API."""
+
+# pyright: reportMissingImports=false
+
+from __future__ import annotations
+
+from collections.abc import Collection, Set as AbstractSet
+from datetime import datetime, timezone
+from typing import Optional, Union
+
+from ..compat import SansIoResponse, request
+
+__all__ = ['has_permission', 'is_not_modified', 'set_cache_validators']
+
+
+def has_permission(
+    permission: Union[str, AbstractSet[str]], permissions: Optional[Collection[str]]
+) -> bool:
+    """
+    Test if a permission (or any one of a set of permissions) is available.
+
+    :param permission: Permission to test for, or a set of which any one will do
+    :param permissions: Available permissions, typically ``current_auth.permissions``
+    """
+    if not permissions:
+        return False
+    if isinstance(permission, AbstractSet):
+        return not permission.isdisjoint(permissions)
+    return permission in permissions
+
+
+def http_timestamp(timestamp: datetime) -> datetime:
+    """Return a timestamp in UTC with the one second precision of HTTP headers."""
+    if timestamp.tzinfo is None:
+        # Naive timestamps from the database are in UTC
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return timestamp.astimezone(timezone.utc).replace(microsecond=0)
+
+
+def is_not_modified(etag: Optional[str], last_modified: Optional[datetime]) -> bool:
+    """
+    Check if the client's copy of the resource is current, for a conditional GET.
+
+    ``If-None-Match`` takes precedence over ``If-Modified-Since`` as in RFC 9110, and
+    ETags are compared with the weak comparison function.
+
+    :param etag: ETag of the current version of the resource, if known
+    :param last_modified: Last modified timestamp of the resource, if known
+    :return: `True` if a ``304 Not Modified`` response may be sent instead
+    """
+    if request.method not in ('GET', 'HEAD'):
+        return False
+    if request.if_none_match:
+        return etag is not None and request.if_none_match.contains_weak(etag)
+    if last_modified is not None and request.if_modified_since is not None:
+        return http_timestamp(last_modified) <= request.if_modified_since
+    return False
+
+
+def set_cache_validators(
+    response: SansIoResponse, etag: Optional[str], last_modified: Optional[datetime]
+) -> None:
+    """
+    Add ETag (as a weak ETag) and Last-Modified headers if not already present.
+
+    Only ``200 OK`` and ``304 Not Modified`` responses receive these headers.
+
+    :param response: Response to add headers to
+    :param etag: ETag of the resource, if known
+    :param last_modified: Last modified timestamp of the resource, if known
+    """
+    if response.status_code not in (200, 304):
+        return
+    if etag is not None and 'ETag' not in response.headers:
+        response.set_etag(etag, weak=True)
+    if last_modified is not None and 'Last-Modified' not in response.headers:
+        response.last_modified = http_timestamp(last_modified)
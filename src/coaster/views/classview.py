@@ -9,15 +9,31 @@ Group related views into a class for easier management. See :class:`ClassView` a
 
 from __future__ import annotations
 
-from collections.abc import Awaitable, Collection, Coroutine
+import hashlib
+import secrets
+from collections import OrderedDict
+from collections.abc import (
+    Awaitable,
+    Collection,
+    Coroutine,
+    Iterable,
+    Mapping,
+    Set as AbstractSet,
+)
+from dataclasses import dataclass
+from datetime import datetime
 from functools import partial, update_wrapper, wraps
-from inspect import iscoroutinefunction
+from inspect import isawaitable, iscoroutinefunction
+from itertools import chain
+from threading import Lock
+from time import monotonic, perf_counter
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     ClassVar,
     Generic,
+    NamedTuple,
     Optional,
     Protocol,
     Union,
@@ -35,12 +51,18 @@ from typing_extensions import (
     deprecated,
     get_original_bases,
 )
+from weakref import WeakKeyDictionary, WeakSet
 
+import sqlalchemy as sa
+import sqlalchemy.orm as sa_orm
 from flask.typing import ResponseReturnValue
 from furl import furl
+from sqlalchemy.exc import NoResultFound
+from sqlalchemy.ext.asyncio import AsyncSession, async_scoped_session
 from sqlalchemy.orm.attributes import InstrumentedAttribute
 from sqlalchemy.orm.descriptor_props import SynonymProperty
 from sqlalchemy.orm.properties import RelationshipProperty
+from werkzeug.datastructures import Headers
 from werkzeug.local import LocalProxy
 from werkzeug.routing import Map as WzMap, Rule as WzRule
 
@@ -53,13 +75,22 @@ from ..compat import (
     abort,
     app_ctx,
     async_make_response,
+    current_app,
     make_response,
     redirect,
     request,
 )
-from ..sqlalchemy import PermissionMixin, Query, UrlForMixin
-from ..typing import Method
+from ..sqlalchemy import (
+    PermissionMixin,
+    Query,
+    RoleMixin,
+    UrlForMixin,
+    cache_instance,
+    get_cached_instance,
+)
+from ..typing import AsyncMethod, Method
 from ..utils import InspectableSet
+from ._helpers import has_permission, is_not_modified, set_cache_validators
 
 __all__ = [
     # Functions
@@ -68,15 +99,24 @@ __all__ = [
     # View base classes
     'ClassView',
     'ModelView',
+    'ViewRegistrationStats',
     # View decorators
     'route',
     'viewdata',
     'url_change_check',
     'requires_roles',
+    'cached_view',
+    'invalidate_cached_views',
+    'conditional_get',
+    # View cache backends
+    'ViewCacheBackend',
+    'CachedViewProtocol',
+    'LruViewCache',
     # Mixin classes
     'UrlChangeCheck',
     'UrlForView',
     'InstanceLoader',
+    'AsyncInstanceLoader',
 ]
 
 # --- Types and protocols --------------------------------------------------------------
@@ -105,12 +145,22 @@ class RouteDecoratorProtocol(Protocol):
     @overload
     def __call__(self, __decorated: ViewMethod[_P, _R_co]) -> ViewMethod[_P, _R_co]: ...
 
+    @overload
+    def __call__(
+        self, __decorated: AsyncMethod[_P, _R_co]
+    ) -> ViewMethod[_P, _R_co]: ...
+
     @overload
     def __call__(self, __decorated: Method[_P, _R_co]) -> ViewMethod[_P, _R_co]: ...
 
     def __call__(
         self,
-        __decorated: Union[ClassViewType, Method[_P, _R_co], ViewMethod[_P, _R_co]],
+        __decorated: Union[
+            ClassViewType,
+            AsyncMethod[_P, _R_co],
+            Method[_P, _R_co],
+            ViewMethod[_P, _R_co],
+        ],
     ) -> Union[ClassViewType, ViewMethod[_P, _R_co]]: ...
 
 
@@ -120,11 +170,19 @@ class ViewDataDecoratorProtocol(Protocol):
     @overload
     def __call__(self, __decorated: ViewMethod[_P, _R_co]) -> ViewMethod[_P, _R_co]: ...
 
+    @overload
+    def __call__(
+        self, __decorated: AsyncMethod[_P, _R_co]
+    ) -> ViewMethod[_P, _R_co]: ...
+
     @overload
     def __call__(self, __decorated: Method[_P, _R_co]) -> ViewMethod[_P, _R_co]: ...
 
     def __call__(
-        self, __decorated: Union[Method[_P, _R_co], ViewMethod[_P, _R_co]]
+        self,
+        __decorated: Union[
+            AsyncMethod[_P, _R_co], Method[_P, _R_co], ViewMethod[_P, _R_co]
+        ],
     ) -> ViewMethod[_P, _R_co]: ...
 
 
@@ -248,6 +306,130 @@ def viewdata(**kwargs: Any) -> ViewDataDecoratorProtocol:
     return decorator
 
 
+def _cors_preflight(view: Callable) -> Optional[SansIoResponse]:
+    """Respond to a pre-flight request if the view uses :func:`~coaster.views.cors`."""
+    preflight: Optional[Callable[[], Optional[SansIoResponse]]] = getattr(
+        view, 'cors_preflight', None
+    )
+    return preflight() if preflight is not None else None
+
+
+class _AvailabilityPlan(NamedTuple):
+    """Requirements for a view method, for :meth:`ModelView.available_actions`."""
+
+    #: Sets of roles, each of which must overlap with the actor's roles
+    roles: tuple[frozenset[str], ...]
+    #: Union of all roles in :attr:`roles`
+    roles_union: frozenset[str]
+    #: Permissions (or sets of alternative permissions) that must all be available
+    permissions: tuple[Union[str, AbstractSet[str]], ...]
+    #: Any other ``is_available`` test that must be called with a view instance
+    is_available: Optional[Callable[[Any], bool]]
+
+
+def _availability_plan(func: Callable) -> _AvailabilityPlan:
+    """Extract availability requirements from a decorated view method."""
+    roles: list[frozenset[str]] = []
+    permissions: list[Union[str, AbstractSet[str]]] = []
+    is_available: Optional[Callable[[Any], bool]] = getattr(func, 'is_available', None)
+    while is_available is not None:
+        if hasattr(is_available, 'requires_roles'):
+            roles.append(frozenset(is_available.requires_roles))
+        elif hasattr(is_available, 'requires_permission'):
+            permissions.append(is_available.requires_permission)
+        else:
+            # Not a test we can evaluate in bulk
+            break
+        is_available = getattr(is_available, 'inner_is_available', None)
+    return _AvailabilityPlan(
+        tuple(roles), frozenset().union(*roles), tuple(permissions), is_available
+    )
+
+
+@dataclass
+class ViewRegistrationStats:
+    """Startup costs of a :class:`ClassView`, from :meth:`ClassView.registration_stats`."""
+
+    #: Number of view methods prepared with the class's decorators
+    views: int = 0
+    #: Number of view methods that reused a decorator chain prepared for a base class
+    decorator_cache_hits: int = 0
+    #: Seconds spent applying decorators to view methods
+    decorate_time: float = 0.0
+    #: Number of URL rules registered by :meth:`ClassView.init_app`
+    routes: int = 0
+    #: Seconds spent in :meth:`ClassView.init_app`
+    init_app_time: float = 0.0
+
+
+_registration_stats: WeakKeyDictionary[type, ViewRegistrationStats] = (
+    WeakKeyDictionary()
+)
+_decorator_chains: WeakKeyDictionary[type, tuple[Callable, ...]] = WeakKeyDictionary()
+_decorated_funcs: WeakKeyDictionary[
+    Callable, dict[tuple[tuple[Callable, ...], str], Callable]
+] = WeakKeyDictionary()
+
+
+def _get_registration_stats(cls: type) -> ViewRegistrationStats:
+    """Return registration stats for a class, creating them if necessary."""
+    stats = _registration_stats.get(cls)
+    if stats is None:
+        stats = _registration_stats[cls] = ViewRegistrationStats()
+    return stats
+
+
+def _decorator_chain(owner: type) -> tuple[Callable, ...]:
+    """
+    Return decorators from ``__decorators__`` in all bases, in order of application.
+
+    The oldest defined decorators (from mixins) are applied first, and the class's own
+    decorators last. Within each list of decorators, the list is reversed, so that
+    ``__decorators__ = [first, second]`` has the same effect as decorating a method
+    with ``@first`` above ``@second``.
+    """
+    chain = _decorator_chains.get(owner)
+    if chain is None:
+        chain = _decorator_chains[owner] = tuple(
+            decorator
+            for base in reversed(owner.__mro__)
+            if '__decorators__' in base.__dict__
+            for decorator in reversed(base.__dict__['__decorators__'])
+        )
+    return chain
+
+
+def _decorate(
+    func: Callable, chain: tuple[Callable, ...], name: str, stats: ViewRegistrationStats
+) -> Callable:
+    """
+    Apply a decorator chain to a view method, reusing a previous result if possible.
+
+    Subclasses of a view class get copies of its view methods, and will usually have
+    the same decorator chain, so the decorated function is cached per chain and name.
+    """
+    if not chain:
+        return func
+    try:
+        cache = _decorated_funcs.setdefault(func, {})
+        decorated_func = cache.get((chain, name))
+    except TypeError:  # The function or a decorator is not hashable or weakref-able
+        cache = None
+        decorated_func = None
+    if decorated_func is not None:
+        stats.decorator_cache_hits += 1
+        return decorated_func
+    decorated_func = func
+    for decorator in chain:
+        decorated_func = decorator(decorated_func)
+        # Decorators may not use functools.wraps, so give the decorated function the
+        # name of the method in the class
+        decorated_func.__name__ = name
+    if cache is not None:
+        cache[(chain, name)] = decorated_func
+    return decorated_func
+
+
 def rulejoin(class_rule: str, method_rule: str) -> str:
     """
     Join URL paths from routing rules on a class and its methods.
@@ -455,24 +637,12 @@ class ViewMethod(Generic[_P, _R_co]):
 
         # Decorate the wrapped view function with the class's desired decorators.
         # Mixin classes may provide their own decorators, and all of them will be
-        # applied. The oldest defined decorators (from mixins) will be applied first,
-        # and the class's own decorators last. Within the list of decorators, we reverse
-        # the list again, so that a list specified like this:
-        #
-        #     __decorators__ = [first, second]
-        #
-        # Has the same effect as writing this:
-        #
-        #     @first
-        #     @second
-        #     def myview(self):
-        #         pass
-        decorated_func = self.__func__
-        for base in reversed(owner.__mro__):
-            if '__decorators__' in base.__dict__:
-                for decorator in reversed(base.__dict__['__decorators__']):
-                    decorated_func = decorator(decorated_func)
-                    decorated_func.__name__ = name  # See below for why
+        # applied. See :func:`_decorator_chain` for the order of application
+        stats = _get_registration_stats(owner)
+        start = perf_counter()
+        decorated_func = _decorate(self.__func__, _decorator_chain(owner), name, stats)
+        stats.views += 1
+        stats.decorate_time += perf_counter() - start
 
         self.decorated_func = decorated_func
 
@@ -807,6 +977,10 @@ class ClassView:
             call this
         :param view_args: View arguments, to be passed on to the view method
         """
+        # Respond to a CORS pre-flight request without calling the hooks or view
+        preflight_response = _cors_preflight(view)
+        if preflight_response is not None:
+            return preflight_response
         # Call the :meth:`before_request` method
         resp = self.before_request()  # pylint: disable=assignment-from-none
         if resp is not None:
@@ -865,6 +1039,10 @@ class ClassView:
             call this
         :param view_args: View arguments, to be passed on to the view method
         """
+        # Respond to a CORS pre-flight request without calling the hooks or view
+        preflight_response = _cors_preflight(view)
+        if preflight_response is not None:
+            return preflight_response
         # Call the :meth:`async_before_request` method
         resp = await self.async_before_request()
         if resp is not None:
@@ -956,11 +1134,42 @@ class ClassView:
         If :attr:`callback` is specified, it will be called after Flask's
         :meth:`~flask.Flask.add_url_rule`, with app and the same parameters.
         """
+        stats = _get_registration_stats(cls)
+        start = perf_counter()
         for name in cls.__views__:
             attr = getattr(cls, name)
             attr.init_app(app, cls, callback=callback)
+            stats.routes += len(cls.__routes__) * len(attr.routes)
             if not hasattr(attr.decorated_func, 'is_available'):
                 cls.is_always_available = True
+        stats.init_app_time += perf_counter() - start
+
+    @classmethod
+    def registration_stats(cls) -> dict[type[ClassView], ViewRegistrationStats]:
+        """
+        Report startup costs for this class and all its subclasses.
+
+        Call this on :class:`ClassView` after all views are registered to find the view
+        classes that take the longest to prepare::
+
+            stats = ClassView.registration_stats()
+            slowest = sorted(
+                stats.items(),
+                key=lambda item: item[1].decorate_time + item[1].init_app_time,
+                reverse=True,
+            )
+        """
+        result: dict[type[ClassView], ViewRegistrationStats] = {}
+        pending = [cls]
+        while pending:
+            view_cls = pending.pop()
+            if view_cls in result:
+                continue
+            result[view_cls] = _registration_stats.get(
+                view_cls, ViewRegistrationStats()
+            )
+            pending.extend(view_cls.__subclasses__())
+        return result
 
 
 class ModelView(ClassView, Generic[ModelType]):
@@ -1023,6 +1232,9 @@ class ModelView(ClassView, Generic[ModelType]):
     :class:`~ModelView.GetAttr` class approach.
     """
 
+    #: Requirements of each view method, for :meth:`available_actions` (set on use)
+    _availability_plans: ClassVar[dict[str, _AvailabilityPlan]]
+
     class GetAttr:
         """
         An alternative to :attr:`~ModelView.route_model_map` with type hinting support.
@@ -1097,6 +1309,109 @@ class ModelView(ClassView, Generic[ModelType]):
             return True
         return isinstance(other, self.__class__) and other.obj == self.obj
 
+    def cache_validators(self) -> tuple[Optional[str], Optional[datetime]]:
+        """
+        Return an ETag and last modified timestamp for :attr:`obj` (if available).
+
+        Used by the :func:`conditional_get` decorator. The default implementation uses
+        the ``updated_at`` timestamp from
+        :class:`~coaster.sqlalchemy.mixins.TimestampMixin` as the last modified
+        timestamp, and makes an ETag from the model, the object's primary key, the
+        timestamp, and the roles available to the current actor from
+        :class:`~coaster.sqlalchemy.roles.RoleMixin`. Subclasses may override this to
+        use other validators. Returns `None` for both if the object does not have an
+        ``updated_at`` timestamp.
+        """
+        obj = self.obj
+        updated_at: Optional[datetime] = getattr(obj, 'updated_at', None)
+        if updated_at is None:
+            return None, None
+        roles = sorted(obj.current_roles) if isinstance(obj, RoleMixin) else []
+        state = sa.inspect(obj, raiseerr=False)
+        identity = state.identity if state is not None else None
+        etag = hashlib.blake2b(
+            repr(
+                (type(obj).__qualname__, identity, updated_at.isoformat(), roles)
+            ).encode(),
+            digest_size=16,
+        ).hexdigest()
+        return etag, updated_at
+
+    @classmethod
+    def _get_availability_plans(cls) -> dict[str, _AvailabilityPlan]:
+        """Return requirements for each view method (cached in the class)."""
+        plans: Optional[dict[str, _AvailabilityPlan]] = cls.__dict__.get(
+            '_availability_plans'
+        )
+        if plans is None:
+            plans = {
+                name: _availability_plan(getattr(cls, name).decorated_func)
+                for name in sorted(cls.__views__)
+            }
+            cls._availability_plans = plans
+        return plans
+
+    @classmethod
+    def available_actions(cls, obj: ModelType) -> dict[str, bool]:
+        """
+        Return availability of every view method in this class for the given object.
+
+        This is the bulk equivalent of calling :meth:`ViewMethodBind.is_available` on
+        each view method, as used in navigation menus. Roles required by
+        :func:`requires_roles` are tested against a single role set for the object, and
+        permissions required by :func:`~coaster.views.decorators.requires_permission`
+        are tested against the permissions the object grants the current actor, as the
+        view would see them after loading the object. Other ``is_available`` tests are
+        called with a view instance for the object.
+
+        :param obj: Object to test views with
+        :return: Dictionary of view method name to availability
+        """
+        return cls.available_actions_many([obj])[0]
+
+    @classmethod
+    def available_actions_many(cls, objs: Iterable[ModelType]) -> list[dict[str, bool]]:
+        """
+        Return availability of every view method for each of the given objects.
+
+        Requirements of each view method are determined once for the class. See
+        :meth:`available_actions` for details.
+
+        :param objs: Objects to test views with
+        :return: List of dictionaries of view method name to availability
+        """
+        plans = cls._get_availability_plans()
+        required_roles = frozenset().union(*(p.roles_union for p in plans.values()))
+        needs_permissions = any(p.permissions for p in plans.values())
+        results = []
+        for obj in objs:
+            if required_roles and isinstance(obj, RoleMixin):
+                # A single lazy role set for the object, tested only for roles that
+                # the views require
+                roles = obj.roles_for(current_auth.actor, current_auth.anchors)
+                present_roles = frozenset(r for r in required_roles if r in roles)
+            else:
+                present_roles = frozenset()
+            permissions = (
+                obj.current_permissions
+                if needs_permissions and isinstance(obj, PermissionMixin)
+                else current_auth.permissions
+            )
+            context: Optional[ModelView] = None
+            available: dict[str, bool] = {}
+            for name, plan in plans.items():
+                result = all(
+                    not view_roles.isdisjoint(present_roles)
+                    for view_roles in plan.roles
+                ) and all(has_permission(p, permissions) for p in plan.permissions)
+                if result and plan.is_available is not None:
+                    if context is None:
+                        context = cls(obj)
+                    result = plan.is_available(context)
+                available[name] = result
+            results.append(available)
+        return results
+
     def dispatch_request(
         self, view: Callable[..., ResponseReturnValue], view_args: dict[str, Any]
     ) -> SansIoResponse:
@@ -1114,6 +1429,10 @@ class ModelView(ClassView, Generic[ModelType]):
         :param dict view_args: View arguments, to be passed on to :meth:`load` but not
             to the view
         """
+        # Respond to a CORS pre-flight request without loading the model
+        preflight_response = _cors_preflight(view)
+        if preflight_response is not None:
+            return preflight_response
         # Call the :meth:`before_request` method
         resp = self.before_request()  # pylint: disable=assignment-from-none
         if resp is not None:
@@ -1124,8 +1443,10 @@ class ModelView(ClassView, Generic[ModelType]):
             return self.after_request(make_response(resp))
         # Trigger post-load processing of the object
         self.post_load()
-        # Call the view method, then pass the response to :meth:`after_response`
-        return self.after_request(make_response(view(self)))
+        # Call the view method
+        response = make_response(view(self))
+        # Pass the response to :meth:`after_response`
+        return self.after_request(response)
 
     async def async_dispatch_request(
         self,
@@ -1146,6 +1467,10 @@ class ModelView(ClassView, Generic[ModelType]):
         :param dict view_args: View arguments, to be passed on to :meth:`load` but not
             to the view
         """
+        # Respond to a CORS pre-flight request without loading the model
+        preflight_response = _cors_preflight(view)
+        if preflight_response is not None:
+            return preflight_response
         # Call the :meth:`before_request` method (optionally async)
         resp = await self.async_before_request()
         if resp is not None:
@@ -1157,10 +1482,10 @@ class ModelView(ClassView, Generic[ModelType]):
             return await self.async_after_request(await async_make_response(resp))
         # Trigger post-load processing of the object
         self.post_load()
-        # Call the view method, then pass the response to :meth:`async_after_response`
-        return await self.async_after_request(
-            await async_make_response(await view(self))
-        )
+        # Call the view method
+        response = await async_make_response(await view(self))
+        # Pass the response to :meth:`async_after_response`
+        return await self.async_after_request(response)
 
     if TYPE_CHECKING:
         # Type-checking version without arg-spec to let subclasses specify explicit args
@@ -1277,6 +1602,12 @@ def requires_roles(
                 return f.is_available(context)
             return result
 
+        # Describe the test so that ModelView.available_actions can evaluate it in bulk
+        is_available.requires_roles = roles  # type: ignore[attr-defined]
+        is_available.inner_is_available = getattr(  # type: ignore[attr-defined]
+            f, 'is_available', None
+        )
+
         def validate(context: ModelViewType) -> None:
             add_auth_attribute('login_required', True)
             if not is_available_here(context):
@@ -1305,12 +1636,493 @@ def requires_roles(
     return decorator
 
 
+# --- View response cache --------------------------------------------------------------
+
+
+class ViewCacheBackend(Protocol):
+    """
+    Protocol for a cache backend used by :func:`cached_view`.
+
+    This is a subset of the API of Flask-Caching's cache object, which can be used as a
+    backend that is shared across processes.
+    """
+
+    def get(self, key: str) -> Any: ...
+
+    def set(self, key: str, value: Any, timeout: Optional[int] = None) -> Any: ...
+
+    def delete(self, key: str) -> Any: ...
+
+
+class CachedViewProtocol(Protocol[_P, _R_co]):
+    """Protocol for a view decorated with :func:`cached_view`."""
+
+    #: Cache backend used by the view
+    view_cache: ViewCacheBackend
+
+    def __call__(self, *args: _P.args, **kwargs: _P.kwargs) -> _R_co: ...
+
+
+class LruViewCache:
+    """
+    In-process LRU cache backend for :func:`cached_view`.
+
+    A timeout of `None` or ``0`` means the entry does not expire, but it may still be
+    evicted when the cache is full.
+
+    :param maxsize: Maximum number of entries in the cache
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        self._data: OrderedDict[str, tuple[Optional[float], Any]] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str) -> Any:
+        """Get a value from the cache, returning `None` if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires is not None and expires < monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
+        """Set a value in the cache, evicting the least recently used if full."""
+        expires = monotonic() + timeout if timeout else None
+        with self._lock:
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return True
+
+    def delete(self, key: str) -> bool:
+        """Remove a value from the cache."""
+        with self._lock:
+            return self._data.pop(key, None) is not None
+
+    def clear(self) -> None:
+        """Remove all values from the cache."""
+        with self._lock:
+            self._data.clear()
+
+
+#: Backends used by :func:`cached_view`, for invalidation on flush
+_view_cache_backends: WeakSet[Any] = WeakSet()
+#: Models with cached views, for invalidation on flush
+_view_cache_models: set[type[Any]] = set()
+
+
+def _view_cache_generation_key(obj: Any) -> Optional[str]:
+    """Return the cache key for the generation token of a model instance."""
+    state = sa.inspect(obj, raiseerr=False)
+    if state is None or state.identity is None:
+        return None
+    model = type(obj)
+    return (
+        f'coaster.view.gen:{model.__module__}.{model.__qualname__}:{state.identity!r}'
+    )
+
+
+def invalidate_cached_views(obj: Any) -> None:
+    """
+    Invalidate cached views of a model instance in all :func:`cached_view` backends.
+
+    Instances are automatically invalidated when they are flushed to the database. This
+    function can be used when a cached view also depends on related data, such as when
+    a child object is added to a parent.
+    """
+    _listen_for_view_cache_flush()
+    gen_key = _view_cache_generation_key(obj)
+    if gen_key is not None:
+        for backend in list(_view_cache_backends):
+            backend.delete(gen_key)
+
+
+def _invalidate_cached_views_on_flush(session: sa_orm.Session, _context: Any) -> None:
+    if _view_cache_models:
+        models = tuple(_view_cache_models)
+        for obj in chain(session.dirty, session.deleted):
+            if isinstance(obj, models):
+                invalidate_cached_views(obj)
+
+
+def _listen_for_view_cache_flush() -> None:
+    """Invalidate cached views on flush, once :func:`cached_view` is in use."""
+    if not sa.event.contains(
+        sa_orm.Session, 'after_flush', _invalidate_cached_views_on_flush
+    ):
+        sa.event.listen(
+            sa_orm.Session, 'after_flush', _invalidate_cached_views_on_flush
+        )
+
+
+def cached_view(
+    timeout: Optional[int] = None,
+    backend: Optional[ViewCacheBackend] = None,
+    maxsize: int = 1024,
+) -> Callable[[Callable[_P, _R_co]], CachedViewProtocol[_P, _R_co]]:
+    """
+    Cache the response of a :class:`ClassView` or :class:`ModelView` view.
+
+    For views whose output depends only on the loaded object and the roles available
+    to the current actor, this decorator caches the response of GET and HEAD requests,
+    skipping the view (and rendering by :func:`~coaster.views.decorators.render_with`)
+    on a cache hit::
+
+        @route('/<document>')
+        class DocumentView(ModelView[Document]):
+            @route('')
+            @requires_roles({'reader'})
+            @cached_view(timeout=300)
+            @render_with('document.html', json=True)
+            def view(self):
+                return {'document': self.obj.current_access()}
+
+    The cache key combines the endpoint, view arguments, query string, mimetype
+    negotiated by ``render_with`` (or the ``Accept`` header if the view does not use
+    ``render_with``), and for a :class:`ModelView`, the identity, ``updated_at``
+    timestamp and :attr:`~coaster.sqlalchemy.roles.RoleMixin.current_roles` of
+    :attr:`~ModelView.obj`. Cached views of an object are invalidated when it is
+    flushed to the database, or with :func:`invalidate_cached_views`. Only responses
+    with status code 200 that do not set a cookie are cached. A view without an
+    object is only cached for anonymous requests, as its key has no roles to tell
+    actors apart.
+
+    Decorators that must run on every request, like :func:`requires_roles`, must be
+    placed above this decorator.
+
+    :param timeout: Cache timeout in seconds (default `None` to use the backend default)
+    :param backend: Cache backend, such as Flask-Caching's cache object (default: a new
+        :class:`LruViewCache` for this view)
+    :param maxsize: Size of the default LRU cache
+    """
+    cache_backend: ViewCacheBackend = (
+        backend if backend is not None else LruViewCache(maxsize)
+    )
+    _view_cache_backends.add(cache_backend)
+    _listen_for_view_cache_flush()
+
+    def decorator(f: Callable[_P, _R_co]) -> CachedViewProtocol[_P, _R_co]:
+        negotiate: Optional[Callable[[str], Any]] = getattr(
+            f, 'render_with_negotiate', None
+        )
+
+        def cache_key(context: ClassView) -> Optional[str]:
+            if request.method not in ('GET', 'HEAD'):
+                return None
+            parts: list[Any] = [
+                request.endpoint,
+                sorted((request.view_args or {}).items()),
+                request.query_string,
+                negotiate(request.headers.get('Accept', '')).mimetype
+                if negotiate is not None
+                else request.headers.get('Accept', ''),
+            ]
+            obj = getattr(context, 'obj', None)
+            if obj is None:
+                if current_auth:
+                    # Without an object there are no roles to separate one actor's
+                    # response from another's, so don't cache
+                    return None
+            else:
+                gen_key = _view_cache_generation_key(obj)
+                if gen_key is None:
+                    # Can't identify the object, so can't cache
+                    return None
+                generation = cache_backend.get(gen_key)
+                if generation is None:
+                    generation = secrets.token_hex(8)
+                    cache_backend.set(gen_key, generation, 0)
+                _view_cache_models.add(type(obj))
+                parts.extend(
+                    [
+                        gen_key,
+                        generation,
+                        getattr(obj, 'updated_at', None),
+                        sorted(obj.current_roles)
+                        if isinstance(obj, RoleMixin)
+                        else None,
+                    ]
+                )
+            return (
+                'coaster.view:'
+                + hashlib.blake2b(repr(parts).encode(), digest_size=20).hexdigest()
+            )
+
+        def cacheable(response: SansIoResponse) -> bool:
+            return (
+                response.status_code == 200
+                and 'Set-Cookie' not in response.headers
+                and not getattr(response, 'is_streamed', False)
+            )
+
+        def cached_response(value: tuple[int, list[tuple[str, str]], bytes]) -> Any:
+            status, headers, body = value
+            return current_app.response_class(
+                body, status=status, headers=Headers(headers)
+            )
+
+        if iscoroutinefunction(f):
+
+            @wraps(f)
+            async def async_wrapper(*args: _P.args, **kwargs: _P.kwargs) -> Any:
+                key = cache_key(args[0])  # type: ignore[arg-type]
+                if key is not None and (value := cache_backend.get(key)) is not None:
+                    return cached_response(value)
+                response = await async_make_response(await f(*args, **kwargs))
+                if key is not None and cacheable(response):
+                    data = response.get_data()
+                    body = await data if isawaitable(data) else data
+                    cache_backend.set(
+                        key,
+                        (response.status_code, list(response.headers.items()), body),
+                        timeout,
+                    )
+                return response
+
+            # Fix return type hint
+            wrapper = cast(Callable[_P, _R_co], async_wrapper)
+        else:
+
+            @wraps(f)
+            def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> Any:
+                key = cache_key(args[0])  # type: ignore[arg-type]
+                if key is not None and (value := cache_backend.get(key)) is not None:
+                    return cached_response(value)
+                response = make_response(f(*args, **kwargs))
+                if key is not None and cacheable(response):
+                    cache_backend.set(
+                        key,
+                        (
+                            response.status_code,
+                            list(response.headers.items()),
+                            response.get_data(),
+                        ),
+                        timeout,
+                    )
+                return response
+
+        cached_wrapper = cast(CachedViewProtocol[_P, _R_co], wrapper)
+        cached_wrapper.view_cache = cache_backend
+        return cached_wrapper
+
+    return decorator
+
+
+def conditional_get(f: Callable[_P, _R_co]) -> Callable[_P, _R_co]:
+    """
+    Respond to a conditional GET request in a :class:`ModelView` without the view.
+
+    This decorator calls :meth:`ModelView.cache_validators` and responds with ``304 Not
+    Modified`` if the client's ``If-None-Match`` or ``If-Modified-Since`` headers show
+    it has the current version. Otherwise the view is called and ``ETag`` and
+    ``Last-Modified`` headers are added to its response. Use it only for views whose
+    response depends on nothing more than the validators: the object's last update and
+    the roles available to the current actor::
+
+        @route('/<document>')
+        class DocumentView(ModelView[Document]):
+            @route('')
+            @requires_roles({'reader'})
+            @conditional_get
+            @render_with('document.html', json=True)
+            def view(self):
+                return {'document': self.obj.current_access()}
+
+    Decorators that check access, like :func:`requires_roles`, must be placed above
+    this decorator, or a client could learn of the object's last update without
+    access to it. The ETag includes the mimetype negotiated by ``render_with`` (or the
+    ``Accept`` header if the view does not use ``render_with``), and the response
+    varies by ``Accept``.
+    """
+    negotiate: Optional[Callable[[str], Any]] = getattr(
+        f, 'render_with_negotiate', None
+    )
+
+    def cache_validators(
+        context: ModelView,
+    ) -> Optional[tuple[Optional[str], Optional[datetime]]]:
+        if request.method not in ('GET', 'HEAD'):
+            return None
+        etag, last_modified = context.cache_validators()
+        if etag is not None:
+            accept = request.headers.get('Accept', '')
+            mimetype = negotiate(accept).mimetype if negotiate is not None else accept
+            etag = f'{etag}:{mimetype}'
+        return etag, last_modified
+
+    def add_cache_validators(
+        response: SansIoResponse,
+        validators: Optional[tuple[Optional[str], Optional[datetime]]],
+    ) -> SansIoResponse:
+        if validators is not None:
+            set_cache_validators(response, *validators)
+            response.vary.add('Accept')
+        return response
+
+    if iscoroutinefunction(f):
+
+        @wraps(f)
+        async def async_wrapper(*args: _P.args, **kwargs: _P.kwargs) -> Any:
+            validators = cache_validators(args[0])  # type: ignore[arg-type]
+            if validators is not None and is_not_modified(*validators):
+                response = await async_make_response('', 304)
+            else:
+                response = await async_make_response(await f(*args, **kwargs))
+            return add_cache_validators(response, validators)
+
+        return cast(Callable[_P, _R_co], async_wrapper)
+
+    @wraps(f)
+    def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> Any:
+        validators = cache_validators(args[0])  # type: ignore[arg-type]
+        if validators is not None and is_not_modified(*validators):
+            response = make_response('', 304)
+        else:
+            response = make_response(f(*args, **kwargs))
+        return add_cache_validators(response, validators)
+
+    return wrapper
+
+
+def _url_for_view_paramattrs(
+    cls: type[ModelView],
+    app: SansIoApp,
+    rule: str,
+    endpoint: str,
+    options: dict[str, Any],
+) -> dict[str, Any]:
+    """Return URL parameters for a :class:`UrlForView` rule, mapped to attributes."""
+    # Only pass in the attrs that are included in the rule.
+    # 1. Extract list of variables from the rule
+    rulevars = _get_arguments_from_rule(rule, endpoint, options, app.url_map)
+    # 2. Make a subset of cls.GetAttr and cls.route_model_map with the required
+    # variables
+    try:
+        return {
+            v: (
+                getattr(cls.GetAttr, v)
+                if hasattr(cls.GetAttr, v)
+                else cls.route_model_map[v]
+            )
+            for v in rulevars
+        }
+    except KeyError as exc:
+        raise TypeError(
+            f"View variable {exc.args[0]} missing in both"
+            f" {cls.__qualname__}.GetAttr and"
+            f" {cls.__qualname__}.route_model_map"
+        ) from None
+
+
+def _url_for_view_register(
+    cls: type[ModelView],
+    view_func: Callable,
+    app: SansIoApp,
+    *,
+    rule: str,
+    endpoint: str,
+    options: dict[str, Any],
+) -> None:
+    """Register a :class:`UrlForView` rule as an action on the model."""
+    model = cls.model
+    assert issubclass(model, UrlForMixin)  # nosec B101  # noqa: S101
+    # Register endpoint with the view function's name, endpoint name and parameters.
+    # Parameters are extracted from the rule when the action's URL is first built, as
+    # parsing every rule slows down startup for apps with many views
+    model.register_endpoint(
+        action=view_func.__name__,
+        endpoint=endpoint,
+        app=app,
+        roles=getattr(view_func, 'requires_roles', None),
+        paramattrs=partial(_url_for_view_paramattrs, cls, app, rule, endpoint, options),
+    )
+    model.register_view_for(
+        app=app,
+        action=view_func.__name__,
+        classview=cls,
+        attr=view_func.__name__,
+    )
+
+
+def _url_for_view_register_blueprint(
+    state: BlueprintSetupState,
+    *,
+    cls: type[ModelView],
+    view_func: Callable,
+    rule: str,
+    endpoint: str,
+    options: dict[str, Any],
+) -> None:
+    """Register a :class:`UrlForView` rule when its blueprint is registered."""
+    if state.url_prefix is not None:
+        reg_rule = '/'.join((state.url_prefix.rstrip('/'), rule.lstrip('/')))
+    else:
+        reg_rule = rule
+    if state.subdomain:
+        reg_options = dict(options)
+        reg_options.setdefault('subdomain', state.subdomain)
+    else:
+        reg_options = options
+    reg_endpoint = f'{state.name_prefix}.{state.name}.{endpoint}'.lstrip('.')
+    _url_for_view_register(
+        cls,
+        view_func,
+        state.app,
+        rule=reg_rule,
+        endpoint=reg_endpoint,
+        options=reg_options,
+    )
+
+
+def _url_for_view_callback(
+    cls: type[ModelView],
+    callback: Optional[InitAppCallback],
+    app: Union[SansIoApp, SansIoBlueprint],
+    rule: str,
+    endpoint: str,
+    view_func: Callable,
+    **options: Any,
+) -> None:
+    """Process :meth:`ClassView.init_app` callbacks for :class:`UrlForView`."""
+    if isinstance(app, SansIoApp):
+        _url_for_view_register(
+            cls, view_func, app, rule=rule, endpoint=endpoint, options=options
+        )
+    elif isinstance(app, SansIoBlueprint):
+        app.record(
+            partial(
+                _url_for_view_register_blueprint,
+                cls=cls,
+                view_func=view_func,
+                rule=rule,
+                endpoint=endpoint,
+                options=options,
+            )
+        )
+    else:
+        raise TypeError(f"App must be Flask or Blueprint: {app!r}")
+    if callback:  # pragma: no cover
+        callback(app, rule, endpoint, view_func, **options)
+
+
 class UrlForView:
     """
     Mixin class that registers view methods as view actions on the model.
 
     This mixin must be used with :class:`ModelView`, and the model must be based on
-    :class:`~coaster.sqlalchemy.mixins.UrlForMixin`.
+    :class:`~coaster.sqlalchemy.mixins.UrlForMixin`. URL parameters are matched to
+    :attr:`ModelView.GetAttr` and :attr:`ModelView.route_model_map` when the URL is
+    first built, not when the view is registered.
     """
 
     __slots__ = ()
@@ -1322,92 +2134,9 @@ class UrlForView:
         callback: Optional[InitAppCallback] = None,
     ) -> None:
         """Register view on an app."""
-
-        def register_view_on_model(
-            cls: type[ModelView],
-            callback: Optional[InitAppCallback],
-            app: Union[SansIoApp, SansIoBlueprint],
-            rule: str,
-            endpoint: str,
-            view_func: Callable,
-            **options: Any,
-        ) -> None:
-            def register_paths_from_app(
-                reg_app: SansIoApp,
-                reg_rule: str,
-                reg_endpoint: str,
-                reg_options: dict[str, Any],
-            ) -> None:
-                model = cls.model
-                assert issubclass(model, UrlForMixin)  # nosec B101  # noqa: S101
-                # Only pass in the attrs that are included in the rule.
-                # 1. Extract list of variables from the rule
-                rulevars = _get_arguments_from_rule(
-                    reg_rule, reg_endpoint, reg_options, reg_app.url_map
-                )
-                # Make a subset of cls.GetAttr and cls.route_model_map with the required
-                # variables
-                try:
-                    params = {
-                        v: (
-                            getattr(cls.GetAttr, v)
-                            if hasattr(cls.GetAttr, v)
-                            else cls.route_model_map[v]
-                        )
-                        for v in rulevars
-                    }
-                except KeyError as exc:
-                    raise TypeError(
-                        f"View variable {exc.args[0]} missing in both"
-                        f" {cls.__qualname__}.GetAttr and"
-                        f" {cls.__qualname__}.route_model_map"
-                    ) from None
-
-                # Register endpoint with the view function's name, endpoint name and
-                # parameters
-                model.register_endpoint(
-                    action=view_func.__name__,
-                    endpoint=reg_endpoint,
-                    app=reg_app,
-                    roles=getattr(view_func, 'requires_roles', None),
-                    paramattrs=params,
-                )
-                model.register_view_for(
-                    app=reg_app,
-                    action=view_func.__name__,
-                    classview=cls,
-                    attr=view_func.__name__,
-                )
-
-            def blueprint_postprocess(state: BlueprintSetupState) -> None:
-                if state.url_prefix is not None:
-                    reg_rule = '/'.join(
-                        (state.url_prefix.rstrip('/'), rule.lstrip('/'))
-                    )
-                else:
-                    reg_rule = rule
-                if state.subdomain:
-                    reg_options = dict(options)
-                    reg_options.setdefault('subdomain', state.subdomain)
-                else:
-                    reg_options = options
-                reg_endpoint = f'{state.name_prefix}.{state.name}.{endpoint}'.lstrip(
-                    '.'
-                )
-                register_paths_from_app(state.app, reg_rule, reg_endpoint, reg_options)
-
-            if isinstance(app, SansIoApp):
-                register_paths_from_app(app, rule, endpoint, options)
-            elif isinstance(app, SansIoBlueprint):
-                app.record(blueprint_postprocess)
-            else:
-                raise TypeError(f"App must be Flask or Blueprint: {app!r}")
-            if callback:  # pragma: no cover
-                callback(app, rule, endpoint, view_func, **options)
-
         assert issubclass(cls, ModelView)  # nosec B101  # noqa: S101
         super().init_app(  # type: ignore[misc]
-            app, callback=partial(register_view_on_model, cls, callback)
+            app, callback=partial(_url_for_view_callback, cls, callback)
         )
 
 
@@ -1513,6 +2242,101 @@ class UrlChangeCheck:
     __decorators__: ClassVar[list[Callable[[Callable], Callable]]] = [url_change_check]
 
 
+class _LoaderPlan(NamedTuple):
+    """Joins and filters required to load a model given some view arguments."""
+
+    #: Relationship joins as (target model, relationship attribute)
+    joins: tuple[tuple[Any, Any], ...]
+    #: Filters as (view argument name, attribute to compare with)
+    filters: tuple[tuple[str, Any], ...]
+    #: A select on the model with the joins applied, to which filters may be added
+    statement: sa.Select
+
+
+def _loader_plan(
+    model: type[Any],
+    route_model_map: tuple[tuple[str, str], ...],
+    view_arg_names: frozenset[str],
+) -> _LoaderPlan:
+    """
+    Resolve the joins and filters required to load a model given view argument names.
+
+    Used by :class:`InstanceLoader` and :class:`AsyncInstanceLoader`. Relationships
+    (many-to-one or one-to-one) referenced in dotted attribute names are traversed with
+    a SQL ``JOIN``. The plan depends only on the model, the route model map and the
+    names of the view arguments, so it is computed once and cached in the view class
+    by :func:`_get_loader_plan`. Only the comparison
+    with view argument values is performed per request, as custom comparators (like
+    :attr:`~coaster.sqlalchemy.mixins.BaseIdNameMixin.url_id_name`) need the value.
+    """
+    joins: list[tuple[Any, Any]] = []
+    filters: list[tuple[str, Any]] = []
+    joined_models = set()
+    for key, name in route_model_map:
+        if key not in view_arg_names:
+            continue
+        if '.' in name:
+            # Did we get something like `parent.name`?
+            # Dig into it to find the source column
+            source = model
+            for subname in name.split('.'):
+                attr = relattr = getattr(source, subname)
+                # Did we get to something like 'parent'?
+                # 1. If it's a synonym, get the attribute it is a synonym for
+                # 2. If it's a relationship, find the source class, join it to
+                # the query, and then continue looking for attributes over there
+                if hasattr(attr, 'original_property') and isinstance(
+                    attr.original_property, SynonymProperty
+                ):
+                    attr = getattr(source, attr.original_property.name)
+                if isinstance(attr, InstrumentedAttribute) and isinstance(
+                    attr.property, RelationshipProperty
+                ):
+                    attr = attr.property.argument
+                    if attr not in joined_models:
+                        # SQL JOIN the other model on the basis of
+                        # the relationship that led us to this join
+                        joins.append((attr, relattr))
+                        # But ensure we don't JOIN twice
+                        joined_models.add(attr)
+                source = attr
+            filters.append((key, source))
+        else:
+            filters.append((key, getattr(model, name)))
+    statement = sa.select(model)
+    for target, onclause in joins:
+        statement = statement.join(target, onclause)
+    return _LoaderPlan(tuple(joins), tuple(filters), statement)
+
+
+#: Cache key for a loader plan: the route model map and the view argument names
+_LoaderPlanKey = tuple[tuple[tuple[str, str], ...], frozenset[str]]
+
+
+def _get_loader_plan(
+    view_cls: type[Union[InstanceLoader, AsyncInstanceLoader]],
+    view_args: Mapping[str, Any],
+) -> Optional[_LoaderPlan]:
+    """Return a loader plan if any of the view arguments are in the route model map."""
+    route_model_map = view_cls.route_model_map
+    view_arg_names = frozenset(name for name in view_args if name in route_model_map)
+    if not view_arg_names:
+        return None
+    # Cache in the view class and not in a module-level cache, so that the cache does
+    # not hold references to view and model classes after they are discarded
+    plans: Optional[dict[_LoaderPlanKey, _LoaderPlan]] = view_cls.__dict__.get(
+        '_loader_plans'
+    )
+    if plans is None:
+        plans = {}
+        view_cls._loader_plans = plans
+    key = (tuple(route_model_map.items()), view_arg_names)
+    plan = plans.get(key)
+    if plan is None:
+        plan = plans[key] = _loader_plan(view_cls.model, *key)
+    return plan
+
+
 class InstanceLoader:
     """
     Mixin class for :class:`ModelView` that loads an instance.
@@ -1522,62 +2346,119 @@ class InstanceLoader:
     traverse relationships (many-to-one or one-to-one) and perform a SQL ``JOIN`` with
     the target class.
 
+    The joins and attributes are resolved once for each combination of model and view
+    arguments, and a cached :func:`~sqlalchemy.sql.expression.select` with the joins is
+    reused in every request, only adding the filters for the view argument values. If
+    the view class specifies a custom :attr:`query`, joins and filters are applied to
+    it instead.
+
     .. deprecated:: 0.7.0
-        This loader cannot process complex joins and the query it produces is not
-        cached. Consider implementing a :meth:`~ModelView.loader` method directly, for
-        static type checking, easier refactoring, and better performance from query
-        caching.
+        This loader cannot process complex joins. Consider implementing a
+        :meth:`~ModelView.loader` method directly, for static type checking and easier
+        refactoring.
     """
 
     __slots__ = ()
     route_model_map: ClassVar[dict[str, str]]
     model: ClassVar[type[Any]]
     query: ClassVar[Optional[Query]] = None
+    _loader_plans: ClassVar[dict[_LoaderPlanKey, _LoaderPlan]]
 
     def loader(self, **view_args: Any) -> Any:
         """Load instance based on view arguments."""
-        if any(name in self.route_model_map for name in view_args):
-            # We have a URL route attribute that matches one of the model's attributes.
-            # Attempt to load the model instance
-            filters = {
-                self.route_model_map[key]: value
-                for key, value in view_args.items()
-                if key in self.route_model_map
+        plan = _get_loader_plan(self.__class__, view_args)
+        if plan is None:
+            return None
+        # We have a URL route attribute that matches one of the model's attributes.
+        # Attempt to load the model instance
+        if self.query is not None:
+            query = self.query
+            for target, onclause in plan.joins:
+                query = query.join(target, onclause)
+            for key, attr in plan.filters:
+                query = query.filter(attr == view_args[key])
+            return query.one_or_404()
+        filters = {self.route_model_map[key]: view_args[key] for key, _ in plan.filters}
+        instance = get_cached_instance(self.model, filters)
+        if instance is not None:
+            return instance
+        stmt = plan.statement
+        for key, attr in plan.filters:
+            stmt = stmt.where(attr == view_args[key])
+        try:
+            instance = self.model.query.session.execute(stmt).unique().scalars().one()
+        except NoResultFound:
+            abort(404)
+        cache_instance(self.model, filters, instance)
+        return instance
+
+
+class AsyncInstanceLoader:
+    """
+    Mixin class for :class:`ModelView` that loads an instance with an async session.
+
+    This is the async counterpart of :class:`InstanceLoader`. It builds a
+    :func:`~sqlalchemy.sql.expression.select` statement from the
+    :attr:`~ModelView.route_model_map` dictionary, with the same support for joins over
+    dotted relationship attributes, and executes it on :attr:`async_session` without
+    blocking the event loop. The async session may be an
+    :class:`~sqlalchemy.ext.asyncio.AsyncSession` or an
+    :class:`~sqlalchemy.ext.asyncio.async_scoped_session`::
+
+        @route('/<parent>/<document>')
+        class DocumentView(AsyncInstanceLoader, ModelView[Document]):
+            async_session = async_scoped_session(...)
+            route_model_map: ClassVar = {
+                'document': 'name',
+                'parent': 'parent.name',
             }
 
-            query = self.query or self.model.query
-            joined_models = set()
-            for name, value in filters.items():
-                if '.' in name:
-                    # Did we get something like `parent.name`?
-                    # Dig into it to find the source column
-                    source = self.model
-                    for subname in name.split('.'):
-                        attr = relattr = getattr(source, subname)
-                        # Did we get to something like 'parent'?
-                        # 1. If it's a synonym, get the attribute it is a synonym for
-                        # 2. If it's a relationship, find the source class, join it to
-                        # the query, and then continue looking for attributes over there
-                        if hasattr(attr, 'original_property') and isinstance(
-                            attr.original_property, SynonymProperty
-                        ):
-                            attr = getattr(source, attr.original_property.name)
-                        if isinstance(attr, InstrumentedAttribute) and isinstance(
-                            attr.property, RelationshipProperty
-                        ):
-                            attr = attr.property.argument
-                            if attr not in joined_models:
-                                # SQL JOIN the other model on the basis of
-                                # the relationship that led us to this join
-                                query = query.join(attr, relattr)
-                                # But ensure we don't JOIN twice
-                                joined_models.add(attr)
-                        source = attr
-                    query = query.filter(source == value)
-                else:
-                    query = query.filter(getattr(self.model, name) == value)
-            return query.one_or_404()
-        return None
+            @route('')
+            @render_with(json=True)
+            async def view(self):
+                return self.obj.current_access()
+
+    This mixin replaces :meth:`ModelView.async_load`, so it will only be used by async
+    view methods. Sync view methods will continue to use :meth:`ModelView.load`.
+    """
+
+    __slots__ = ()
+    route_model_map: ClassVar[dict[str, str]]
+    model: ClassVar[type[Any]]
+    # The `obj` slot is provided by ModelView. Declaring it in this mixin's __slots__
+    # too would make the two base classes' instance layouts conflict
+    obj: Any
+    _loader_plans: ClassVar[dict[_LoaderPlanKey, _LoaderPlan]]
+    #: Async session used to load the instance. Must be set in the subclass
+    async_session: ClassVar[Optional[Union[AsyncSession, async_scoped_session]]] = None
+
+    async def async_loader(self, **view_args: Any) -> Any:
+        """Load instance based on view arguments using :attr:`async_session`."""
+        plan = _get_loader_plan(self.__class__, view_args)
+        if plan is None:
+            return None
+        if self.async_session is None:
+            raise TypeError(
+                f"{self.__class__.__qualname__}.async_session must be specified"
+            )
+        stmt = plan.statement
+        for key, attr in plan.filters:
+            stmt = stmt.where(attr == view_args[key])
+        try:
+            return (await self.async_session.execute(stmt)).unique().scalars().one()
+        except NoResultFound:
+            abort(404)
+        return None  # type: ignore[unreachable]
+
+    async def async_load(self, **view_args: Any) -> Optional[ResponseReturnValue]:
+        """
+        Load the database object given view parameters.
+
+        Calls :meth:`async_loader` and sets the return value as
+        :attr:`~ModelView.obj`, then calls :meth:`~ModelView.after_loader`.
+        """
+        self.obj = await self.async_loader(**view_args)
+        return self.after_loader()  # type: ignore[attr-defined]
 
 
 # --- Proxy ----------------------------------------------------------------------------
@@ -3,33 +3,47 @@
 # spell-checker:ignore requestargs
 from __future__ import annotations
 
+import re
+import types
 from collections.abc import (
+    AsyncIterator,
     Awaitable,
     Collection,
     Container,
     Iterable,
+    Iterator,
     Mapping,
-    Set as AbstractSet,
 )
-from functools import wraps
+from dataclasses import MISSING, fields as dataclass_fields, is_dataclass
+from datetime import datetime
+from functools import lru_cache, wraps
 from inspect import isawaitable, iscoroutinefunction
+from operator import itemgetter
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    ClassVar,
     Literal,
+    NamedTuple,
     Optional,
     Protocol,
     Union,
     cast,
+    get_args,
+    get_origin,
+    get_type_hints,
     overload,
 )
-from typing_extensions import ParamSpec, TypeAlias, TypeVar
+from typing_extensions import ParamSpec, TypeAlias, TypeVar, is_typeddict
 
+import sqlalchemy as sa
+import sqlalchemy.orm as sa_orm
 from flask.typing import ResponseReturnValue
 from markupsafe import escape as html_escape
-from werkzeug.datastructures import Headers, MIMEAccept
+from werkzeug.datastructures import Headers, MIMEAccept, MultiDict
 from werkzeug.exceptions import BadRequest, HTTPException
+from werkzeug.http import parse_accept_header
 
 from ..auth import add_auth_attribute, current_auth
 from ..compat import (
@@ -37,18 +51,24 @@ from ..compat import (
     abort,
     async_make_response,
     async_render_template,
+    current_app,
     g,
+    json_dumps,
     jsonify,
     make_response,
     render_template,
     request,
+    stream_with_context,
     sync_await,
     url_for,
 )
+from ..sqlalchemy import cache_instance, get_cached_instance
 from ..utils import InspectableSet, is_collection
+from ._helpers import has_permission, is_not_modified, set_cache_validators
 
 __all__ = [
     'ReturnRenderWith',
+    'RequestArg',
     'RequestTypeError',
     'RequestValueError',
     'Redirect',
@@ -68,12 +88,17 @@ ReturnRenderWithResponse: TypeAlias = Union[SansIoResponse, ReturnRenderWithData
 ReturnRenderWithHeaders: TypeAlias = Union[
     list[tuple[str, str]], dict[str, str], Headers
 ]
+ReturnRenderWithStream: TypeAlias = Union[Iterator[Any], AsyncIterator[Any]]
+ReturnRenderWithBody: TypeAlias = Union[ReturnRenderWithData, ReturnRenderWithStream]
 ReturnRenderWith: TypeAlias = Union[
     ReturnRenderWithResponse,
-    tuple[ReturnRenderWithData, ReturnRenderWithHeaders],
-    tuple[ReturnRenderWithData, int],
-    tuple[ReturnRenderWithData, int, ReturnRenderWithHeaders],
+    ReturnRenderWithStream,
+    tuple[ReturnRenderWithBody, ReturnRenderWithHeaders],
+    tuple[ReturnRenderWithBody, int],
+    tuple[ReturnRenderWithBody, int, ReturnRenderWithHeaders],
 ]
+#: A parameter name for :func:`requestargs`, or a name and a filter or schema class
+RequestArg: TypeAlias = Union[str, tuple[str, Union[Callable[[str], Any], type[Any]]]]
 _VP = ParamSpec('_VP')  # View parameters as accepted by the decorated view
 _VR_co = TypeVar('_VR_co', covariant=True)  # View covariant return type
 
@@ -83,7 +108,29 @@ class RequestTypeError(BadRequest, TypeError):
 
 
 class RequestValueError(BadRequest, ValueError):
-    """Exception that combines ValueError with BadRequest."""
+    """
+    Exception that combines ValueError with BadRequest.
+
+    :param description: Description of the error
+    :param response: Optional response to use instead of the default
+    :param errors: Validation errors as a dictionary of field name to message
+    """
+
+    #: Validation errors as a dictionary of field name to message
+    errors: dict[str, str]
+
+    def __init__(
+        self,
+        description: Optional[str] = None,
+        response: Optional[SansIoResponse] = None,
+        errors: Optional[dict[str, str]] = None,
+    ) -> None:
+        self.errors = errors or {}
+        if description is None and self.errors:
+            description = '; '.join(
+                f'{name}: {message}' for name, message in self.errors.items()
+            )
+        super().__init__(description, response)
 
 
 class Redirect(HTTPException):
@@ -121,8 +168,226 @@ class Redirect(HTTPException):
         return f"{self.code} {self.name}: {self.location}"
 
 
+# --- Request argument parsers ---------------------------------------------------------
+
+# `X | Y` unions have a distinct origin from `Union[X, Y]` in Python 3.10+
+_UNION_TYPES = (Union, getattr(types, 'UnionType', Union))
+_TRUE_STRINGS = frozenset({'1', 'true', 'on', 'yes'})
+_FALSE_STRINGS = frozenset({'', '0', 'false', 'off', 'no'})
+
+
+def _is_schema(filt: Any) -> bool:
+    """Test if a filter is a dataclass or TypedDict that describes the payload."""
+    return isinstance(filt, type) and (is_dataclass(filt) or is_typeddict(filt))
+
+
+def _to_bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        if value.lower() in _TRUE_STRINGS:
+            return True
+        if value.lower() in _FALSE_STRINGS:
+            return False
+    raise ValueError(f"Not a boolean: {value!r}")
+
+
+def _to_str(value: Any) -> str:
+    if not isinstance(value, str):
+        raise ValueError(f"Not a string: {value!r}")
+    return value
+
+
+def _to_int(value: Any) -> int:
+    # Reject booleans and fractions instead of letting int() truncate them
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            pass
+    raise ValueError(f"Not an integer: {value!r}")
+
+
+def _to_float(value: Any) -> float:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    raise ValueError(f"Not a number: {value!r}")
+
+
+_SCALAR_CONVERTERS: dict[Any, Callable[[Any], Any]] = {
+    bool: _to_bool,
+    int: _to_int,
+    float: _to_float,
+    str: _to_str,
+}
+
+
+def _list_converter(convert: Callable[[Any], Any]) -> Callable[[Any], list[Any]]:
+    def convert_list(value: Any) -> list[Any]:
+        if not isinstance(value, (list, tuple)):
+            raise ValueError(f"Not a list: {value!r}")
+        result = []
+        errors: dict[str, str] = {}
+        for index, item in enumerate(value):
+            try:
+                result.append(convert(item))
+            except RequestValueError as exc:  # noqa: PERF203
+                errors.update({f'{index}.{k}': v for k, v in exc.errors.items()})
+            except (TypeError, ValueError) as exc:
+                errors[str(index)] = str(exc)
+        if errors:
+            raise RequestValueError(errors=errors)
+        return result
+
+    return convert_list
+
+
+def _unwrap_optional(hint: Any) -> tuple[Any, bool]:
+    """Return the type within ``Optional[...]``, and whether it was optional."""
+    if get_origin(hint) in _UNION_TYPES:
+        hint_args = [a for a in get_args(hint) if a is not type(None)]
+        if len(hint_args) == 1:
+            return hint_args[0], len(hint_args) < len(get_args(hint))
+    return hint, False
+
+
+def _type_converter(hint: Any) -> Callable[[Any], Any]:
+    """Return a converter for values of the given type hint."""
+    inner, optional = _unwrap_optional(hint)
+    if optional:
+        convert_inner = _type_converter(inner)
+        return lambda value: None if value is None else convert_inner(value)
+    if get_origin(hint) is list:
+        item_hint = get_args(hint)[0] if get_args(hint) else Any
+        return _list_converter(_type_converter(item_hint))
+    if _is_schema(hint):
+        return _RequestSchema.get(hint).convert
+    if hint in _SCALAR_CONVERTERS:
+        return _SCALAR_CONVERTERS[hint]
+    if isinstance(hint, type) and hint is not object:
+        return lambda value: value if isinstance(value, hint) else hint(value)
+    # Any, unions and other type hints are not converted
+    return lambda value: value
+
+
+class _RequestSchemaField(NamedTuple):
+    """Field in a request schema."""
+
+    name: str
+    convert: Callable[[Any], Any]
+    is_list: bool
+    required: bool
+
+
+class _RequestSchema:
+    """Converter for a payload described by a dataclass or TypedDict."""
+
+    _cache: ClassVar[dict[type, _RequestSchema]] = {}
+
+    def __init__(self, cls: type) -> None:
+        self.cls = cls
+        hints = get_type_hints(cls)
+        if is_dataclass(cls):
+            required = {
+                f.name
+                for f in dataclass_fields(cls)
+                if f.init and f.default is MISSING and f.default_factory is MISSING
+            }
+            names = [f.name for f in dataclass_fields(cls) if f.init]
+        else:
+            required = set(cls.__required_keys__)  # type: ignore[attr-defined]
+            names = list(hints)
+        self.fields = tuple(
+            _RequestSchemaField(
+                name,
+                _type_converter(hints.get(name, Any)),
+                get_origin(_unwrap_optional(hints.get(name, Any))[0]) is list,
+                name in required,
+            )
+            for name in names
+        )
+
+    @classmethod
+    def get(cls, schema: type) -> _RequestSchema:
+        """Return a compiled converter for a dataclass or TypedDict."""
+        compiled = cls._cache.get(schema)
+        if compiled is None:
+            compiled = cls._cache[schema] = cls(schema)
+        return compiled
+
+    def convert(self, values: Any, has_gettype: bool = False) -> Any:
+        """
+        Convert a payload into an instance of the schema.
+
+        All fields are converted before reporting errors, so that a single
+        :exc:`RequestValueError` lists every invalid field.
+
+        :param values: Mapping or multi-dict with the payload
+        :param has_gettype: Whether values is a multi-dict with a ``getlist`` method
+        """
+        if not isinstance(values, Mapping):
+            raise ValueError(f"Not an object: {values!r}")
+        data: dict[str, Any] = {}
+        errors: dict[str, str] = {}
+        for field in self.fields:
+            if field.name not in values:
+                if field.required:
+                    errors[field.name] = "Missing value"
+                continue
+            value = (
+                cast(MultiDict, values).getlist(field.name)
+                if has_gettype and field.is_list
+                else values[field.name]
+            )
+            try:
+                data[field.name] = field.convert(value)
+            except RequestValueError as exc:
+                errors.update({f'{field.name}.{k}': v for k, v in exc.errors.items()})
+            except (TypeError, ValueError) as exc:
+                errors[field.name] = str(exc)
+        if errors:
+            raise RequestValueError(errors=errors)
+        return self.cls(**data)
+
+
+def _requestargs_list_parser(
+    name: str, filt: Optional[Callable[[str], Any]], has_gettype: bool
+) -> Callable[[Any], Any]:
+    """Return a function that extracts a list parameter from the request's data."""
+    if has_gettype:
+        return lambda values: values.getlist(name, type=filt)
+    if filt is not None:
+        return lambda values: [filt(_v) for _v in values[name]]
+    return itemgetter(name)
+
+
+def _requestargs_parser(
+    name: str, filt: Optional[Callable[[str], Any]], is_list: bool, has_gettype: bool
+) -> Callable[[Any], Any]:
+    """Return a function that extracts a parameter from the request's data."""
+    if _is_schema(filt):
+        schema = _RequestSchema.get(cast(type, filt))
+        return lambda values: schema.convert(values, has_gettype)
+    if is_list:
+        return _requestargs_list_parser(name, filt, has_gettype)
+    if has_gettype:
+        return lambda values: values.get(name, type=filt)
+    if filt is not None:
+        return lambda values: filt(values[name])
+    return itemgetter(name)
+
+
 def requestargs(
-    *args: Union[str, tuple[str, Callable[[str], Any]]],
+    *args: RequestArg,
     source: Literal['args', 'values', 'form', 'body'] = 'args',
 ) -> Callable[[Callable[_VP, _VR_co]], Callable[_VP, _VR_co]]:
     """
@@ -146,6 +411,26 @@ def requestargs(
     If the filter raises a ValueError, this is recast as a :exc:`RequestValueError`,
     which also returns HTTP 400 Bad Request.
 
+    If the filter is a dataclass or :class:`~typing.TypedDict`, the entire payload is
+    converted into it as per the type hints of its fields, and is passed to the
+    function as the named parameter. Fields may be of types ``str``, ``int``,
+    ``float``, ``bool``, other dataclasses or TypedDicts, or lists or optional
+    versions of these. All fields are validated before an error is raised, and
+    :attr:`RequestValueError.errors` lists every invalid or missing field::
+
+        @dataclass
+        class NewDocument:
+            title: str
+            tags: list[str] = field(default_factory=list)
+            draft: bool = False
+
+
+        @app.route('/new', methods=['POST'])
+        @requestbody(('document', NewDocument))
+        def new_document(document: NewDocument): ...
+
+    Parsers for each parameter are prepared when the function is decorated.
+
     Tests::
 
         >>> from flask import Flask
@@ -185,6 +470,19 @@ def requestargs(
             ]
         ]
 
+        # Prepare parsers for multi-dict (form and query) and plain dict (JSON) data
+        parsers = {
+            has_gettype: [
+                (
+                    name,
+                    _requestargs_parser(name, filt, is_list, has_gettype),
+                    _is_schema(filt),
+                )
+                for name, filt, is_list in namefilt
+            ]
+            for has_gettype in (True, False)
+        }
+
         if source == 'args':
 
             def datasource() -> tuple[Any, bool]:
@@ -215,27 +513,23 @@ def requestargs(
         def process_kwargs(
             values: Any, has_gettype: bool, kwargs: dict[str, Any]
         ) -> dict[str, Any]:
-            for name, filt, is_list in namefilt:
+            errors: dict[str, str] = {}
+            for name, parser, is_schema in parsers[has_gettype]:
                 # Process name if
                 # (a) it's not in the function's parameters, and
-                # (b) is in the form/query
-                if name not in kwargs and name in values:
-                    try:
-                        if is_list:
-                            if has_gettype:
-                                kwargs[name] = values.getlist(name, type=filt)
-                            elif filt:
-                                kwargs[name] = [filt(_v) for _v in values[name]]
-                            else:
-                                kwargs[name] = values[name]
-                        elif has_gettype:
-                            kwargs[name] = values.get(name, type=filt)
-                        elif filt:
-                            kwargs[name] = filt(values[name])
-                        else:
-                            kwargs[name] = values[name]
-                    except ValueError as exc:
-                        raise RequestValueError(str(exc)) from exc
+                # (b) is in the form/query, or is a schema for the entire payload
+                if name in kwargs or not (
+                    (is_schema and request) or (not is_schema and name in values)
+                ):
+                    continue
+                try:
+                    kwargs[name] = parser(values)
+                except RequestValueError as exc:
+                    errors.update(exc.errors)
+                except ValueError as exc:
+                    errors[name] = str(exc)
+            if errors:
+                raise RequestValueError(errors=errors)
             return kwargs
 
         if iscoroutinefunction(f):
@@ -274,26 +568,209 @@ def requestargs(
 
 
 def requestvalues(
-    *args: Union[str, tuple[str, Callable[[str], Any]]],
+    *args: RequestArg,
 ) -> Callable[[Callable[_VP, _VR_co]], Callable[_VP, _VR_co]]:
     """Like :func:`requestargs`, but loads from request.values (args+form)."""
     return requestargs(*args, source='values')
 
 
 def requestform(
-    *args: Union[str, tuple[str, Callable[[str], Any]]],
+    *args: RequestArg,
 ) -> Callable[[Callable[_VP, _VR_co]], Callable[_VP, _VR_co]]:
     """Like :func:`requestargs`, but loads from request.form (the form submission)."""
     return requestargs(*args, source='form')
 
 
 def requestbody(
-    *args: Union[str, tuple[str, Callable[[str], Any]]],
+    *args: RequestArg,
 ) -> Callable[[Callable[_VP, _VR_co]], Callable[_VP, _VR_co]]:
     """Like :func:`requestargs`, but loads from form or JSON basis content type."""
     return requestargs(*args, source='body')
 
 
+class _LoadModelsPlan(NamedTuple):
+    """A single joined select for the leading steps of a :func:`load_models` chain."""
+
+    #: Number of steps in the chain that are loaded by this select
+    length: int
+    #: Select statement with joins, to which filters are added in each request
+    statement: sa.Select
+    #: Filters as (attribute, name of request parameter with the value)
+    filters: tuple[tuple[Any, str], ...]
+    #: Model used to find the database session
+    model: type[Any]
+
+
+def _column_attr(entity: Any, model: type[Any], column: sa.ColumnElement) -> Any:
+    """Return the attribute on an (aliased) entity that maps to a table column."""
+    return getattr(entity, sa.inspect(model).get_property_by_column(column).key)
+
+
+def _scalar_relationship(
+    model: type[Any], name: str
+) -> Optional[sa_orm.RelationshipProperty]:
+    """Return a relationship that refers to a single instance without a secondary."""
+    prop = sa.inspect(model).relationships.get(name)
+    if prop is None or prop.uselist or prop.secondary is not None:
+        return None
+    return prop
+
+
+def _load_models_attr_join(
+    model: type[Any],
+    entity: Any,
+    name: str,
+    ref: tuple[type[Any], Any],
+    ref_attr: str,
+) -> Optional[sa.ColumnElement[bool]]:
+    """Return a join condition comparing an attribute with an earlier attribute."""
+    ref_model, ref_entity = ref
+    prop = _scalar_relationship(model, name)
+    if prop is None:
+        if (
+            name not in sa.inspect(model).column_attrs
+            or ref_attr not in sa.inspect(ref_model).column_attrs
+        ):
+            return None
+        return getattr(entity, name) == getattr(ref_entity, ref_attr)
+    # Relationships to the same model, compared on the foreign key columns
+    ref_prop = _scalar_relationship(ref_model, ref_attr)
+    if (
+        ref_prop is None
+        or prop.direction is not sa_orm.MANYTOONE
+        or ref_prop.direction is not sa_orm.MANYTOONE
+        or prop.local_remote_pairs is None
+        or ref_prop.local_remote_pairs is None
+    ):
+        return None
+    local_cols = {remote: local for local, remote in prop.local_remote_pairs}
+    ref_cols = {remote: local for local, remote in ref_prop.local_remote_pairs}
+    if set(local_cols) != set(ref_cols):
+        return None
+    return sa.and_(
+        *(
+            _column_attr(entity, model, local_cols[remote])
+            == _column_attr(ref_entity, ref_model, ref_cols[remote])
+            for remote in local_cols
+        )
+    )
+
+
+def _load_models_join(
+    model: type[Any],
+    entity: Any,
+    name: str,
+    ref: str,
+    loaded: dict[str, tuple[type[Any], Any]],
+) -> Optional[sa.ColumnElement[bool]]:
+    """
+    Return a SQL join condition for a :func:`load_models` attribute, if possible.
+
+    The attribute's value ``ref`` may name an instance loaded in an earlier step of the
+    chain (``{'parent': 'folder'}``) or an attribute of it (``{'parent':
+    'folder.parent'}``). Returns `None` if the condition can't be expressed in SQL.
+    """
+    if '.' in ref:
+        ref, ref_attr = ref.split('.', 1)
+        if ref not in loaded or '.' in ref_attr:
+            return None
+        return _load_models_attr_join(model, entity, name, loaded[ref], ref_attr)
+    ref_model, ref_entity = loaded[ref]
+    prop = _scalar_relationship(model, name)
+    if (
+        prop is None
+        or prop.local_remote_pairs is None
+        or not sa.inspect(ref_model).isa(prop.mapper)
+    ):
+        return None
+    return sa.and_(
+        *(
+            _column_attr(entity, model, local)
+            == _column_attr(ref_entity, ref_model, remote)
+            for local, remote in prop.local_remote_pairs
+        )
+    )
+
+
+def _compile_load_models_chain(
+    chain: tuple[
+        tuple[
+            Union[type[Any], list[type[Any]], tuple[type[Any], ...]],
+            dict[str, Union[str, Callable[[dict, dict], Any]]],
+            str,
+        ],
+        ...,
+    ],
+) -> Optional[_LoadModelsPlan]:
+    """
+    Compile the leading steps of a :func:`load_models` chain into a joined select.
+
+    Steps are compiled until one is found that uses a callable attribute value, has
+    multiple alternative models, or refers to an earlier instance in a way that can't
+    be expressed as a join condition. Remaining steps are loaded one query at a time.
+    """
+    statement: Optional[sa.Select] = None
+    filters: list[tuple[Any, str]] = []
+    loaded: dict[str, tuple[type[Any], Any]] = {}
+    length = 0
+    for models, attributes, parameter in chain:
+        if isinstance(models, (list, tuple)):
+            if len(models) != 1:
+                break
+            model = models[0]
+        else:
+            model = models
+        entity = sa_orm.aliased(model)
+        conditions: list[sa.ColumnElement[bool]] = []
+        step_filters: list[tuple[Any, str]] = []
+        for name, ref in attributes.items():
+            if callable(ref):
+                break
+            if '.' in ref or ref in loaded:
+                condition = _load_models_join(model, entity, name, ref, loaded)
+                if condition is None:
+                    break
+                conditions.append(condition)
+            else:
+                attr = getattr(entity, name, None)
+                if attr is None:
+                    break
+                step_filters.append((attr, ref))
+        else:
+            if statement is None:
+                statement = sa.select(entity)
+            else:
+                statement = statement.add_columns(entity).join(
+                    entity, sa.and_(*conditions) if conditions else sa.true()
+                )
+            filters.extend(step_filters)
+            loaded[parameter[2:] if parameter.startswith('g.') else parameter] = (
+                model,
+                entity,
+            )
+            length += 1
+            continue
+        break
+    if statement is None:
+        return None
+    first_models = chain[0][0]
+    root_model = (
+        first_models[0] if isinstance(first_models, (list, tuple)) else first_models
+    )
+    return _LoadModelsPlan(length, statement, tuple(filters), root_model)
+
+
+def _load_models_value(ref: str, result: dict[str, Any], kwargs: dict[str, Any]) -> Any:
+    """Return the value referred to in a :func:`load_models` attribute."""
+    if '.' in ref:
+        first, attrs = ref.split('.', 1)
+        val = result.get(first)
+        for attr in attrs.split('.'):
+            val = getattr(val, attr)
+        return val
+    return result.get(ref, kwargs.get(ref))
+
+
 def load_model(
     model: Union[type[Any], list[type[Any]], tuple[type[Any], ...]],
     attributes: dict[str, Union[str, Callable[[dict, dict], Any]]],
@@ -408,9 +885,35 @@ def load_models(
         )
         def show_page(folder: Folder, page: Page) -> ResponseReturnValue:
             return render_template('page.html', folder=folder, page=page)
+
+    Each step in the chain is loaded with a separate query. Pass ``joined=True`` to
+    load the chain with a single joined ``SELECT`` instead. Steps that refer to an
+    earlier instance (``{'parent': 'folder'}``) or a column or many-to-one
+    relationship of it (``{'parent': 'folder.parent'}``) become join conditions. The
+    chain is compiled when first used, and if a step has a callable attribute value or
+    multiple alternative models, it and the steps after it are loaded with a query per
+    step.
     """
+    plan: Optional[_LoadModelsPlan] = None
+    plan_compiled = False
 
     def decorator(f: Callable[..., _VR_co]) -> Callable[..., _VR_co]:
+        def joined_loader(kwargs: dict[str, Any]) -> list[Any]:
+            """Load the leading instances in the chain with a single query."""
+            nonlocal plan, plan_compiled
+            if not plan_compiled:
+                plan = _compile_load_models_chain(chain)
+                plan_compiled = True
+            if plan is None:
+                return []
+            statement = plan.statement
+            for attr, ref in plan.filters:
+                statement = statement.where(attr == kwargs.get(ref))
+            row = plan.model.query.session.execute(statement).first()
+            if row is None:
+                abort(404)
+            return list(row)
+
         def loader(kwargs: dict[str, Any]) -> dict[str, Any]:
             view_args: Optional[dict[str, Any]]
             request_endpoint: str = request.endpoint  # type: ignore[assignment]
@@ -424,34 +927,41 @@ def load_models(
             )
             url_check_attributes = config.get('urlcheck', [])
             result: dict[str, Any] = {}
-            for models, attributes, parameter in chain:
+            preloaded = joined_loader(kwargs) if config.get('joined') else []
+            for index, (models, attributes, parameter) in enumerate(chain):
                 if not isinstance(models, (list, tuple)):
                     models = (models,)  # noqa: PLW2901
                 item = None
                 url_check = False
                 url_check_paramvalues: dict[str, tuple[Union[str, Callable], Any]] = {}
-                for model in models:
-                    query = model.query
+                if index < len(preloaded):
+                    item = preloaded[index]
                     for k, v in attributes.items():
-                        if callable(v):
-                            val = v(result, kwargs)
-                            query = query.filter_by(**{k: val})
-                        else:
-                            if '.' in v:
-                                first, attrs = v.split('.', 1)
-                                val = result.get(first)
-                                for attr in attrs.split('.'):
-                                    val = getattr(val, attr)
-                            else:
-                                val = result.get(v, kwargs.get(v))
-                            query = query.filter_by(**{k: val})
                         if k in url_check_attributes:
+                            # Joined steps do not have callable values
+                            val = _load_models_value(cast(str, v), result, kwargs)
                             url_check = True
                             url_check_paramvalues[k] = (v, val)
-                    item = query.first()
-                    if item is not None:
-                        # We found it, so don't look in additional models
-                        break
+                else:
+                    for model in models:
+                        filters: dict[str, Any] = {}
+                        for k, v in attributes.items():
+                            if callable(v):
+                                val = v(result, kwargs)
+                            else:
+                                val = _load_models_value(v, result, kwargs)
+                            filters[k] = val
+                            if k in url_check_attributes:
+                                url_check = True
+                                url_check_paramvalues[k] = (v, val)
+                        item = get_cached_instance(model, filters)
+                        if item is None:
+                            item = model.query.filter_by(**filters).first()
+                            if item is not None:
+                                cache_instance(model, filters, item)
+                        if item is not None:
+                            # We found it, so don't look in additional models
+                            break
                 if item is None:
                     abort(404)
 
@@ -544,6 +1054,102 @@ def _best_mimetype_match(
     return default
 
 
+#: Number of distinct ``Accept`` headers to remember in each use of render_with
+_MIMETYPE_CACHE_SIZE = 128
+
+
+class _Renderer(NamedTuple):
+    """Renderer for a mimetype in render_with, resolved when decorating the view."""
+
+    #: Mimetype that was matched from the request's ``Accept`` header
+    mimetype: str
+    #: Callable that renders the view's result, if not a template
+    render: Optional[Callable[[ReturnRenderWithData], Any]]
+    #: Name of the template that renders the view's result, if not a callable
+    template: Optional[str]
+    #: Mimetype of the rendered template, if it must be set on the response
+    response_mimetype: Optional[str]
+
+
+#: Minimum size of each chunk in a streamed JSON response
+_JSON_STREAM_CHUNK_SIZE = 16384
+
+
+class _JsonStreamEncoder:
+    """Encode items as a JSON array or as newline-delimited JSON, in chunks."""
+
+    def __init__(self, ndjson: bool) -> None:
+        self.ndjson = ndjson
+        self.buffer: list[str] = [] if ndjson else ['[']
+        self.size = 0
+        self.first = True
+
+    def encode(self, item: Any) -> Optional[str]:
+        """Add an item to the buffer, returning a chunk if the buffer is full."""
+        data = json_dumps(item)
+        if self.ndjson:
+            data += '\n'
+        elif not self.first:
+            data = ',' + data
+        self.first = False
+        self.buffer.append(data)
+        self.size += len(data)
+        if self.size >= _JSON_STREAM_CHUNK_SIZE:
+            chunk = ''.join(self.buffer)
+            self.buffer.clear()
+            self.size = 0
+            return chunk
+        return None
+
+    def close(self) -> str:
+        """Return the final chunk."""
+        if not self.ndjson:
+            self.buffer.append(']')
+        return ''.join(self.buffer)
+
+
+def _json_stream(items: Iterator[Any], ndjson: bool) -> Iterator[str]:
+    encoder = _JsonStreamEncoder(ndjson)
+    for item in items:
+        if (chunk := encoder.encode(item)) is not None:
+            yield chunk
+    if chunk := encoder.close():
+        yield chunk
+
+
+async def _async_json_stream(
+    items: AsyncIterator[Any], ndjson: bool
+) -> AsyncIterator[str]:
+    encoder = _JsonStreamEncoder(ndjson)
+    async for item in items:
+        if (chunk := encoder.encode(item)) is not None:
+            yield chunk
+    if chunk := encoder.close():
+        yield chunk
+
+
+def _ndjson(data: Any) -> SansIoResponse:
+    """Render data as a single line of newline-delimited JSON."""
+    return current_app.response_class(
+        json_dumps(data) + '\n', mimetype='application/x-ndjson'
+    )
+
+
+def _json_stream_response(
+    items: Union[Iterator[Any], AsyncIterator[Any]], mimetype: str
+) -> SansIoResponse:
+    """Return a streaming response for an iterator from a view using render_with."""
+    ndjson = mimetype == 'application/x-ndjson'
+    body: Any = (
+        stream_with_context(_async_json_stream)(items, ndjson)
+        if isinstance(items, AsyncIterator)
+        else stream_with_context(_json_stream)(items, ndjson)
+    )
+    return current_app.response_class(
+        body, mimetype='application/x-ndjson' if ndjson else 'application/json'
+    )
+
+
 class RenderWithProtocol(Protocol):
     @overload
     def __call__(
@@ -561,6 +1167,11 @@ def render_with(
         Mapping[str, Union[str, Callable[[ReturnRenderWithData], Any]]], str, None
     ] = None,
     json: bool = False,
+    etag: Optional[Callable[[ReturnRenderWithData], Optional[str]]] = None,
+    last_modified: Optional[
+        Callable[[ReturnRenderWithData], Optional[datetime]]
+    ] = None,
+    ndjson: bool = False,
 ) -> RenderWithProtocol:
     """
     Render the view's dict output with a MIMEtype-specific renderer.
@@ -619,8 +1230,43 @@ def render_with(
     not be rendered. Rendering may also be skipped within a request context by passing
     a keyword argument ``_render=False``.
 
+    For GET and HEAD requests, render_with can skip rendering when the client already
+    has the current version of the response. Provide ``etag`` or ``last_modified``
+    callables that receive the view's return value, and render_with will respond with
+    ``304 Not Modified`` if the request's ``If-None-Match`` or ``If-Modified-Since``
+    headers match, and will otherwise add ``ETag`` and ``Last-Modified`` headers to the
+    rendered response::
+
+        @app.route('/<document>')
+        @render_with('document.html', last_modified=lambda r: r['document'].updated_at)
+        @load_models((Document, {'name': 'document'}, 'document'))
+        def document_view(document):
+            return {'document': document}
+
+    ETags are sent as weak ETags (as they describe the data and not the exact bytes of
+    the response), and are made distinct for each renderer. Validators are only used
+    when the view does not return a status code other than 200.
+
+    With ``json=True``, a view may return an iterator or async iterator (such as a
+    generator) in place of the dictionary. Its items are streamed as a JSON array
+    without holding the entire response in memory. With ``ndjson=True``, they are
+    streamed as newline-delimited JSON if the client prefers ``application/x-ndjson``.
+    Iterators are only streamed when a JSON mimetype is negotiated, and the response is
+    ``406 Not Acceptable`` if the client asked for another mimetype. ETags are not used
+    for streamed responses, and async iterators can only be streamed under Quart::
+
+        @app.route('/documents')
+        @render_with(json=True, ndjson=True)
+        def documents():
+            return ({'name': doc.name} for doc in Document.query.yield_per(100))
+
     :param template: Single template, or dictionary of MIME type to templates/callables
     :param json: Respond to ``application/json`` with a JSON response (default False)
+    :param etag: Callable that returns an ETag for the view's return value
+    :param last_modified: Callable that returns a last modified timestamp for the
+        view's return value
+    :param ndjson: Respond to ``application/x-ndjson`` with newline-delimited JSON
+        (default False)
 
     .. deprecated:: 0.7.0
         render_with no longer has a shorthand for JSONP. If still required, specify a
@@ -629,11 +1275,13 @@ def render_with(
     templates: dict[str, Union[str, Callable[[ReturnRenderWithData], Any]]]
     default_mimetype: Optional[str] = None
     templates = {'application/json': jsonify} if json else {}
+    if ndjson:
+        templates['application/x-ndjson'] = _ndjson
     if isinstance(template, str):
         templates['*/*'] = template
     elif isinstance(template, dict):
         templates.update(template)
-    elif template is None and json:
+    elif template is None and (json or ndjson):
         pass
     else:  # pragma: no cover
         raise ValueError("Expected string or dict for template")
@@ -652,8 +1300,39 @@ def render_with(
     # */* messes up matching, so supply it only as last resort
     template_mimetypes.remove('*/*')
 
+    # Resolve callables and templates now so the request only needs a lookup
+    renderers = {
+        mimetype: (
+            _Renderer(mimetype, use_template, None, None)
+            if callable(use_template)
+            else _Renderer(
+                mimetype,
+                None,
+                use_template,
+                default_mimetype if mimetype == '*/*' else mimetype,
+            )
+        )
+        for mimetype, use_template in templates.items()
+    }
+
+    @lru_cache(maxsize=_MIMETYPE_CACHE_SIZE)
+    def negotiate(accept_header: str) -> _Renderer:
+        """Find the renderer for the raw value of an ``Accept`` header."""
+        # We do not use request.accept_mimetypes.best_match because it turns out
+        # to be buggy: it returns the least match instead of the best match.
+        # This does not appear to be fixed as of Werkzeug 3.0.3
+        return renderers[
+            _best_mimetype_match(
+                template_mimetypes,
+                parse_accept_header(accept_header, MIMEAccept),
+                '*/*',
+            )
+        ]
+
     # Set Vary: Accept if there is more than one way to render the result
     vary_accept = len(templates) > 1
+    # Make ETags distinct per mimetype if there are different renderers
+    etag_per_mimetype = len(set(templates.values())) > 1
 
     @overload
     def decorator(
@@ -674,7 +1353,10 @@ def render_with(
         def unpack_return_value(
             result: ReturnRenderWith,
         ) -> tuple[
-            ReturnRenderWithData, Optional[int], Optional[ReturnRenderWithHeaders], str
+            ReturnRenderWithBody,
+            Optional[int],
+            Optional[ReturnRenderWithHeaders],
+            _Renderer,
         ]:
             """Extract status code and headers from the view's return value."""
             if TYPE_CHECKING:
@@ -714,19 +1396,51 @@ def render_with(
                 status_code = None
                 headers = None
 
-            # Find a matching mimetype between Accept headers and available templates
-            # We do not use request.accept_mimetypes.best_match because it turns out
-            # to be buggy: it returns the least match instead of the best match.
-            # This does not appear to be fixed as of Werkzeug 3.0.3
-            accept_mimetype = _best_mimetype_match(
-                template_mimetypes, request.accept_mimetypes, '*/*'
+            # Find a matching renderer between Accept headers and available templates
+            renderer = negotiate(request.headers.get('Accept', ''))
+            return result, status_code, headers, renderer
+
+        def cache_validators(
+            result: ReturnRenderWithBody,
+            status_code: Optional[int],
+            accept_mimetype: str,
+        ) -> Optional[tuple[Optional[str], Optional[datetime]]]:
+            """Return ETag and last modified timestamp for a conditional response."""
+            if (
+                (etag is None and last_modified is None)
+                or isinstance(result, (Iterator, AsyncIterator))
+                or status_code not in (None, 200)
+                or request.method not in ('GET', 'HEAD')
+            ):
+                return None
+            result_etag = etag(result) if etag is not None else None
+            if result_etag is not None and etag_per_mimetype:
+                result_etag = f'{result_etag}:{accept_mimetype}'
+            return (
+                result_etag,
+                last_modified(result) if last_modified is not None else None,
             )
-            # Previously:
-            # accept_mimetype = request.accept_mimetypes.best_match(
-            #     template_mimetypes, '*/*'
-            # )
 
-            return result, status_code, headers, accept_mimetype
+        def stream_response(
+            result: Union[Iterator[Any], AsyncIterator[Any]],
+            status_code: Optional[int],
+            renderer: _Renderer,
+        ) -> SansIoResponse:
+            """Stream an iterator from the view as JSON."""
+            if not json and not ndjson:
+                raise TypeError(
+                    "Views returning an iterator require render_with(json=True)"
+                )
+            mimetype = (
+                default_mimetype if renderer.mimetype == '*/*' else renderer.mimetype
+            )
+            if mimetype not in ('application/json', 'application/x-ndjson'):
+                # The client asked for a mimetype that can't be streamed
+                abort(406)
+            response = _json_stream_response(result, mimetype)
+            if status_code is not None:
+                response.status_code = status_code
+            return response
 
         if iscoroutinefunction(f):
             # Mypy 1.9 gets confused unless we cast to a different name
@@ -748,28 +1462,35 @@ def render_with(
                 if isinstance(result, SansIoResponse):
                     return result
 
-                result, status_code, headers, accept_mimetype = unpack_return_value(
-                    result
-                )
+                result, status_code, headers, renderer = unpack_return_value(result)
 
-                # Now render the result with the template for the mimetype
-                use_template = templates[accept_mimetype]
-                if callable(use_template):
-                    callable_result = use_template(result)
-                    if isawaitable(callable_result):
-                        callable_result = await callable_result
-                    response = await async_make_response(callable_result)
+                validators = cache_validators(result, status_code, renderer.mimetype)
+                response: SansIoResponse
+                if validators is not None and is_not_modified(*validators):
+                    # The client has the current version. Don't render again
+                    response = await async_make_response('', 304)
+                elif isinstance(result, (Iterator, AsyncIterator)):
+                    response = stream_response(result, status_code, renderer)
                 else:
-                    response = await async_make_response(
-                        await async_render_template(use_template, **result)
-                    )
-                    if accept_mimetype == '*/*':
-                        if default_mimetype is not None:
-                            response.mimetype = default_mimetype
+                    # Now render the result with the template for the mimetype
+                    if renderer.render is not None:
+                        callable_result = renderer.render(result)
+                        if isawaitable(callable_result):
+                            callable_result = await callable_result
+                        response = await async_make_response(callable_result)
                     else:
-                        response.mimetype = accept_mimetype
-                if status_code is not None:
-                    response.status_code = status_code
+                        if TYPE_CHECKING:
+                            # A renderer has a template if it does not have a callable
+                            assert renderer.template is not None  # nosec B101
+                        response = await async_make_response(
+                            await async_render_template(renderer.template, **result)
+                        )
+                        if renderer.response_mimetype is not None:
+                            response.mimetype = renderer.response_mimetype
+                    if status_code is not None:
+                        response.status_code = status_code
+                if validators is not None:
+                    set_cache_validators(response, *validators)
                 if headers is not None:
                     response.headers.extend(headers)
                 if vary_accept:
@@ -794,34 +1515,77 @@ def render_with(
                 if isinstance(result, SansIoResponse):
                     return result
 
-                result, status_code, headers, accept_mimetype = unpack_return_value(
-                    result
-                )
+                result, status_code, headers, renderer = unpack_return_value(result)
 
-                # Now render the result with the template for the mimetype
-                use_template = templates[accept_mimetype]
-                if callable(use_template):
-                    response = make_response(use_template(result))
+                validators = cache_validators(result, status_code, renderer.mimetype)
+                response: SansIoResponse
+                if validators is not None and is_not_modified(*validators):
+                    # The client has the current version. Don't render again
+                    response = make_response('', 304)
+                elif isinstance(result, (Iterator, AsyncIterator)):
+                    response = stream_response(result, status_code, renderer)
                 else:
-                    response = make_response(render_template(use_template, **result))
-                    if accept_mimetype == '*/*':
-                        if default_mimetype is not None:
-                            response.mimetype = default_mimetype
+                    # Now render the result with the template for the mimetype
+                    if renderer.render is not None:
+                        response = make_response(renderer.render(result))
                     else:
-                        response.mimetype = accept_mimetype
-                if status_code is not None:
-                    response.status_code = status_code
+                        if TYPE_CHECKING:
+                            # A renderer has a template if it does not have a callable
+                            assert renderer.template is not None  # nosec B101
+                        response = make_response(
+                            render_template(renderer.template, **result)
+                        )
+                        if renderer.response_mimetype is not None:
+                            response.mimetype = renderer.response_mimetype
+                    if status_code is not None:
+                        response.status_code = status_code
+                if validators is not None:
+                    set_cache_validators(response, *validators)
                 if headers is not None:
                     response.headers.extend(headers)
                 if vary_accept:
                     response.vary.add('Accept')
                 return response
 
+        # Allow outer decorators like `cached_view` to find the rendered mimetype
+        wrapper.render_with_negotiate = negotiate  # type: ignore[attr-defined]
         return wrapper
 
     return decorator
 
 
+#: Regular expression for the labels matched by a wildcard in a CORS origin
+_CORS_WILDCARD_LABELS = r'[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)*'
+
+
+def _cors_origin_checker(
+    origins: Union[Literal['*'], Container[str], Callable[[str], bool]],
+    cache_size: int,
+) -> Callable[[str], bool]:
+    """Compile the ``origins`` parameter of :func:`cors` into a checker function."""
+    if origins == '*':
+        return lambda _origin: True
+    if is_collection(origins):
+        exact = frozenset(o for o in origins if '*' not in o)  # type: ignore[union-attr]
+        patterns = [
+            re.compile(re.escape(o).replace(r'\*', _CORS_WILDCARD_LABELS))
+            for o in origins  # type: ignore[union-attr]
+            if '*' in o
+        ]
+        if not patterns:
+            return exact.__contains__
+
+        def check_origin(origin: str) -> bool:
+            return origin in exact or any(p.fullmatch(origin) for p in patterns)
+
+        return check_origin
+    if callable(origins):
+        if cache_size:
+            return lru_cache(maxsize=cache_size)(origins)
+        return origins
+    return lambda _origin: False
+
+
 class CorsDecoratorProtocol(Protocol):
     @overload
     def __call__(
@@ -853,6 +1617,7 @@ def cors(
         'X-Requested-With',
     ),
     max_age: Optional[int] = None,
+    cache_size: int = 1024,
 ) -> CorsDecoratorProtocol:
     """
     Add CORS headers to the decorated view function.
@@ -861,6 +1626,8 @@ def cors(
     :param methods: A list of allowed HTTP methods
     :param headers: A list of allowed HTTP headers
     :param max_age: Duration in seconds for which the CORS response may be cached
+    :param cache_size: Number of origins to cache results for, if ``origins`` is a
+        callable
 
     The :obj:`origins` parameter may be one of:
 
@@ -902,7 +1669,26 @@ def cors(
         @cors(check_origin)
         def callable_function():
             return Response()
+
+    Lists of origins may include wildcard subdomains, such as
+    ``https://*.hasgeek.com``. The result of a callable is cached for each origin,
+    up to ``cache_size`` origins. Pass ``cache_size=0`` if the callable's result may
+    change over time.
+
+    Pre-flight ``OPTIONS`` requests are answered without calling the view. In a
+    :class:`~coaster.views.classview.ClassView`, this happens before
+    :meth:`~coaster.views.classview.ClassView.before_request` and before the
+    :class:`~coaster.views.classview.ModelView` loads its instance.
     """
+    methods = tuple(methods)
+    allowed_methods = frozenset(methods)
+    cors_headers = [
+        ('Access-Control-Allow-Methods', ', '.join(methods)),
+        ('Access-Control-Allow-Headers', ', '.join(headers)),
+    ]
+    if max_age:
+        cors_headers.append(('Access-Control-Max-Age', str(max_age)))
+    origin_allowed = _cors_origin_checker(origins, cache_size)
 
     @overload
     def decorator(
@@ -927,60 +1713,61 @@ def cors(
                     abort(400)
                 return None
 
-            if request.method not in methods:
+            if request.method not in allowed_methods:
                 abort(405)
 
-            if not (
-                origins == '*'
-                or (
-                    is_collection(origins) and origin in origins  # type: ignore[operator]
-                )
-                or (callable(origins) and origins(origin))
-            ):
+            if not origin_allowed(origin):
                 abort(403)
             return origin
 
         def set_headers(origin: str, resp: SansIoResponse) -> SansIoResponse:
             resp.headers['Access-Control-Allow-Origin'] = origin
-            resp.headers['Access-Control-Allow-Methods'] = ', '.join(methods)
-            resp.headers['Access-Control-Allow-Headers'] = ', '.join(headers)
-            if max_age:
-                resp.headers['Access-Control-Max-Age'] = str(max_age)
+            resp.headers.extend(cors_headers)
             # Add 'Origin' to the Vary header since response will vary by origin
             resp.vary.add('Origin')
 
             return resp
 
+        def preflight() -> Optional[SansIoResponse]:
+            """Respond to a pre-flight request without calling the view."""
+            if request.method != 'OPTIONS':
+                return None
+            origin = check_origin()
+            if origin is None:  # pragma: no cover
+                return None
+            return set_headers(origin, current_app.response_class())
+
         if iscoroutinefunction(f):
 
             @wraps(f)
             async def wrapper(*args: _VP.args, **kwargs: _VP.kwargs) -> SansIoResponse:
+                resp = preflight()
+                if resp is not None:
+                    return resp
                 origin = check_origin()
                 if origin is None:
                     # If no Origin header is supplied, CORS checks don't apply
                     return await async_make_response(await f(*args, **kwargs))
-                if request.method == 'OPTIONS':
-                    # pre-flight request
-                    resp = SansIoResponse()
-                else:
-                    resp = await async_make_response(await f(*args, **kwargs))
-                return set_headers(origin, resp)
+                return set_headers(
+                    origin, await async_make_response(await f(*args, **kwargs))
+                )
 
         else:
 
             @wraps(f)
             def wrapper(*args: _VP.args, **kwargs: _VP.kwargs) -> SansIoResponse:
+                resp = preflight()
+                if resp is not None:
+                    return resp
                 origin = check_origin()
                 if origin is None:
                     # If no Origin header is supplied, CORS checks don't apply
                     return make_response(f(*args, **kwargs))
-                if request.method == 'OPTIONS':
-                    # pre-flight request
-                    resp = SansIoResponse()
-                else:
-                    resp = make_response(f(*args, **kwargs))
-                return set_headers(origin, resp)
+                return set_headers(origin, make_response(f(*args, **kwargs)))
 
+        # Allow outer dispatchers like `ClassView` to respond to pre-flight requests
+        # before loading anything for the view
+        wrapper.cors_preflight = preflight  # type: ignore[attr-defined]
         wrapper.provide_automatic_options = False  # type: ignore[attr-defined]
         wrapper.required_methods = ['OPTIONS']  # type: ignore[attr-defined]
 
@@ -1006,11 +1793,7 @@ def requires_permission(
 
     def decorator(f: Callable[_VP, _VR_co]) -> Callable[_VP, _VR_co]:
         def is_available_here() -> bool:
-            if not current_auth.permissions:
-                return False
-            if isinstance(permission, AbstractSet):
-                return bool(current_auth.permissions & permission)
-            return permission in current_auth.permissions
+            return has_permission(permission, current_auth.permissions)
 
         def is_available(context: Optional[Any] = None) -> bool:
             result = is_available_here()
@@ -1019,6 +1802,12 @@ def requires_permission(
                 return f.is_available(context)
             return result
 
+        # Describe the test so that it can be evaluated in bulk
+        is_available.requires_permission = permission  # type: ignore[attr-defined]
+        is_available.inner_is_available = getattr(  # type: ignore[attr-defined]
+            f, 'is_available', None
+        )
+
         if iscoroutinefunction(f):
 
             @wraps(f)
@@ -5,23 +5,28 @@
 from __future__ import annotations
 
 import re
-from collections.abc import Container
-from typing import Any, Optional, Union
+from collections import OrderedDict
+from collections.abc import Container, Iterable
+from threading import Lock
+from typing import Any, NamedTuple, Optional, Union
+from typing_extensions import TypeAlias
 from urllib.parse import urlsplit
+from weakref import WeakKeyDictionary
 
 from werkzeug.exceptions import MethodNotAllowed, NotFound
-from werkzeug.routing import RequestRedirect, Rule
+from werkzeug.routing import Map, MapAdapter, RequestRedirect, Rule
 
 from ..compat import (
     SansIoResponse,
     current_app,
+    current_app_object,
     json_dumps,
     request,
     session as request_session,
     url_for,
 )
 
-__all__ = ['get_current_url', 'get_next_url', 'jsonp', 'endpoint_for']
+__all__ = ['get_current_url', 'get_next_url', 'jsonp', 'endpoint_for', 'endpoints_for']
 
 __jsoncallback_re = re.compile(r'^[a-z$_][0-9a-z$_]*$', re.I)
 
@@ -136,51 +141,138 @@ def jsonp(*args: Any, **kwargs: Any) -> SansIoResponse:
     return current_app.response_class(data, mimetype=mimetype)
 
 
-def endpoint_for(
-    url: str,
-    method: str = 'GET',
-    return_rule: bool = False,
-    follow_redirects: bool = True,
-) -> tuple[Optional[Union[Rule, str]], dict[str, Any]]:
-    """
-    Retrieve endpoint or rule and view arguments given an absolute URL.
+#: Number of URLs to remember the endpoint for, per app
+_ENDPOINT_FOR_CACHE_SIZE = 4096
+#: Number of bound URL adapters to keep, per app
+_ENDPOINT_FOR_ADAPTER_CACHE_SIZE = 64
 
-    Requires a current request context to determine runtime environment.
+_EndpointForResult: TypeAlias = tuple[Optional[Union[Rule, str]], dict[str, Any]]
 
-    :param str method: HTTP method to use (defaults to GET)
-    :param bool return_rule: Return the URL rule instead of the endpoint name
-    :param bool follow_redirects: Follow redirects to final endpoint
-    :return: Tuple of endpoint name or URL rule or `None`, view arguments
-    """
+
+class _EndpointForOptions(NamedTuple):
+    """Options for :func:`endpoint_for` and the environment to match URLs in."""
+
+    method: str
+    return_rule: bool
+    follow_redirects: bool
+    root_path: str
+    scheme: str
+
+
+class _EndpointForCache:
+    """Bound URL adapters and endpoint lookups for an app's URL map."""
+
+    def __init__(self, url_map: Map, server_name: Optional[str]) -> None:
+        self.url_map = url_map
+        self.server_name = server_name
+        # Werkzeug does not support removing rules, so the rule count is a version
+        # number for the URL map
+        self.rule_count = len(url_map._rules)  # pylint: disable=protected-access
+        self.adapters: OrderedDict[tuple, MapAdapter] = OrderedDict()
+        self.results: OrderedDict[tuple, _EndpointForResult] = OrderedDict()
+        self.lock = Lock()
+
+    def is_current(self, url_map: Map, server_name: Optional[str]) -> bool:
+        """Confirm the cache is for the app's current URL map and server name."""
+        return (
+            url_map is self.url_map
+            and server_name == self.server_name
+            and len(url_map._rules)  # pylint: disable=protected-access
+            == self.rule_count
+        )
+
+    def adapter(
+        self,
+        host: str,
+        root_path: str,
+        subdomain: Optional[str],
+        scheme: str,
+        method: str,
+    ) -> MapAdapter:
+        """Return a URL adapter bound to the given environment."""
+        key = (host, root_path, subdomain, scheme, method)
+        with self.lock:
+            adapter = self.adapters.get(key)
+            if adapter is not None:
+                self.adapters.move_to_end(key)
+                return adapter
+        adapter = self.url_map.bind(
+            host, root_path, subdomain, scheme, method, '/', None
+        )
+        with self.lock:
+            self.adapters[key] = adapter
+            if len(self.adapters) > _ENDPOINT_FOR_ADAPTER_CACHE_SIZE:
+                self.adapters.popitem(last=False)
+        return adapter
+
+    def get(self, key: tuple) -> Optional[_EndpointForResult]:
+        """Return a cached result."""
+        with self.lock:
+            result = self.results.get(key)
+            if result is not None:
+                self.results.move_to_end(key)
+            return result
+
+    def set(self, key: tuple, result: _EndpointForResult) -> None:
+        """Cache a result."""
+        with self.lock:
+            self.results[key] = result
+            if len(self.results) > _ENDPOINT_FOR_CACHE_SIZE:
+                self.results.popitem(last=False)
+
+
+_endpoint_for_caches: WeakKeyDictionary[Any, _EndpointForCache] = WeakKeyDictionary()
+
+
+def _get_endpoint_for_cache() -> _EndpointForCache:
+    """Return the endpoint cache for the current app, resetting it if stale."""
+    app = current_app_object()
+    if app is None:
+        raise RuntimeError("Working outside of application context.")
+    server_name = app.config['SERVER_NAME']
+    cache = _endpoint_for_caches.get(app)
+    if cache is None or not cache.is_current(app.url_map, server_name):
+        cache = _endpoint_for_caches[app] = _EndpointForCache(app.url_map, server_name)
+    return cache
+
+
+def _match_endpoint(
+    cache: _EndpointForCache, url: str, options: _EndpointForOptions
+) -> _EndpointForResult:
+    """Find the endpoint for a URL, using cached URL adapters and results."""
+    key = (url, options)
+    result = cache.get(key)
+    if result is None:
+        result = _match_endpoint_uncached(cache, url, options)
+        cache.set(key, result)
+    # Return a copy of view arguments so that the cached copy can't be changed
+    return result[0], dict(result[1])
+
+
+def _match_endpoint_uncached(
+    cache: _EndpointForCache, url: str, options: _EndpointForOptions
+) -> _EndpointForResult:
     parsed_url = urlsplit(url)
     if not parsed_url.netloc:
         # We require an absolute URL
         return None, {}
 
-    use_host = current_app.config['SERVER_NAME'] or parsed_url.netloc
-    if request:
-        use_root_path = request.root_path
-        use_scheme = request.scheme
-    else:
-        use_root_path = '/'
-        use_scheme = 'https'
-    url_adapter = current_app.url_map.bind(
+    use_host = cache.server_name or parsed_url.netloc
+    url_adapter = cache.adapter(
         use_host,
-        use_root_path,
+        options.root_path,
         parsed_url.netloc[: -len(use_host) - 1]
         if parsed_url.netloc.endswith('.' + use_host)
         else None,
-        use_scheme,
-        method,
-        '/',
-        None,
+        options.scheme,
+        options.method,
     )
 
     # Run three hostname tests, one of which must pass:
 
     # 1. Does the URL map have host matching enabled? If so, the URL adapter will
     # validate the hostname.
-    if current_app.url_map.host_matching:  # noqa: SIM114
+    if cache.url_map.host_matching:  # noqa: SIM114
         pass
 
     # 2. If not, does the domain match? url_adapter.server_name will prefer
@@ -202,20 +294,74 @@ def endpoint_for(
     # Now retrieve the endpoint or rule, watching for redirects or resolution failures
     try:
         return url_adapter.match(  # type: ignore[call-overload]
-            parsed_url.path, method, return_rule=return_rule
+            parsed_url.path, options.method, return_rule=options.return_rule
         )
     except RequestRedirect as r:
         # A redirect typically implies `/folder` -> `/folder/`
         # This will not be a redirect response from a view, since the view isn't being
         # called
-        if follow_redirects:
-            return endpoint_for(
-                r.new_url,
-                method=method,
-                return_rule=return_rule,
-                follow_redirects=follow_redirects,
-            )
+        if options.follow_redirects:
+            return _match_endpoint(cache, r.new_url, options)
     except (NotFound, MethodNotAllowed):
         pass
     # If we got here, no endpoint was found.
     return None, {}
+
+
+def _endpoint_for_options(
+    method: str, return_rule: bool, follow_redirects: bool
+) -> _EndpointForOptions:
+    """Return options for :func:`endpoint_for` with the runtime environment."""
+    if request:
+        return _EndpointForOptions(
+            method, return_rule, follow_redirects, request.root_path, request.scheme
+        )
+    return _EndpointForOptions(method, return_rule, follow_redirects, '/', 'https')
+
+
+def endpoint_for(
+    url: str,
+    method: str = 'GET',
+    return_rule: bool = False,
+    follow_redirects: bool = True,
+) -> tuple[Optional[Union[Rule, str]], dict[str, Any]]:
+    """
+    Retrieve endpoint or rule and view arguments given an absolute URL.
+
+    Requires a current request context to determine runtime environment. URL adapters
+    and results are cached for each app, and the cache is reset when rules are added
+    to the app's URL map.
+
+    :param str method: HTTP method to use (defaults to GET)
+    :param bool return_rule: Return the URL rule instead of the endpoint name
+    :param bool follow_redirects: Follow redirects to final endpoint
+    :return: Tuple of endpoint name or URL rule or `None`, view arguments
+    """
+    return _match_endpoint(
+        _get_endpoint_for_cache(),
+        url,
+        _endpoint_for_options(method, return_rule, follow_redirects),
+    )
+
+
+def endpoints_for(
+    urls: Iterable[str],
+    method: str = 'GET',
+    return_rule: bool = False,
+    follow_redirects: bool = True,
+) -> list[tuple[Optional[Union[Rule, str]], dict[str, Any]]]:
+    """
+    Retrieve endpoints or rules and view arguments for many absolute URLs.
+
+    This is the same as calling :func:`endpoint_for` on each URL, but looks up the
+    runtime environment only once.
+
+    :param urls: URLs to find endpoints for
+    :param str method: HTTP method to use (defaults to GET)
+    :param bool return_rule: Return the URL rule instead of the endpoint name
+    :param bool follow_redirects: Follow redirects to final endpoint
+    :return: List of tuples of endpoint name or URL rule or `None`, view arguments
+    """
+    cache = _get_endpoint_for_cache()
+    options = _endpoint_for_options(method, return_rule, follow_redirects)
+    return [_match_endpoint(cache, url, options) for url in urls]
@@ -43,6 +43,15 @@ def sqlalchemy_uri() -> str:
     )
 
 
+# This is NOT a fixture
+def async_sqlalchemy_uri() -> str:
+    """Return SQLAlchemy database URI for an async engine (psycopg supports both)."""
+    uri = sqlalchemy_uri()
+    if uri.startswith('sqlite:'):
+        return uri.replace('sqlite:', 'sqlite+aiosqlite:', 1)
+    return uri
+
+
 @pytest.fixture(scope='module')
 def app() -> Flask:
     """App fixture."""
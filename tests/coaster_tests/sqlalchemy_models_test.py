@@ -8,11 +8,13 @@ from __future__ import annotations
 from datetime import datetime, timedelta
 from time import sleep
 from typing import TYPE_CHECKING, Any, Optional
-from uuid import UUID
+from unittest.mock import patch
+from uuid import UUID, uuid4
 
 import pytest
 import sqlalchemy as sa
 import sqlalchemy.orm as sa_orm
+from flask import g
 from furl import furl
 from pytz import utc
 from sqlalchemy.dialects import postgresql
@@ -28,13 +30,22 @@ from coaster.sqlalchemy import (
     BaseScopedIdNameMixin,
     BaseScopedNameMixin,
     JsonDict,
+    ScopedIdCounter,
     UrlType,
     UuidMixin,
     add_primary_relationship,
     auto_init_default,
+    cache_instance,
+    clear_instance_cache,
+    exists_many,
     failsafe_add,
+    failsafe_add_all,
+    get_cached_instance,
+    iter_chunks,
+    on_conflict_insert,
     relationship,
 )
+from coaster.sqlalchemy.roles import RoleAccessProxy
 from coaster.utils import uuid_to_base58, uuid_to_base64
 
 from .conftest import AppTestCase, Model, db
@@ -106,6 +117,15 @@ class ScopedNamedDocument(BaseScopedNameMixin, Model):
     __table_args__ = (sa.UniqueConstraint('container_id', 'name'),)
 
 
+class UnconstrainedScopedNamedDocument(BaseScopedNameMixin, Model):
+    __tablename__ = 'unconstrained_scoped_named_document'
+    container_id: Mapped[Optional[int]] = sa_orm.mapped_column(
+        sa.ForeignKey('container.id')
+    )
+    container: Mapped[Optional[Container]] = relationship()
+    parent: Mapped[Optional[Container]] = sa_orm.synonym('container')
+
+
 class IdNamedDocument(BaseIdNameMixin, Model):
     __tablename__ = 'id_named_document'
     container_id: Mapped[Optional[int]] = sa_orm.mapped_column(
@@ -128,6 +148,20 @@ class ScopedIdDocument(BaseScopedIdMixin, Model):
     __table_args__ = (sa.UniqueConstraint('container_id', 'url_id'),)
 
 
+scoped_id_counter = ScopedIdCounter(Model.metadata)
+
+
+class CountedScopedIdDocument(BaseScopedIdMixin, Model):
+    __tablename__ = 'counted_scoped_id_document'
+    __scoped_id_counter__ = scoped_id_counter
+    container_id: Mapped[Optional[int]] = sa_orm.mapped_column(
+        sa.ForeignKey('container.id')
+    )
+    container: Mapped[Optional[Container]] = relationship()
+    parent: Mapped[Optional[Container]] = sa_orm.synonym('container')
+    __table_args__ = (sa.UniqueConstraint('container_id', 'url_id'),)
+
+
 class ScopedIdNamedDocument(BaseScopedIdNameMixin, Model):
     __tablename__ = 'scoped_id_named_document'
     container_id: Mapped[Optional[int]] = sa_orm.mapped_column(
@@ -228,6 +262,16 @@ class UuidKey(BaseMixin[UUID, Any], Model):
     __tablename__ = 'uuid_key'
 
 
+class UuidV7Key(BaseMixin[UUID, Any], Model):
+    __tablename__ = 'uuid_v7_key'
+    __uuid_version__ = 7
+
+
+class NonUuidV7MixinKey(UuidMixin, BaseMixin[int, Any], Model):
+    __tablename__ = 'non_uuid_v7_mixin_key'
+    __uuid_version__ = 7
+
+
 class UuidKeyNoDefault(BaseMixin[UUID, Any], Model):
     __tablename__ = 'uuid_key_no_default'
     id: Mapped[UUID] = sa_orm.mapped_column(  # type: ignore[assignment]
@@ -402,6 +446,122 @@ class TestCoasterModels(AppTestCase):
                 'valid1', title='Invalid1', non_existent_field="I don't belong here."
             )
 
+    def test_upsert_native(self) -> None:
+        """Upserts use a single INSERT ... ON CONFLICT statement where possible."""
+        c1 = self.make_container()
+        c2 = self.make_container()
+        self.session.commit()
+        d1 = NamedDocument.upsert('upsert1', title="Upsert 1", content="One")
+        sd1 = ScopedNamedDocument.upsert(c1, 'upsert1', title="Upsert 1")
+        self.session.commit()
+        created_at = d1.created_at
+        assert c1.id is not None  # Load before counting statements
+
+        statements: list[str] = []
+
+        def counter(_conn: Any, _cursor: Any, statement: str, *_args: Any) -> None:
+            statements.append(statement)
+
+        engine = self.session.get_bind()
+        sa.event.listen(engine, 'before_cursor_execute', counter)
+        try:
+            assert (
+                NamedDocument.upsert('upsert1', title="Upsert 1", content="Updated")
+                is d1
+            )
+            assert len(statements) == 1
+            assert 'ON CONFLICT' in statements[0]
+            assert d1.content == "Updated"
+            assert d1.created_at == created_at
+
+            statements.clear()
+            docs = NamedDocument.upsert_many(
+                [
+                    {'name': 'upsert2', 'title': "Upsert 2"},
+                    {'name': 'upsert1', 'title': "Upserted 1"},
+                    {'name': 'upsert3', 'title': "Upsert 3", 'content': "Three"},
+                ]
+            )
+            # One statement for each set of keys
+            assert len(statements) == 2
+            assert [d.name for d in docs] == ['upsert2', 'upsert1', 'upsert3']
+            assert docs[1] is d1
+            assert d1.title == "Upserted 1"
+            assert d1.content == "Updated"
+
+            statements.clear()
+            scoped_docs = ScopedNamedDocument.upsert_many(
+                c1,
+                [
+                    {'name': 'upsert1', 'title': "Scoped 1"},
+                    {'name': 'upsert2', 'title': "Scoped 2"},
+                ],
+            )
+            assert len(statements) == 1
+            assert scoped_docs[0] is sd1
+            assert sd1.title == "Scoped 1"
+            assert scoped_docs[1].parent == c1
+        finally:
+            sa.event.remove(engine, 'before_cursor_execute', counter)
+
+        # Without a required column, the instance is loaded and updated instead
+        assert NamedDocument.upsert('upsert3', content="Three again") is docs[2]
+        assert docs[2].content == "Three again"
+        assert docs[2].title == "Upsert 3"
+
+        # The same name in another parent is a separate instance
+        sd2 = ScopedNamedDocument.upsert(c2, 'upsert1', title="Another parent")
+        assert sd2 is not sd1
+        assert sd2.parent == c2
+        assert sd1.title == "Scoped 1"
+        self.session.commit()
+
+    def test_upsert_native_fallback(self) -> None:
+        """Upserts use the ORM if the native upsert would skip or fail checks."""
+        c1 = self.make_container()
+        self.session.commit()
+        statements: list[str] = []
+
+        def counter(_conn: Any, _cursor: Any, statement: str, *_args: Any) -> None:
+            statements.append(statement)
+
+        inserted: list[str] = []
+
+        def before_insert(_mapper: Any, _connection: Any, target: Any) -> None:
+            inserted.append(target.name)
+
+        engine = self.session.get_bind()
+        sa.event.listen(engine, 'before_cursor_execute', counter)
+        sa.event.listen(NamedDocument, 'before_insert', before_insert)
+        try:
+            # Other insert listeners are not bypassed
+            d1 = NamedDocument.upsert('fallback1', title="Fallback 1")
+            self.session.flush()
+            assert inserted == ['fallback1']
+            assert not any('ON CONFLICT' in statement for statement in statements)
+        finally:
+            sa.event.remove(NamedDocument, 'before_insert', before_insert)
+
+        try:
+            # Without a matching unique constraint, ON CONFLICT would raise an error
+            statements.clear()
+            ud1 = UnconstrainedScopedNamedDocument.upsert(
+                c1, 'fallback1', title="Fallback 1"
+            )
+            self.session.flush()
+            assert not any('ON CONFLICT' in statement for statement in statements)
+            assert (
+                UnconstrainedScopedNamedDocument.upsert(
+                    c1, 'fallback1', title="Fallback 2"
+                )
+                is ud1
+            )
+            assert ud1.title == "Fallback 2"
+        finally:
+            sa.event.remove(engine, 'before_cursor_execute', counter)
+        assert NamedDocument.upsert('fallback1', title="Native") is d1
+        self.session.commit()
+
     # TODO: Versions of this test are required for BaseNameMixin,
     # BaseScopedNameMixin, BaseIdNameMixin and BaseScopedIdNameMixin
     # since they replicate code without sharing it. Only BaseNameMixin
@@ -485,6 +645,65 @@ class TestCoasterModels(AppTestCase):
                 non_existent_field="I don't belong here.",
             )
 
+    def test_instance_cache(self) -> None:
+        """Lookups by name are cached in the request and invalidated on flush."""
+        c1 = self.make_container()
+        self.session.commit()
+        d1 = NamedDocument(title="Hello", content="World", container=c1)
+        sd1 = ScopedNamedDocument(title="Hello", content="World", container=c1)
+        self.session.add_all([d1, sd1])
+        self.session.commit()
+
+        statements: list[str] = []
+
+        def counter(_conn: Any, _cursor: Any, statement: str, *_args: Any) -> None:
+            statements.append(statement)
+
+        engine = self.session.get_bind()
+        sa.event.listen(engine, 'before_cursor_execute', counter)
+        try:
+            assert NamedDocument.get('hello') is d1
+            assert ScopedNamedDocument.get(c1, 'hello') is sd1
+            count = len(statements)
+            assert NamedDocument.get('hello') is d1
+            assert ScopedNamedDocument.get(c1, 'hello') is sd1
+            assert get_cached_instance(NamedDocument, {'name': 'hello'}) is d1
+            assert len(statements) == count
+            # Misses are not cached
+            assert NamedDocument.get('hello2') is None
+            assert NamedDocument.get('hello2') is None
+            assert len(statements) == count + 2
+
+            # A changed instance is not returned from cache, even before flush
+            d1.name = 'renamed'
+            assert get_cached_instance(NamedDocument, {'name': 'hello'}) is None
+            assert NamedDocument.get('hello') is None
+            assert NamedDocument.get('renamed') is d1
+
+            # A flush clears the cache
+            assert get_cached_instance(NamedDocument, {'name': 'renamed'}) is d1
+            d1.content = "Changed"
+            self.session.flush()
+            assert get_cached_instance(NamedDocument, {'name': 'renamed'}) is None
+            assert NamedDocument.get('renamed') is d1
+            assert get_cached_instance(NamedDocument, {'name': 'renamed'}) is d1
+            clear_instance_cache()
+            assert get_cached_instance(NamedDocument, {'name': 'renamed'}) is None
+        finally:
+            sa.event.remove(engine, 'before_cursor_execute', counter)
+
+        # The cache is not used outside a request context
+        cache_instance(NamedDocument, {'name': 'renamed'}, d1)
+        with self.app.app_context():
+            assert get_cached_instance(NamedDocument, {'name': 'renamed'}) is None
+
+        # The cache is cleared at the end of a request, even if `g` outlives it
+        with self.app.app_context():
+            with self.app.test_request_context():
+                cache_instance(NamedDocument, {'name': 'renamed'}, d1)
+                assert get_cached_instance(NamedDocument, {'name': 'renamed'}) is d1
+            assert not g._coaster_instance_cache
+
     def test_scoped_named_short_title(self) -> None:
         """Test the short_title method of BaseScopedNameMixin."""
         c1 = self.make_container()
@@ -549,6 +768,55 @@ class TestCoasterModels(AppTestCase):
         self.session.commit()
         assert d4.url_id == 3
 
+    def test_scoped_id_counter(self) -> None:
+        """Scoped ids can be allocated from a counter table in blocks."""
+        c1 = self.make_container()
+        c2 = self.make_container()
+        self.session.commit()
+        # An existing row is used to seed the counter
+        self.session.add(CountedScopedIdDocument(container=c1, url_id=5))
+        self.session.commit()
+
+        docs = [CountedScopedIdDocument(container=c1) for _i in range(3)]
+        docs.append(CountedScopedIdDocument(container=c2))
+        assert [d.url_id for d in docs] == [None, None, None, None]
+        self.session.add_all(docs)
+        self.session.commit()
+        assert [d.url_id for d in docs] == [6, 7, 8, 1]
+        counters = self.session.execute(
+            sa.select(
+                scoped_id_counter.table.c.parent_key, scoped_id_counter.table.c.url_id
+            )
+        ).all()
+        assert sorted(counters) == [(str(c1.id), 8), (str(c2.id), 1)]
+
+        # A block of ids can be reserved for bulk inserts
+        assert CountedScopedIdDocument.reserve_scoped_ids(c1, 10) == range(9, 19)
+        # An instance in a session gets an id immediately
+        d5 = CountedScopedIdDocument(container=c1)
+        self.session.add(d5)
+        d5.make_scoped_id()
+        assert d5.url_id == 19
+        self.session.commit()
+        assert CountedScopedIdDocument.get(c1, 19) is d5
+
+        # A parent that is not yet saved gets its counter on insert
+        c3 = self.make_container()
+        d6 = CountedScopedIdDocument(container=c3)
+        self.session.add(d6)
+        self.session.commit()
+        assert d6.url_id == 1
+
+        with pytest.raises(TypeError, match='__scoped_id_counter__'):
+            ScopedIdDocument.reserve_scoped_ids(c1, 1)
+        with pytest.raises(ValueError, match='at least 1'):
+            CountedScopedIdDocument.reserve_scoped_ids(c1, 0)
+
+        # Reserved ids are released if the transaction is rolled back
+        ids = CountedScopedIdDocument.reserve_scoped_ids(c1, 2)
+        self.session.rollback()
+        assert CountedScopedIdDocument.reserve_scoped_ids(c1, 2) == ids
+
     def test_scoped_id_named(self) -> None:
         """Documents with a container-specific id and name in the URL."""
         c1 = self.make_container()
@@ -633,6 +901,52 @@ class TestCoasterModels(AppTestCase):
         d2.make_name(reserved=['new2'])
         assert d2.name == 'new3'
 
+    def test_make_name_single_query(self) -> None:
+        """make_name finds a free name with one query, however many are in use."""
+        c1 = self.make_container()
+        c2 = self.make_container()
+        self.session.commit()
+        names = ['meetup', *(f'meetup{i}' for i in range(2, 13))]
+        self.session.add_all(
+            [NamedDocument(name=n, title="Meetup", container=c1) for n in names]
+            + [ScopedNamedDocument(name=n, title="Meetup", container=c1) for n in names]
+            + [ScopedNamedDocument(name='meetup', title="Meetup", container=c2)]
+            # A name that shares the prefix but is not a candidate
+            + [NamedDocument(name='meetups', title="Meetups", container=c1)]
+        )
+        self.session.commit()
+
+        statements: list[str] = []
+
+        def counter(_conn: Any, _cursor: Any, statement: str, *_args: Any) -> None:
+            statements.append(statement)
+
+        d1 = NamedDocument(title="Meetup", container=c1)
+        d2 = ScopedNamedDocument(title="Meetup", container=c2)
+        engine = self.session.get_bind()
+        sa.event.listen(engine, 'before_cursor_execute', counter)
+        try:
+            d1.make_name(reserved=['meetup13'])
+            assert d1.name == 'meetup14'
+            d2.make_name()
+            assert d2.name == 'meetup2'
+            assert len(statements) == 2
+        finally:
+            sa.event.remove(engine, 'before_cursor_execute', counter)
+
+        # Candidates that no longer share the prefix are checked one at a time
+        no_prefetch = patch('coaster.sqlalchemy.mixins._MAKE_NAME_PREFETCH_DIGITS', 0)
+        with no_prefetch, patch.object(NamedDocument, '__name_length__', 6):
+            d3 = NamedDocument(title="Meetup", container=c1)
+            d3.make_name()
+            assert d3.name == 'meetu2'
+
+        # If there are too many names to fetch, the rest are checked one at a time
+        with patch('coaster.sqlalchemy.mixins._MAKE_NAME_PREFETCH_LIMIT', 5):
+            d4 = NamedDocument(title="Meetup", container=c1)
+            d4.make_name()
+            assert d4.name == 'meetup13'
+
     def test_named_auto(self) -> None:
         """The name attribute is auto-generated on database insertion."""
         c1 = self.make_container()
@@ -885,6 +1199,189 @@ class TestCoasterModels(AppTestCase):
         d1 = NamedDocument(name='missing_title')
         assert failsafe_add(self.session, d1) is None
 
+    def test_failsafe_add_all(self) -> None:
+        """`failsafe_add_all` inserts in bulk and loads rows that already exist."""
+        c1 = self.make_container()
+        c2 = self.make_container()
+        existing = NamedDocument(name='existing', title="Existing", container=c1)
+        scoped_existing = ScopedNamedDocument(
+            name='existing', title="Existing", container=c1
+        )
+        self.session.add_all([existing, scoped_existing])
+        self.session.commit()
+
+        docs = [
+            NamedDocument(name='new1', title="New 1", container=c1),
+            NamedDocument(name='existing', title="Duplicate", container=c2),
+            NamedDocument(title="Generated name", content="Content"),
+        ]
+        # An instance already in the session is not inserted on flush
+        self.session.add(docs[1])
+        results = failsafe_add_all(self.session, docs, conflict_keys=['name'])
+        assert [d.name for d in results] == ['new1', 'existing', 'generated-name']
+        assert results[1] is existing
+        assert existing.title == "Existing"
+        assert results[0].container == c1
+        assert results[2].content == "Content"
+        self.session.commit()
+        assert NamedDocument.query.count() == 3
+
+        scoped = failsafe_add_all(
+            self.session,
+            [
+                ScopedNamedDocument(name='existing', title="Other", container=c2),
+                ScopedNamedDocument(name='existing', title="Dupe", container=c1),
+                ScopedNamedDocument(name='existing', title="Dupe 2", container=c1),
+            ],
+            conflict_keys=['container_id', 'name'],
+            batch_size=2,
+        )
+        assert scoped[0].container == c2
+        assert scoped[0].title == "Other"
+        assert scoped[1] is scoped[2] is scoped_existing
+        self.session.commit()
+        assert ScopedNamedDocument.query.count() == 2
+        assert failsafe_add_all(self.session, [], conflict_keys=['name']) == []
+
+    def test_failsafe_add_all_bulk(self) -> None:
+        """`failsafe_add_all` uses bulk inserts for models without insert hooks."""
+        assert on_conflict_insert(self.session, NonUuidMixinKey) is not None
+        existing = [NonUuidMixinKey() for _i in range(3)]
+        self.session.add_all(existing)
+        self.session.commit()
+        uuids = [instance.uuid for instance in existing]  # Load before counting
+
+        statements: list[str] = []
+
+        def counter(_conn: Any, _cursor: Any, statement: str, *_args: Any) -> None:
+            statements.append(statement)
+
+        engine = self.session.get_bind()
+        sa.event.listen(engine, 'before_cursor_execute', counter)
+        try:
+            new = [NonUuidMixinKey(uuid=uuid4()) for _i in range(3)]
+            results = failsafe_add_all(
+                self.session,
+                [new[0], NonUuidMixinKey(uuid=uuids[0]), new[1]]
+                + [NonUuidMixinKey(uuid=uuid) for uuid in uuids[1:]]
+                + [new[2]],
+                conflict_keys=['uuid'],
+                batch_size=2,
+            )
+        finally:
+            sa.event.remove(engine, 'before_cursor_execute', counter)
+        assert [r.uuid for r in results] == [
+            new[0].uuid,
+            uuids[0],
+            new[1].uuid,
+            uuids[1],
+            uuids[2],
+            new[2].uuid,
+        ]
+        assert results[1] is existing[0]
+        assert results[3:5] == existing[1:]
+        inserts = [s for s in statements if 'ON CONFLICT' in s]
+        selects = [s for s in statements if s.lstrip().startswith('SELECT')]
+        # Three batches of two rows, and two queries for three existing rows
+        assert len(inserts) == 3
+        assert len(selects) == 2
+        self.session.commit()
+        assert NonUuidMixinKey.query.count() == 6
+
+    def test_iter_chunks(self) -> None:
+        """Queries and selects can be iterated in chunks."""
+        self.session.add_all([Container(name=f'c{i}') for i in range(7)])
+        self.session.commit()
+        self.session.expunge_all()
+
+        query = Container.query.order_by(Container.id)
+        chunks = list(query.iter_chunks(3))
+        assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+        assert [c.name for chunk in chunks for c in chunk] == [
+            f'c{i}' for i in range(7)
+        ]
+        assert all(c in self.session for chunk in chunks for c in chunk)
+        self.session.expunge_all()
+
+        seen = []
+        for chunk in query.iter_chunks(3, expunge=True):
+            seen.extend(chunk)
+            assert all(c in self.session for c in chunk)
+        assert len(seen) == 7
+        assert not any(c in self.session for c in seen)
+
+        proxies = list(query.iter_chunks(5, access_for={'actor': None}))
+        assert [len(chunk) for chunk in proxies] == [5, 2]
+        assert all(isinstance(p, RoleAccessProxy) for p in proxies[0])
+
+        select = sa.select(Container).order_by(Container.id)
+        chunks = list(iter_chunks(self.session, select, 4, expunge=True))
+        assert [[c.name for c in chunk] for chunk in chunks] == [
+            ['c0', 'c1', 'c2', 'c3'],
+            ['c4', 'c5', 'c6'],
+        ]
+        assert not any(c in self.session for chunk in chunks for c in chunk)
+        # Selects for multiple columns yield rows
+        rows = list(
+            iter_chunks(
+                self.session, sa.select(Container.id, Container.name), 5, expunge=True
+            )
+        )
+        assert [len(chunk) for chunk in rows] == [5, 2]
+        assert {row.name for row in rows[1]} == {'c5', 'c6'}
+
+    def test_exists_many(self) -> None:
+        """Many values can be checked for existence at once."""
+        c1 = self.make_container()
+        self.session.add_all(
+            [
+                NamedDocument(name=f'doc{i}', title=f"Doc {i}", container=c1)
+                for i in range(5)
+            ]
+            + [NamedDocument(name='other', title="Other")]
+        )
+        self.session.commit()
+        names = ['doc1', 'doc3', 'doc3', 'missing', None, 'other', 'doc4']
+        assert NamedDocument.query.exists_many(NamedDocument.name, names) == {
+            'doc1',
+            'doc3',
+            'doc4',
+            'other',
+        }
+        # Filters on the query are respected, and chunks are combined
+        assert NamedDocument.query.filter(NamedDocument.container == c1).exists_many(
+            NamedDocument.name, names, chunk_size=2
+        ) == {
+            'doc1',
+            'doc3',
+            'doc4',
+        }
+        assert NamedDocument.query.exists_many(NamedDocument.name, []) == set()
+        select = sa.select(NamedDocument).where(NamedDocument.container_id.is_(None))
+        assert exists_many(
+            self.session, select, NamedDocument.name, names, chunk_size=1
+        ) == {'other'}
+
+    def test_uuid_version(self) -> None:
+        """Models can use time-ordered UUID7 keys."""
+        keys = [UuidV7Key() for _i in range(5)]
+        assert [key.id.version for key in keys] == [7] * 5
+        assert [key.id for key in keys] == sorted(key.id for key in keys)
+        assert UuidKey().id.version == 4
+        docs = [NonUuidV7MixinKey() for _i in range(3)]
+        assert [doc.uuid.version for doc in docs] == [7] * 3
+        self.session.add_all([*keys, *docs])
+        self.session.commit()
+        assert [key.id for key in UuidV7Key.query.order_by(UuidV7Key.id)] == [
+            key.id for key in keys
+        ]
+
+        with pytest.raises(ValueError, match="must be 4 or 7"):
+
+            class UuidV1Key(BaseMixin[UUID, Any], Model):
+                __tablename__ = 'uuid_v1_key'
+                __uuid_version__ = 1  # type: ignore[assignment]
+
     def test_uuid_key(self) -> None:
         """Models with a UUID primary key work as expected."""
         u1 = UuidKey()
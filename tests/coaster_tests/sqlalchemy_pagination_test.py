@@ -0,0 +1,275 @@
+"""Test pagination."""
+
+import time
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+import sqlalchemy as sa
+from flask import Flask
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from werkzeug.exceptions import NotFound
+
+from coaster.sqlalchemy import BaseMixin, pagination
+from coaster.sqlalchemy.pagination import SelectKeysetPagination, SelectPagination
+
+from .conftest import AppTestCase, Model, async_sqlalchemy_uri, db
+
+
+class PagedItem(BaseMixin[int, None], Model):
+    """Test model for keyset pagination."""
+
+    __tablename__ = 'paged_item'
+    position = sa.orm.mapped_column(sa.DateTime, nullable=False)
+
+
+class PagedEvent(BaseMixin[int, None], Model):
+    """Test model for polymorphic entities in count estimates."""
+
+    __tablename__ = 'paged_event'
+    kind = sa.orm.mapped_column(sa.Unicode(10), nullable=False)
+    __mapper_args__ = {'polymorphic_on': kind, 'polymorphic_identity': 'event'}
+
+
+class PagedMeetup(PagedEvent):
+    """Single-table subclass of :class:`PagedEvent`."""
+
+    __mapper_args__ = {'polymorphic_identity': 'meetup'}
+
+
+# -- Tests --------------------------------------------------------------------
+
+
+class TestCountMode(AppTestCase):
+    """Tests for how pagination counts are calculated."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        db.session.add_all(
+            [PagedItem(position=datetime(2020, 1, 1)) for _i in range(25)]
+        )
+        db.session.commit()
+        pagination._count_cache.clear()
+
+    def test_exact_count(self) -> None:
+        page = PagedItem.query.paginate(page=1, per_page=10)
+        assert page.total == 25
+        assert page.count_mode == 'exact'
+        assert page.is_estimate is False
+        page2 = page.next()
+        assert [item.id for item in page2] == list(range(11, 21))
+        assert page2.total == 25
+        assert page2.is_estimate is False
+
+    def test_estimate_falls_back_to_exact(self) -> None:
+        # Estimates require PostgreSQL
+        page = SelectPagination(
+            db.session,
+            sa.select(PagedItem),
+            page=1,
+            per_page=10,
+            count_mode='estimate',
+        )
+        assert page.total == 25
+        assert page.is_estimate is (db.engine.dialect.name == 'postgresql')
+
+    def test_estimate_stats_table(self) -> None:
+        # Table statistics are only used when the ORM adds no hidden criteria
+        table = PagedItem.__table__
+        assert pagination._stats_table(sa.select(PagedItem)) is table
+        assert pagination._stats_table(sa.select(PagedItem.id)) is table
+        assert (
+            pagination._stats_table(sa.select(PagedItem).where(PagedItem.id > 1))
+            is None
+        )
+        assert pagination._stats_table(sa.select(table)) is None
+        assert (
+            pagination._stats_table(
+                sa.select(PagedItem).options(
+                    sa.orm.with_loader_criteria(PagedItem, PagedItem.id > 1)
+                )
+            )
+            is None
+        )
+        assert pagination._stats_table(sa.select(PagedEvent)) is None
+        assert pagination._stats_table(sa.select(PagedMeetup)) is None
+
+    def test_cached_count(self) -> None:
+        page = PagedItem.query.paginate(page=1, per_page=10, count_mode='cached')
+        assert page.total == 25
+        assert page.is_estimate is False
+        db.session.add(PagedItem(position=datetime(2020, 1, 1)))
+        db.session.commit()
+        page = PagedItem.query.paginate(page=1, per_page=10, count_mode='cached')
+        assert page.total == 25
+        assert page.is_estimate is True
+        # A different statement has its own count
+        select_page = SelectPagination(
+            db.session,
+            sa.select(PagedItem).where(PagedItem.id > 20),
+            page=1,
+            per_page=10,
+            count_mode='cached',
+        )
+        assert select_page.total == 6
+        assert select_page.is_estimate is False
+        # Expired counts are recalculated
+        with patch.object(pagination, 'monotonic', return_value=time.monotonic() + 61):
+            page = PagedItem.query.paginate(page=1, per_page=10, count_mode='cached')
+        assert page.total == 26
+        assert page.is_estimate is False
+
+    def test_unknown_count_mode(self) -> None:
+        with pytest.raises(ValueError, match="Unknown count mode"):
+            PagedItem.query.paginate(count_mode='fast')  # type: ignore[arg-type]
+
+
+class TestKeysetPagination(AppTestCase):
+    """Tests for keyset pagination."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        start = datetime(2020, 1, 1)
+        # Pairs of items share a position, so the id is needed to break ties
+        db.session.add_all(
+            [PagedItem(position=start + timedelta(days=i // 2)) for i in range(25)]
+        )
+        db.session.commit()
+        self.expected = [
+            item.id
+            for item in PagedItem.query.order_by(
+                PagedItem.position.desc(), PagedItem.id.desc()
+            )
+        ]
+
+    def test_query_keyset_paginate(self) -> None:
+        order_by = (PagedItem.position.desc(), PagedItem.id.desc())
+        page = PagedItem.query.keyset_paginate(*order_by, per_page=10, count=True)
+        assert [item.id for item in page] == self.expected[:10]
+        assert page.total == 25
+        assert page.has_next is True
+        assert page.has_prev is False
+        assert page.prev_cursor is None
+
+        page2 = page.next()
+        assert [item.id for item in page2] == self.expected[10:20]
+        assert page2.total == 25
+        assert page2.has_prev is True
+        page3 = page2.next()
+        assert [item.id for item in page3] == self.expected[20:]
+        assert page3.has_next is False
+        assert page3.next_cursor is None
+
+        back = page3.prev()
+        assert [item.id for item in back] == self.expected[10:20]
+        assert back.has_next is True
+        assert back.has_prev is True
+        assert back.next_cursor is not None
+        assert [item.id for item in back.prev()] == self.expected[:10]
+        # A cursor can be reused from a new query
+        assert [
+            item.id
+            for item in PagedItem.query.keyset_paginate(
+                *order_by, per_page=10, cursor=page.next_cursor
+            )
+        ] == self.expected[10:20]
+
+    def test_select_keyset_pagination_mixed_order(self) -> None:
+        expected = [
+            item.id
+            for item in PagedItem.query.order_by(
+                PagedItem.position.asc(), PagedItem.id.desc()
+            )
+        ]
+        seen: list[int] = []
+        page = SelectKeysetPagination(
+            db.session,
+            sa.select(PagedItem),
+            (PagedItem.position, PagedItem.id.desc()),
+            per_page=7,
+        )
+        seen.extend(item.id for item in page)
+        while page.has_next:
+            page = page.next()
+            seen.extend(item.id for item in page)
+        assert seen == expected
+
+    def test_keyset_pagination_past_ends(self) -> None:
+        first = PagedItem.query.keyset_paginate(PagedItem.id, per_page=20)
+        last = first.next()
+        assert [item.id for item in last] == sorted(self.expected)[20:]
+        for page in (first.prev(), last.next()):
+            assert list(page) == []
+            assert page.has_next is False
+            assert page.has_prev is False
+            assert page.next_cursor is None
+            assert page.prev_cursor is None
+        with pytest.raises(NotFound):
+            last.next(error_out=True)
+        with pytest.raises(NotFound):
+            first.prev(error_out=True)
+        # The request's cursor is not used in place of the missing cursor
+        with self.app.test_request_context(query_string={'cursor': first.next_cursor}):
+            assert list(last.next()) == []
+            assert list(first.prev()) == []
+
+    def test_invalid_cursor(self) -> None:
+        with pytest.raises(NotFound):
+            PagedItem.query.keyset_paginate(PagedItem.id, cursor='invalid')
+        page = PagedItem.query.keyset_paginate(
+            PagedItem.id, cursor='invalid', error_out=False, per_page=5
+        )
+        assert page.cursor is None
+        assert [item.id for item in page] == sorted(self.expected)[:5]
+
+    def test_cursor_from_request(self) -> None:
+        page = PagedItem.query.keyset_paginate(PagedItem.id, per_page=5)
+        with self.app.test_request_context(
+            query_string={'cursor': page.next_cursor, 'per_page': 5}
+        ):
+            page2 = PagedItem.query.keyset_paginate(PagedItem.id)
+        assert [item.id for item in page2] == sorted(self.expected)[5:10]
+
+
+async def test_select_pagination_concurrent_count(app: Flask) -> None:
+    """SelectPagination.anew can count on a separate connection."""
+    with app.test_request_context():
+        db.create_all()
+        try:
+            db.session.add_all(
+                [PagedItem(position=datetime(2020, 1, 1)) for _i in range(25)]
+            )
+            db.session.commit()
+            engine = create_async_engine(async_sqlalchemy_uri())
+            async with AsyncSession(engine) as async_session:
+                select = sa.select(PagedItem).order_by(PagedItem.id)
+                page = await SelectPagination.anew(
+                    async_session, select, page=2, per_page=10, concurrent_count=True
+                )
+                assert [item.id for item in page] == list(range(11, 21))
+                assert page.total == 25
+                page3 = await page.anext()
+                assert [item.id for item in page3] == list(range(21, 26))
+                assert page3.total == 25
+                with pytest.raises(NotFound):
+                    await SelectPagination.anew(
+                        async_session,
+                        select,
+                        page=4,
+                        per_page=10,
+                        concurrent_count=True,
+                    )
+                empty = await SelectPagination.anew(
+                    async_session,
+                    select,
+                    page=4,
+                    per_page=10,
+                    error_out=False,
+                    concurrent_count=True,
+                )
+                assert list(empty) == []
+                assert empty.total == 25
+            await engine.dispose()
+        finally:
+            db.session.rollback()
+            db.drop_all()
@@ -137,6 +137,33 @@ class TestUrlFor(TestUrlForBase):
             doc2.url_for('edit', _external=True) == 'http://localhost/1/document2/edit'
         )
 
+    def test_url_for_many(self) -> None:
+        """URLs for many instances match the URLs from url_for."""
+        c1 = Container()
+        self.session.add(c1)
+        docs = [
+            ScopedNamedDocument(container=c1, name=f'document{i}', title="Document")
+            for i in range(3)
+        ]
+        other = NamedDocument(name='other', title="Other")
+        self.session.add_all([*docs, other])
+        self.session.commit()
+
+        assert ScopedNamedDocument.url_for_many(docs) == [doc.url_for() for doc in docs]
+        assert ScopedNamedDocument.url_for_many(docs, 'edit') == [
+            f'http://localhost/1/document{i}/edit' for i in range(3)
+        ]
+        assert ScopedNamedDocument.url_for_many(docs, 'edit', _external=False) == [
+            f'/1/document{i}/edit' for i in range(3)
+        ]
+        assert NamedDocument.url_for_many([other], 'upper') == ['/OTHER/upper']
+        assert NamedDocument.url_for_many([other], 'with', other=other) == [
+            '/other/with/other'
+        ]
+        assert NamedDocument.url_for_many([], 'view') == []
+        with pytest.raises(BuildError):
+            NamedDocument.url_for_many([other], 'random')
+
     def test_absolute_url(self) -> None:
         """The .absolute_url property is the same as .url_for(_external=True)."""
         # Make two documents
@@ -203,10 +230,10 @@ class TestUrlFor(TestUrlForBase):
         with pytest.raises(KeyError):
             _ = doc1.urls['random']
 
-        # The len() count includes the doc_with view, but it is excluded from actual
-        # enumeration because it requires additional keyword parameters, which cannot
-        # be passed in with dictionary access.
-        assert len(doc1.urls) == 6
+        # The doc_with view is excluded from the count and from enumeration because it
+        # requires additional keyword parameters, which cannot be passed in with
+        # dictionary access.
+        assert len(doc1.urls) == 5
         assert dict(doc1.urls) == {
             'app_only': 'http://localhost/document1/app_only',
             'edit': 'http://localhost/document1/edit',
@@ -215,6 +242,36 @@ class TestUrlFor(TestUrlForBase):
             'view': 'http://localhost/document1',
         }
 
+    def test_urls_for_many(self) -> None:
+        """URL dictionaries for many instances match each instance's .urls."""
+        docs = [NamedDocument(name=f'document{i}', title="Document") for i in range(3)]
+        self.session.add_all(docs)
+        self.session.commit()
+
+        assert NamedDocument.urls_for_many(docs) == [dict(doc.urls) for doc in docs]
+        assert NamedDocument.urls_for_many(docs)[2] == {
+            'view': 'http://localhost/document2',
+            'edit': 'http://localhost/document2/edit',
+            'upper': 'http://localhost/DOCUMENT2/upper',
+            'app_only': 'http://localhost/document2/app_only',
+            'per_app': 'http://localhost/document2/app1',
+        }
+        assert NamedDocument.urls_for_many([]) == []
+
+    def test_url_dict_cache(self) -> None:
+        """Available actions are cached in the class and reset on registration."""
+        doc1 = NamedDocument(name='document1', title="Document")
+        assert len(doc1.urls) == 5
+        assert self.app in NamedDocument.__dict__['_url_dict_candidates_cache']
+        assert NamedDocument.__dict__['_url_dict_actions_cache']
+        # Registering an endpoint (here, the same one again) resets the cache
+        NamedDocument.register_endpoint(
+            'view', endpoint='doc_view', app=None, paramattrs={'doc': 'name'}
+        )
+        assert '_url_dict_candidates_cache' not in NamedDocument.__dict__
+        assert '_url_dict_actions_cache' not in NamedDocument.__dict__
+        assert len(doc1.urls) == 5
+
 
 class TestUrlFor2(TestUrlForBase):
     app = app2
@@ -254,3 +311,12 @@ class TestUrlFor2(TestUrlForBase):
         # will cause BuildError while attempting to retrieve the value. However, casting
         # to a list/set of just the keys will work.
         assert set(doc1.urls) == {'edit', 'upper', 'per_app', 'view'}
+
+
+def test_is_url_for_invalid() -> None:
+    """An invalid attribute for a URL parameter is reported at registration."""
+    with pytest.raises(TypeError):
+        NamedDocument.is_url_for('invalid', doc=123)(  # type: ignore[arg-type]
+            doc_view
+        )
+    assert 'invalid' not in NamedDocument.url_for_endpoints[None]
@@ -2,6 +2,7 @@
 
 import datetime
 import unittest
+import uuid
 from collections.abc import Iterator, MutableSet
 from typing import Any, Callable, ClassVar
 from typing_extensions import Self
@@ -28,6 +29,8 @@ from coaster.utils import (
     urstrip,
     ustrip,
     utcnow,
+    uuid7,
+    uuid7_batch,
 )
 
 
@@ -313,6 +316,26 @@ class TestCoasterUtils(unittest.TestCase):
             == "Unicode whitespace here"
         )
 
+    def test_uuid7(self) -> None:
+        before = int(datetime.datetime.now(UTC).timestamp() * 1000)
+        values = [uuid7() for _i in range(100)]
+        after = int(datetime.datetime.now(UTC).timestamp() * 1000)
+        assert values == sorted(values)
+        assert len(set(values)) == 100
+        for value in values:
+            assert value.version == 7
+            assert value.variant == uuid.RFC_4122
+            assert before <= value.int >> 80 <= after + 1
+
+        # Batches are ordered, including across the 12-bit counter within a
+        # millisecond, and continue after single values
+        batch = uuid7_batch(5000)
+        assert len(batch) == len(set(batch)) == 5000
+        assert batch == sorted(batch)
+        assert all(value.version == 7 for value in batch)
+        assert values[-1] < batch[0] < uuid7()
+        assert uuid7_batch(0) == []
+
     def test_nary_op(self) -> None:
         class DemoSet(MutableSet):
             def __init__(self, members: Any) -> None:
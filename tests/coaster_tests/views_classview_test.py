@@ -6,7 +6,10 @@ from __future__ import annotations
 
 import unittest
 from collections.abc import Mapping, Sequence
-from typing import Any, ClassVar, Optional
+from datetime import timedelta
+from time import monotonic
+from typing import Any, ClassVar, Optional, cast
+from unittest.mock import ANY
 
 import pytest
 import sqlalchemy as sa
@@ -14,11 +17,12 @@ import sqlalchemy.orm as sa_orm
 from flask import Flask
 from flask.ctx import RequestContext
 from flask.typing import ResponseReturnValue
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import Mapped
-from werkzeug.exceptions import Forbidden
+from werkzeug.exceptions import Forbidden, NotFound
 
 from coaster.app import JSONProvider
-from coaster.auth import add_auth_attribute
+from coaster.auth import add_auth_attribute, current_auth
 from coaster.compat import json_loads
 from coaster.sqlalchemy import (
     BaseIdNameMixin,
@@ -29,12 +33,20 @@ from coaster.sqlalchemy import (
 )
 from coaster.utils import InspectableSet
 from coaster.views import (
+    AsyncInstanceLoader,
+    CachedViewProtocol,
     ClassView,
     InstanceLoader,
+    LruViewCache,
     ModelView,
     UrlChangeCheck,
     UrlForView,
+    ViewRegistrationStats,
+    cached_view,
+    classview as classview_module,
+    conditional_get,
     current_view,
+    invalidate_cached_views,
     render_with,
     requestargs,
     requestform,
@@ -43,8 +55,9 @@ from coaster.views import (
     route,
     viewdata,
 )
+from coaster.views.classview import _get_loader_plan
 
-from .conftest import Model, db, sqlalchemy_uri
+from .conftest import Model, async_sqlalchemy_uri, db, sqlalchemy_uri
 
 app = Flask(__name__)
 app.json = JSONProvider(app)
@@ -374,6 +387,96 @@ class GatedDocumentView(UrlForView, InstanceLoader, ModelView[ViewDocument]):
 GatedDocumentView.init_app(app)
 
 
+@route('/async/<parent>/<document>')
+class AsyncScopedDocumentView(AsyncInstanceLoader, ModelView[ScopedViewDocument]):
+    """Test ModelView with an async loader."""
+
+    route_model_map: ClassVar = {'document': 'name', 'parent': 'parent.name'}
+
+    @route('')
+    async def view(self) -> str:
+        return self.obj.title
+
+
+@route('/conditional/<document>', init_app=app)
+class ConditionalDocumentView(InstanceLoader, ModelView[ViewDocument]):
+    """Test ModelView with conditional GET."""
+
+    route_model_map: ClassVar = {'document': 'name'}
+    view_count: ClassVar[int] = 0
+
+    @requestargs('access_token')
+    def before_request(
+        self, access_token: Optional[str] = None
+    ) -> Optional[ResponseReturnValue]:
+        if access_token == 'owner-secret':  # nosec B105  # noqa: S105
+            add_auth_attribute('user', 'this-is-the-owner')
+        return super().before_request()
+
+    @route('', methods=['GET', 'POST'])
+    @conditional_get
+    @render_with(json=True)
+    def view(self) -> Mapping[str, Any]:
+        ConditionalDocumentView.view_count += 1
+        return self.obj.current_access()
+
+    @route('owner')
+    @requires_roles({'owner'})
+    @conditional_get
+    @render_with(json=True)
+    def owner(self) -> Mapping[str, Any]:
+        ConditionalDocumentView.view_count += 1
+        return self.obj.current_access()
+
+
+cached_document_cache = LruViewCache()
+cached_index_cache = LruViewCache()
+
+
+@route('/cached/<document>', init_app=app)
+class CachedDocumentView(InstanceLoader, ModelView[ViewDocument]):
+    """Test ModelView with a cached view."""
+
+    route_model_map: ClassVar = {'document': 'name'}
+    view_count: ClassVar[int] = 0
+
+    @requestargs('access_token')
+    def before_request(
+        self, access_token: Optional[str] = None
+    ) -> Optional[ResponseReturnValue]:
+        if access_token == 'owner-secret':  # nosec B105  # noqa: S105
+            add_auth_attribute('user', 'this-is-the-owner')
+        return super().before_request()
+
+    @route('', methods=['GET', 'POST'])
+    @cached_view(backend=cached_document_cache)
+    @render_with({'text/plain': lambda r: r['title']}, json=True)
+    def view(self) -> Mapping[str, Any]:
+        CachedDocumentView.view_count += 1
+        return {'title': self.obj.title, 'roles': sorted(self.obj.current_roles)}
+
+
+@route('/cached-index', init_app=app)
+class CachedIndexView(ClassView):
+    """Test ClassView with a cached view."""
+
+    view_count: ClassVar[int] = 0
+
+    @requestargs('access_token')
+    def before_request(
+        self, access_token: Optional[str] = None
+    ) -> Optional[ResponseReturnValue]:
+        if access_token == 'owner-secret':  # nosec B105  # noqa: S105
+            add_auth_attribute('user', 'this-is-the-owner')
+        return super().before_request()
+
+    @route('')
+    @cached_view(backend=cached_index_cache)
+    def index(self) -> str:
+        CachedIndexView.view_count += 1
+        return f'actor: {current_auth.actor}'
+
+
 # --- Tests ----------------------------------------------------------------------------
 
 
@@ -383,7 +486,7 @@ def test_modelview_generic_model() -> None:
     assert RenameableDocumentView.model is RenameableDocument
     assert MultiDocumentView.model is ViewDocument  # type: ignore[misc]
     assert GatedDocumentView.model is ViewDocument
-    assert ScopedDocumentView.model is ScopedViewDocument  # type: ignore[has-type]
+    assert ScopedDocumentView.model is ScopedViewDocument
 
 
 class TestClassView(unittest.TestCase):
@@ -607,6 +710,157 @@ class TestClassView(unittest.TestCase):
         assert doc1.url_for('view') == '/model/test1'
         assert doc2.url_for('view') == '/model/test2'
 
+    def test_modelview_conditional_get(self) -> None:
+        """A conditional_get view is skipped if the client is current."""
+        doc = ViewDocument(name='test1', title="Test")
+        self.session.add(doc)
+        self.session.commit()
+        ConditionalDocumentView.view_count = 0
+
+        rv = self.client.get('/conditional/test1')
+        assert rv.status_code == 200
+        etag = rv.headers['ETag']
+        last_modified = rv.headers['Last-Modified']
+        assert etag.startswith('W/"')
+        assert 'Accept' in rv.vary
+        assert ConditionalDocumentView.view_count == 1
+
+        rv = self.client.get('/conditional/test1', headers={'If-None-Match': etag})
+        assert rv.status_code == 304
+        assert rv.headers['ETag'] == etag
+        assert ConditionalDocumentView.view_count == 1
+        rv = self.client.get(
+            '/conditional/test1',
+            headers={'If-Modified-Since': last_modified},
+        )
+        assert rv.status_code == 304
+        assert ConditionalDocumentView.view_count == 1
+
+        # The ETag depends on the roles available to the actor
+        rv = self.client.get(
+            '/conditional/test1?access_token=owner-secret',
+            headers={'If-None-Match': etag},
+        )
+        assert rv.status_code == 200
+        assert rv.headers['ETag'] != etag
+        assert ConditionalDocumentView.view_count == 2
+
+        # The ETag changes when the object is updated
+        doc.title = "Updated"
+        doc.updated_at = doc.updated_at + timedelta(seconds=1)
+        self.session.commit()
+        rv = self.client.get('/conditional/test1', headers={'If-None-Match': etag})
+        assert rv.status_code == 200
+        assert rv.headers['ETag'] != etag
+        assert ConditionalDocumentView.view_count == 3
+
+        # POST requests are not conditional
+        rv = self.client.post('/conditional/test1', headers={'If-None-Match': etag})
+        assert rv.status_code == 200
+        assert 'ETag' not in rv.headers
+        assert ConditionalDocumentView.view_count == 4
+
+    def test_modelview_conditional_get_mimetype(self) -> None:
+        """The ETag of a conditional_get view depends on the negotiated mimetype."""
+        doc = ViewDocument(name='test1', title="Test")
+        self.session.add(doc)
+        self.session.commit()
+
+        rv = self.client.get('/conditional/test1', headers={'Accept': 'text/html'})
+        etag = rv.headers['ETag']
+        assert etag.endswith(':*/*"')
+        rv = self.client.get(
+            '/conditional/test1',
+            headers={'If-None-Match': etag, 'Accept': 'application/json'},
+        )
+        assert rv.status_code == 200
+        assert rv.headers['ETag'].endswith(':application/json"')
+
+    def test_modelview_conditional_get_access(self) -> None:
+        """Access checks run before a conditional_get view responds with a 304."""
+        doc = ViewDocument(name='test1', title="Test")
+        self.session.add(doc)
+        self.session.commit()
+        ConditionalDocumentView.view_count = 0
+
+        rv = self.client.get(
+            '/conditional/test1/owner',
+            headers={'If-Modified-Since': 'Fri, 01 Jan 2100 00:00:00 GMT'},
+        )
+        assert rv.status_code == 403
+        assert 'ETag' not in rv.headers
+        assert 'Last-Modified' not in rv.headers
+
+        rv = self.client.get(
+            '/conditional/test1/owner?access_token=owner-secret',
+            headers={'If-Modified-Since': 'Fri, 01 Jan 2100 00:00:00 GMT'},
+        )
+        assert rv.status_code == 304
+        assert ConditionalDocumentView.view_count == 0
+
+    def test_modelview_cached_view(self) -> None:
+        """A cached view is called again only when the cache key changes."""
+        doc = ViewDocument(name='test1', title="Test")
+        self.session.add(doc)
+        self.session.commit()
+        CachedDocumentView.view_count = 0
+        view_func = cast(CachedViewProtocol[..., Any], CachedDocumentView.view.__func__)
+        assert view_func.view_cache is cached_document_cache
+        cached_document_cache.clear()
+
+        rv = self.client.get('/cached/test1', headers={'Accept': 'text/plain'})
+        assert rv.status_code == 200
+        assert rv.data == b'Test'
+        assert CachedDocumentView.view_count == 1
+        rv = self.client.get('/cached/test1', headers={'Accept': 'text/plain'})
+        assert rv.data == b'Test'
+        assert CachedDocumentView.view_count == 1
+        # The negotiated mimetype, query string and roles are part of the key
+        rv = self.client.get('/cached/test1', headers={'Accept': 'application/json'})
+        assert json_loads(rv.data)['title'] == "Test"
+        assert CachedDocumentView.view_count == 2
+        self.client.get('/cached/test1', headers={'Accept': 'application/json'})
+        assert CachedDocumentView.view_count == 2
+        self.client.get('/cached/test1?page=2', headers={'Accept': 'text/plain'})
+        assert CachedDocumentView.view_count == 3
+        rv = self.client.get(
+            '/cached/test1?access_token=owner-secret',
+            headers={'Accept': 'application/json'},
+        )
+        assert 'owner' in json_loads(rv.data)['roles']
+        assert CachedDocumentView.view_count == 4
+        # POST requests are not cached
+        self.client.post('/cached/test1', headers={'Accept': 'text/plain'})
+        self.client.post('/cached/test1', headers={'Accept': 'text/plain'})
+        assert CachedDocumentView.view_count == 6
+
+        # Flushing the object invalidates the cache
+        doc.title = "Changed"
+        self.session.commit()
+        rv = self.client.get('/cached/test1', headers={'Accept': 'text/plain'})
+        assert rv.data == b'Changed'
+        assert CachedDocumentView.view_count == 7
+        self.client.get('/cached/test1', headers={'Accept': 'text/plain'})
+        assert CachedDocumentView.view_count == 7
+        invalidate_cached_views(doc)
+        self.client.get('/cached/test1', headers={'Accept': 'text/plain'})
+        assert CachedDocumentView.view_count == 8
+
+    def test_classview_cached_view_actor(self) -> None:
+        """A cached view without an object is not cached for an actor."""
+        CachedIndexView.view_count = 0
+        cached_index_cache.clear()
+
+        rv = self.client.get('/cached-index')
+        assert rv.data == b'actor: None'
+        self.client.get('/cached-index')
+        assert CachedIndexView.view_count == 1
+        rv = self.client.get('/cached-index?access_token=owner-secret')
+        assert rv.data == b'actor: this-is-the-owner'
+        assert CachedIndexView.view_count == 2
+        self.client.get('/cached-index?access_token=owner-secret')
+        assert CachedIndexView.view_count == 3
+
     def test_scopedmodelview_view(self) -> None:
         """Test that InstanceLoader in a scoped model correctly loads parent."""
         doc = ViewDocument(name='test1', title="Test 1")
@@ -624,6 +878,33 @@ class TestClassView(unittest.TestCase):
         rv = self.client.get('/model/this-doc-does-not-exist/test2')
         assert rv.status_code == 404
 
+    def test_instanceloader_plan_cached(self) -> None:
+        """InstanceLoader resolves joins once and reuses them across requests."""
+        doc = ViewDocument(name='test1', title="Test 1")
+        sdoc = ScopedViewDocument(name='test2', title="Test 2", view_document=doc)
+        self.session.add_all([doc, sdoc])
+        self.session.commit()
+
+        plan = _get_loader_plan(
+            ScopedDocumentView, {'parent': 'test1', 'document': 'test2'}
+        )
+        assert plan is not None
+        assert len(plan.joins) == 1
+        assert {key for key, _attr in plan.filters} == {'parent', 'document'}
+        assert (
+            _get_loader_plan(
+                ScopedDocumentView, {'parent': 'other', 'document': 'other'}
+            )
+            is plan
+        )
+        assert _get_loader_plan(ScopedDocumentView, {}) is None
+        # The plan is cached in the view class
+        assert plan in ScopedDocumentView.__dict__['_loader_plans'].values()
+
+        assert self.client.get('/model/test1/test2').status_code == 200
+        assert self.client.get('/model/test1/test3').status_code == 404
+        assert self.client.get('/model/test2/test2').status_code == 404
+
     def test_redirectablemodel_view(self) -> None:
         doc = RenameableDocument(name='test1', title="Test 1")
         self.session.add(doc)
@@ -853,3 +1134,149 @@ class TestClassView(unittest.TestCase):
             'by_perm_role',
             'by_role',
         }
+
+
+def test_registration_stats() -> None:
+    """ClassView.registration_stats reports startup costs for subclasses."""
+    stats = BaseView.registration_stats()
+    assert set(stats) == {BaseView, SubView, AnotherSubView}
+    assert isinstance(stats[SubView], ViewRegistrationStats)
+    assert stats[SubView].views == len(SubView.__views__)
+    assert stats[SubView].routes == 8
+    assert stats[AnotherSubView].routes > 0
+    # BaseView was never registered on an app
+    assert stats[BaseView].routes == 0
+    assert stats[BaseView].init_app_time == 0.0
+    assert ClassView.registration_stats()[RenameableDocumentView].views == 1
+
+    # A subclass with the same decorator chain reuses decorated view methods
+    class RenameableSubView(RenameableDocumentView):
+        pass
+
+    assert (
+        RenameableSubView.view.decorated_func
+        is RenameableDocumentView.view.decorated_func
+    )
+    assert RenameableSubView.registration_stats()[
+        RenameableSubView
+    ] == ViewRegistrationStats(views=1, decorator_cache_hits=1, decorate_time=ANY)
+
+
+def test_url_for_view_deferred_paramattrs() -> None:
+    """UrlForView extracts URL parameters when a URL is first built."""
+    deferred_app = Flask(__name__)
+
+    @route('/deferred/<document>')
+    class DeferredDocumentView(UrlForView, ModelView[ViewDocument]):
+        route_model_map: ClassVar = {'document': 'name'}
+
+        @route('')
+        def view(self) -> str:
+            return 'view'
+
+        @route('<unknown>/broken')
+        def broken(self, unknown: str) -> str:
+            return unknown
+
+    DeferredDocumentView.init_app(deferred_app)
+    endpoint_data = ViewDocument.url_for_endpoints[deferred_app]['view']
+    assert 'paramattrs' not in vars(endpoint_data)
+    doc = ViewDocument(name='deferred', title="Deferred")
+    with deferred_app.test_request_context():
+        assert doc.url_for('view') == '/deferred/deferred'
+        assert endpoint_data.paramattrs == {'document': 'name'}
+        # A misconfigured view is reported when its URL is built
+        with pytest.raises(TypeError, match='unknown'):
+            doc.url_for('broken')
+
+
+def test_available_actions() -> None:
+    """ModelView.available_actions matches each view method's is_available."""
+    expected = {
+        None: set(),
+        'this-is-the-owner': {'by_perm', 'by_role', 'by_perm_role', 'by_role_perm'},
+        'this-is-the-editor': {'by_perm'},
+        'this-is-another-owner': {'by_role'},
+    }
+    for actor, available in expected.items():
+        with app.test_request_context():
+            if actor is not None:
+                add_auth_attribute('user', actor)
+            doc1 = ViewDocument(name='test1', title="Test 1")
+            doc2 = ViewDocument(name='test2', title="Test 2")
+            actions = GatedDocumentView.available_actions(doc1)
+            assert {name for name, result in actions.items() if result} == available
+            assert GatedDocumentView.available_actions_many([doc1, doc2]) == [
+                actions,
+                actions,
+            ]
+            # Permissions are determined by the object, as in the view after loading
+            add_auth_attribute('permissions', doc1.current_permissions)
+            view = GatedDocumentView(doc1)
+            assert {
+                name for name in actions if getattr(view, name).is_available()
+            } == available
+    with app.test_request_context():
+        assert ModelDocumentView.available_actions(doc1) == {
+            'edit': False,
+            'view': True,
+        }
+        # An object without roles has no views that require a role
+        add_auth_attribute('user', 'this-is-the-owner')
+        actions = GatedDocumentView.available_actions(object())  # type: ignore[arg-type]
+        assert not any(actions.values())
+
+
+async def test_async_instance_loader(monkeypatch: pytest.MonkeyPatch) -> None:
+    """AsyncInstanceLoader loads and joins using an async session."""
+    with app.test_request_context():
+        db.create_all()
+        try:
+            doc = ViewDocument(name='test1', title="Test 1")
+            sdoc = ScopedViewDocument(name='test2', title="Test 2", view_document=doc)
+            db.session.add_all([doc, sdoc])
+            db.session.commit()
+
+            engine = create_async_engine(async_sqlalchemy_uri())
+            async with AsyncSession(engine) as async_session:
+                monkeypatch.setattr(
+                    AsyncScopedDocumentView, 'async_session', async_session
+                )
+                view = AsyncScopedDocumentView()
+                assert await view.async_load(parent='test1', document='test2') is None
+                assert isinstance(view.obj, ScopedViewDocument)
+                assert view.obj.id == sdoc.id
+                assert view.obj.title == "Test 2"
+                # The join on the parent is part of the query
+                with pytest.raises(NotFound):
+                    await view.async_load(parent='test2', document='test2')
+                with pytest.raises(NotFound):
+                    await view.async_load(parent='test1', document='test3')
+            await engine.dispose()
+        finally:
+            db.session.rollback()
+            db.drop_all()
+
+
+def test_lru_view_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """LruViewCache evicts the least recently used entry and expires entries."""
+    cache = LruViewCache(maxsize=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1
+    cache.set('c', 3)  # Evicts 'b', as 'a' was used recently
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    assert len(cache) == 2
+    assert cache.delete('a')
+    assert not cache.delete('a')
+
+    now = monotonic()
+    monkeypatch.setattr(classview_module, 'monotonic', lambda: now)
+    cache.set('d', 4, timeout=10)
+    assert cache.get('d') == 4
+    monkeypatch.setattr(classview_module, 'monotonic', lambda: now + 11)
+    assert cache.get('d') is None
+    cache.clear()
+    assert len(cache) == 0
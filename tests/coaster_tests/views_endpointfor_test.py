@@ -11,7 +11,7 @@ import pytest
 from flask import Flask
 from quart import Quart
 
-from coaster.views import endpoint_for
+from coaster.views import endpoint_for, endpoints_for
 
 
 def view() -> str:
@@ -238,3 +238,38 @@ async def test_named_subexample_sub() -> None:
         'subdomained',
         {'subdomain': 'sub'},
     )
+
+
+def test_endpoint_for_cache() -> None:
+    """Results are cached until the URL map changes."""
+    app = Flask(__name__)
+    app.add_url_rule('/', 'index', view)
+    with app.test_request_context():
+        assert endpoint_for('http://localhost/new') == (None, {})
+        app.add_url_rule('/new', 'new', view)
+        assert endpoint_for('http://localhost/new') == ('new', {})
+        app.add_url_rule('/<name>', 'named', view)
+        result = endpoint_for('http://localhost/test')
+        assert result == ('named', {'name': 'test'})
+        # The cached view arguments can't be changed by the caller
+        result[1]['name'] = 'changed'
+        assert endpoint_for('http://localhost/test') == ('named', {'name': 'test'})
+
+
+def test_endpoints_for() -> None:
+    """Endpoints for many URLs can be retrieved together."""
+    app = Flask(__name__)
+    app.add_url_rule('/', 'index', view)
+    app.add_url_rule('/slashed/', 'slashed', view)
+    with app.test_request_context():
+        assert endpoints_for(
+            [
+                'http://localhost/',
+                'http://localhost/slashed',
+                'http://localhost/unknown',
+                '/',
+            ]
+        ) == [('index', {}), ('slashed', {}), (None, {}), (None, {})]
+        assert endpoints_for(['http://localhost/slashed'], follow_redirects=False) == [
+            (None, {})
+        ]
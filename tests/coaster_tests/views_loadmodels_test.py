@@ -4,7 +4,7 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Any, Callable, Optional
 
 import pytest
 import sqlalchemy as sa
@@ -255,6 +255,60 @@ def t_dotted_document_delete(
     return child
 
 
+@load_models(
+    (Container, {'name': 'container'}, 'container'),
+    (NamedDocument, {'name': 'document', 'container': 'container'}, 'document'),
+    joined=True,
+)
+def t_joined_named_document(
+    container: Container,
+    document: NamedDocument,
+) -> NamedDocument:
+    return document
+
+
+@load_models(
+    (Container, {'name': 'container'}, 'container'),
+    (IdNamedDocument, {'url_name': 'document', 'container': 'container'}, 'document'),
+    urlcheck=['url_name'],
+    joined=True,
+)
+def t_joined_id_named_document(
+    container: Container,
+    document: IdNamedDocument,
+) -> IdNamedDocument:
+    return document
+
+
+@load_models(
+    (ParentDocument, {'name': 'document'}, 'document'),
+    (ChildDocument, {'id': 'child', 'parent': 'document.middle'}, 'child'),
+    permission='edit',
+    joined=True,
+)
+def t_joined_dotted_document_edit(
+    document: ParentDocument,
+    child: ChildDocument,
+) -> ChildDocument:
+    return child
+
+
+@load_models(
+    (Container, {'name': 'container'}, 'container'),
+    (
+        (NamedDocument, RedirectDocument),
+        {'name': 'document', 'container': 'container'},
+        'document',
+    ),
+    joined=True,
+)
+def t_joined_redirect_document(
+    container: Container,
+    document: NamedDocument,
+) -> NamedDocument:
+    return document
+
+
 # --- Tests ----------------------------------------------------------------------------
 
 
@@ -489,3 +543,97 @@ class TestLoadModels(AppTestCase):
             self.session.add(user)
             self.session.commit()
             assert t_single_model_in_loadmodels(username='user1') == g.user
+
+    def count_queries(self, func: Callable[[], Any]) -> tuple[Any, int]:
+        """Call a function and return the result and number of SQL queries."""
+        count = 0
+
+        def counter(*_args: Any, **_kwargs: Any) -> None:
+            nonlocal count
+            count += 1
+
+        engine = self.session.get_bind()
+        sa.event.listen(engine, 'before_cursor_execute', counter)
+        try:
+            return func(), count
+        finally:
+            sa.event.remove(engine, 'before_cursor_execute', counter)
+
+    def test_joined_named_document(self) -> None:
+        """A joined chain is loaded in a single query."""
+        self.session.expire_all()
+        assert self.count_queries(
+            lambda: t_named_document(container='c', document='named-document')
+        ) == (self.nd1, 2)
+        self.session.expire_all()
+        assert self.count_queries(
+            lambda: t_joined_named_document(container='c', document='named-document')
+        ) == (self.nd1, 1)
+        assert (
+            t_joined_named_document(container='c', document='another-named-document')
+            == self.nd2
+        )
+        with pytest.raises(NotFound):
+            t_joined_named_document(container='c', document='scoped-named-document')
+        with pytest.raises(NotFound):
+            t_joined_named_document(container='x', document='named-document')
+
+    def test_joined_id_named_document(self) -> None:
+        """Joined chains support urlcheck redirects."""
+        assert (
+            t_joined_id_named_document(container='c', document='1-id-named-document')
+            == self.ind1
+        )
+        with self.app.test_request_context('/c/1-wrong-name'):
+            with pytest.raises(Redirect) as exc_info:
+                t_joined_id_named_document(container='c', document='1-wrong-name')
+            assert exc_info.value.location == '/c/1-id-named-document'
+        with pytest.raises(NotFound):
+            t_joined_id_named_document(container='c', document='random-non-integer')
+
+    def test_joined_dotted_document(self) -> None:
+        """A join on an attribute of an earlier instance is a single query."""
+        assert self.app.login_manager is not None  # type: ignore[attr-defined]
+        with self.app.test_request_context():
+            self.app.login_manager.set_user_for_testing(  # type: ignore[attr-defined]
+                User(username='foo'), load=True
+            )
+            self.session.expire_all()
+            assert self.count_queries(
+                lambda: t_joined_dotted_document_edit(document='parent', child=1)
+            ) == (self.child1, 1)
+            with pytest.raises(NotFound):
+                t_joined_dotted_document_edit(document='parent', child=3)
+        with self.app.test_request_context():
+            self.app.login_manager.set_user_for_testing(  # type: ignore[attr-defined]
+                User(username='bar'), load=True
+            )
+            with pytest.raises(Forbidden):
+                t_joined_dotted_document_edit(document='parent', child=1)
+
+    def test_joined_redirect_document(self) -> None:
+        """Alternative models are loaded with a query per step."""
+        with self.app.test_request_context('/c/named-document'):
+            assert (
+                t_joined_redirect_document(container='c', document='named-document')
+                == self.nd1
+            )
+        with self.app.test_request_context('/c/redirect-document'):
+            with pytest.raises(Redirect) as exc_info:
+                t_joined_redirect_document(container='c', document='redirect-document')
+            assert exc_info.value.location == '/c/named-document'
+
+    def test_instance_cache(self) -> None:
+        """Repeat lookups in a request are served from the request's instance cache."""
+        with self.app.test_request_context():
+            assert self.count_queries(
+                lambda: t_named_document(container='c', document='named-document')
+            ) == (self.nd1, 2)
+            assert self.count_queries(
+                lambda: t_named_document(container='c', document='named-document')
+            ) == (self.nd1, 0)
+            assert self.count_queries(
+                lambda: t_scoped_named_document(
+                    container='c', document='scoped-named-document'
+                )
+            ) == (self.snd1, 1)
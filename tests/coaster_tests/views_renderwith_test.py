@@ -1,12 +1,15 @@
 """Test `renderwith` view decorator."""
 
+import json
 import unittest
-from collections.abc import Mapping
+from collections.abc import AsyncIterator, Iterator, Mapping
+from datetime import datetime, timezone
 from typing import Any
 
 import pytest
 from flask import Flask
 from jinja2 import TemplateNotFound
+from quart import Quart
 
 from coaster.compat import SansIoResponse, current_app, jsonify
 from coaster.views import render_with
@@ -71,6 +74,68 @@ def view_for_star() -> tuple[dict, int]:
     return {'data': 'value'}, 201
 
 
+render_count = 0
+
+
+def counting_callable(data: Mapping[str, Any]) -> SansIoResponse:
+    global render_count  # noqa: PLW0603  # pylint: disable=global-statement
+    render_count += 1
+    return viewcallable(data)
+
+
+@app.route('/conditionalview', methods=['GET', 'POST'])
+@render_with(
+    {'text/plain': counting_callable},
+    etag=lambda r: r['version'],
+    last_modified=lambda r: r['modified'],
+)
+def conditionalview() -> dict[str, Any]:
+    return {'version': 'v1', 'modified': datetime(2024, 1, 1, 12, 0, 0, 500)}
+
+
+@app.route('/streamview')
+@render_with(json=True, ndjson=True)
+def streamview() -> Iterator[dict[str, int]]:
+    return ({'item': i} for i in range(3))
+
+
+@app.route('/jsonstreamview')
+@render_with('stream.html', json=True)
+def jsonstreamview() -> Iterator[dict[str, int]]:
+    return ({'item': i} for i in range(3))
+
+
+@app.route('/largestreamview')
+@render_with(json=True)
+def largestreamview() -> tuple[Iterator[str], int]:
+    return ('x' * 1000 for _i in range(100)), 201
+
+
+@app.route('/nojsonstreamview')
+@render_with('stream.html')
+def nojsonstreamview() -> Iterator[int]:
+    return iter(range(3))
+
+
+quart_app = Quart(__name__)
+
+
+@quart_app.route('/streamview')
+@render_with(json=True, ndjson=True)
+async def quart_streamview() -> AsyncIterator[dict[str, int]]:
+    async def items() -> AsyncIterator[dict[str, int]]:
+        for i in range(3):
+            yield {'item': i}
+
+    return items()
+
+
+@quart_app.route('/syncstreamview')
+@render_with(json=True, ndjson=True)
+async def quart_syncstreamview() -> Iterator[dict[str, int]]:
+    return ({'item': i} for i in range(3))
+
+
 # --- Tests ----------------------------------------------------------------------------
 
 
@@ -118,3 +183,127 @@ class TestLoadModels(unittest.TestCase):
         assert resp.headers['Referrer'] == "http://example.com"
         # resp = self.app.get('/renderedview5', headers=[('Accept', 'text/plain')])
         # self.assertEqual(resp.status_code, 201)
+
+    def test_negotiate_cache(self) -> None:
+        """Renderers are cached by the raw Accept header."""
+        negotiate = otherview.render_with_negotiate  # type: ignore[attr-defined]
+        negotiate.cache_clear()
+        for _i in range(3):
+            self.client.get('/renderedview2', headers={'Accept': 'text/plain'})
+        resp = self.client.get('/renderedview2', headers={'Accept': 'application/json'})
+        assert resp.mimetype == 'application/json'
+        info = negotiate.cache_info()
+        assert info.misses == 2
+        assert info.hits == 2
+        renderer = negotiate('text/html;q=0.9,text/xml;q=0.8,*/*')
+        assert renderer.mimetype == 'text/html'
+        assert renderer.render is None
+        assert renderer.template == 'renderedview2.html'
+        assert renderer.response_mimetype == 'text/html'
+        renderer = negotiate('')
+        assert renderer.mimetype == '*/*'
+        assert renderer.template == 'renderedview2.html'
+        assert renderer.response_mimetype == 'text/html'
+
+    def test_conditional(self) -> None:
+        """Conditional GET requests skip rendering if the client has the data."""
+        resp = self.client.get('/conditionalview')
+        assert resp.status_code == 200
+        assert resp.headers['ETag'] == 'W/"v1"'
+        assert resp.last_modified == datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+        assert render_count == 1
+
+        resp = self.client.get('/conditionalview', headers={'If-None-Match': '"v1"'})
+        assert resp.status_code == 304
+        assert resp.headers['ETag'] == 'W/"v1"'
+        assert render_count == 1
+        resp = self.client.get(
+            '/conditionalview',
+            headers={'If-Modified-Since': 'Mon, 01 Jan 2024 12:00:00 GMT'},
+        )
+        assert resp.status_code == 304
+        assert render_count == 1
+
+        # If-None-Match takes priority over If-Modified-Since
+        resp = self.client.get(
+            '/conditionalview',
+            headers={
+                'If-None-Match': 'W/"v0"',
+                'If-Modified-Since': 'Mon, 01 Jan 2024 12:00:00 GMT',
+            },
+        )
+        assert resp.status_code == 200
+        assert render_count == 2
+        resp = self.client.get(
+            '/conditionalview',
+            headers={'If-Modified-Since': 'Mon, 01 Jan 2024 11:59:59 GMT'},
+        )
+        assert resp.status_code == 200
+        assert render_count == 3
+        # Only GET and HEAD requests are conditional
+        resp = self.client.post('/conditionalview', headers={'If-None-Match': '"v1"'})
+        assert resp.status_code == 200
+        assert 'ETag' not in resp.headers
+        assert render_count == 4
+
+    def test_stream(self) -> None:
+        """Iterators are streamed as a JSON array or as newline-delimited JSON."""
+        resp = self.client.get('/streamview')
+        assert resp.is_streamed
+        assert resp.mimetype == 'application/json'
+        assert resp.json == [{'item': 0}, {'item': 1}, {'item': 2}]
+        assert 'ETag' not in resp.headers
+
+        resp = self.client.get(
+            '/streamview', headers={'Accept': 'application/x-ndjson'}
+        )
+        assert resp.mimetype == 'application/x-ndjson'
+        assert resp.get_data(as_text=True).splitlines() == [
+            '{"item": 0}',
+            '{"item": 1}',
+            '{"item": 2}',
+        ]
+
+        # Newline-delimited JSON must be requested in render_with
+        resp = self.client.get(
+            '/largestreamview', headers={'Accept': 'application/x-ndjson'}
+        )
+        assert resp.mimetype == 'application/json'
+        resp.close()
+
+        # Iterators are only streamed if a JSON mimetype is negotiated
+        resp = self.client.get(
+            '/jsonstreamview', headers={'Accept': 'application/json'}
+        )
+        assert resp.json == [{'item': 0}, {'item': 1}, {'item': 2}]
+        resp = self.client.get('/jsonstreamview', headers={'Accept': 'text/html'})
+        assert resp.status_code == 406
+
+        # Large responses are sent in chunks
+        resp = self.client.get('/largestreamview', buffered=False)
+        assert resp.status_code == 201
+        chunks = list(resp.iter_encoded())
+        assert len(chunks) > 1
+        assert json.loads(b''.join(chunks)) == ['x' * 1000] * 100
+        resp.close()
+
+        # Streaming requires the JSON renderer
+        with pytest.raises(TypeError, match='json=True'):
+            self.client.get('/nojsonstreamview')
+
+
+@pytest.mark.asyncio
+async def test_quart_stream() -> None:
+    """Quart views can stream async and sync iterators."""
+    client = quart_app.test_client()
+    for url in ('/streamview', '/syncstreamview'):
+        resp = await client.get(url)
+        assert resp.mimetype == 'application/json'
+        assert await resp.get_json() == [{'item': 0}, {'item': 1}, {'item': 2}]
+        resp = await client.get(url, headers={'Accept': 'application/x-ndjson'})
+        assert resp.mimetype == 'application/x-ndjson'
+        assert (await resp.get_data(as_text=True)).splitlines() == [
+            '{"item": 0}',
+            '{"item": 1}',
+            '{"item": 2}',
+        ]
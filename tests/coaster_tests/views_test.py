@@ -3,7 +3,9 @@
 # pylint: disable=redefined-outer-name
 
 import unittest
+from dataclasses import dataclass, field
 from typing import Any, Optional
+from typing_extensions import NotRequired, TypedDict
 
 import pytest
 from flask import Flask
@@ -14,13 +16,18 @@ from coaster.app import load_config_from_file
 from coaster.auth import current_auth
 from coaster.compat import json_loads, session
 from coaster.views import (
+    ClassView,
+    RequestValueError,
+    cors,
     get_current_url,
     get_next_url,
     jsonp,
     requestargs,
+    requestbody,
     requestform,
     requestvalues,
     requires_permission,
+    route,
 )
 
 
@@ -436,3 +443,199 @@ async def test_requestargs(flask_app: Flask, quart_app: Quart) -> None:
     # Calling without a request context works as well
     assert requestvalues_test1(p1='1', p2=3, p3=[1, 2]) == ('1', 3, [1, 2])
     assert await arequestvalues_test1(p1='1', p2=3, p3=[1, 2]) == ('1', 3, [1, 2])
+
+
+# MARK: Typed @requestargs tests -------------------------------------------------------
+
+
+class Author(TypedDict):
+    name: str
+    email: NotRequired[str]
+
+
+@dataclass
+class NewDocument:
+    title: str
+    count: int
+    author: Optional[Author] = None
+    tags: list[str] = field(default_factory=list)
+    draft: bool = False
+    score: float = 0.0
+    slug: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.slug = self.title.lower()
+
+
+@requestbody(('document', NewDocument))
+def requestbody_schema_test(document: NewDocument) -> NewDocument:
+    return document
+
+
+def test_requestargs_schema(flask_app: Flask) -> None:
+    """A dataclass or TypedDict converts the entire payload, collecting all errors."""
+    with flask_app.test_request_context(
+        '/',
+        method='POST',
+        json={
+            'title': "Title",
+            'count': '3',
+            'author': {'name': "Author"},
+            'tags': ['a', 'b'],
+            'unknown': 'ignored',
+        },
+    ):
+        assert requestbody_schema_test() == NewDocument(  # type: ignore[call-arg]
+            title="Title", count=3, author={'name': "Author"}, tags=['a', 'b']
+        )
+    with flask_app.test_request_context(
+        '/',
+        method='POST',
+        data={'title': "Title", 'count': '2', 'tags': ['a', 'b'], 'draft': 'on'},
+    ):
+        assert requestbody_schema_test() == NewDocument(  # type: ignore[call-arg]
+            title="Title", count=2, tags=['a', 'b'], draft=True
+        )
+    with flask_app.test_request_context(
+        '/',
+        method='POST',
+        json={'count': 'many', 'author': {'email': 1}, 'tags': ['a', 2], 'draft': 'x'},
+    ):
+        with pytest.raises(RequestValueError) as exc_info:
+            requestbody_schema_test()  # type: ignore[call-arg]
+        assert exc_info.value.code == 400
+        assert set(exc_info.value.errors) == {
+            'title',
+            'count',
+            'author.name',
+            'author.email',
+            'tags.1',
+            'draft',
+        }
+        assert exc_info.value.errors['title'] == "Missing value"
+        assert 'title: Missing value' in str(exc_info.value.description)
+    with flask_app.test_request_context(
+        '/', method='POST', json={'title': "Title", 'count': 3.0, 'score': '2.5'}
+    ):
+        assert requestbody_schema_test() == NewDocument(  # type: ignore[call-arg]
+            title="Title", count=3, score=2.5
+        )
+    # Booleans and fractions are not truncated into integers
+    for count in (True, 1.5, '1.5'):
+        with flask_app.test_request_context(
+            '/', method='POST', json={'title': "Title", 'count': count, 'score': False}
+        ):
+            with pytest.raises(RequestValueError) as exc_info:
+                requestbody_schema_test()  # type: ignore[call-arg]
+            assert exc_info.value.code == 400
+            assert set(exc_info.value.errors) == {'count', 'score'}
+    # A supplied parameter is not loaded from the request
+    document = NewDocument(title="Direct", count=1)
+    assert requestbody_schema_test(document=document) is document
+
+
+# MARK: @cors tests --------------------------------------------------------------------
+
+cors_app = Flask(__name__)
+cors_calls: list[str] = []
+
+
+@cors_app.route('/cors/any')
+@cors('*')
+def cors_any() -> str:
+    cors_calls.append('any')
+    return "any"
+
+
+@cors_app.route('/cors/list', methods=['GET', 'POST'])
+@cors(
+    ['https://example.com', 'https://*.example.org'],
+    methods=['OPTIONS', 'GET'],
+    headers=['Content-Type'],
+    max_age=3600,
+)
+def cors_list() -> str:
+    return "list"
+
+
+def check_cors_origin(origin: str) -> bool:
+    cors_calls.append(origin)
+    return origin.endswith('.example.net')
+
+
+@cors_app.route('/cors/callable')
+@cors(check_cors_origin)
+def cors_callable() -> str:
+    return "callable"
+
+
+@route('/cors/view')
+class CorsView(ClassView):
+    def before_request(self) -> None:
+        cors_calls.append('before_request')
+
+    @route('')
+    @cors(['https://example.com'])
+    def view(self) -> str:
+        cors_calls.append('view')
+        return "view"
+
+
+CorsView.init_app(cors_app)
+
+
+def test_cors() -> None:
+    """CORS headers are precomputed and pre-flight requests skip the view."""
+    client = cors_app.test_client()
+    cors_calls.clear()
+    resp = client.get('/cors/any')
+    assert 'Access-Control-Allow-Origin' not in resp.headers
+    resp = client.get('/cors/any', headers={'Origin': 'https://example.com'})
+    assert resp.headers['Access-Control-Allow-Origin'] == 'https://example.com'
+    assert 'Origin' in resp.headers['Vary']
+    assert cors_calls == ['any', 'any']
+    resp = client.options('/cors/any', headers={'Origin': 'https://example.com'})
+    assert resp.status_code == 200
+    assert resp.headers['Access-Control-Allow-Methods'] == (
+        'OPTIONS, HEAD, GET, POST, DELETE, PATCH, PUT'
+    )
+    assert cors_calls == ['any', 'any']
+    assert client.options('/cors/any').status_code == 400
+
+    # Exact origins and wildcard subdomains
+    for origin, status in [
+        ('https://example.com', 200),
+        ('https://www.example.com', 403),
+        ('https://www.example.org', 200),
+        ('https://a.b.example.org', 200),
+        ('https://example.org', 403),
+        ('https://www.example.org.evil.com', 403),
+        ('http://www.example.org', 403),
+    ]:
+        resp = client.get('/cors/list', headers={'Origin': origin})
+        assert resp.status_code == status, origin
+    resp = client.options('/cors/list', headers={'Origin': 'https://example.com'})
+    assert resp.headers['Access-Control-Allow-Methods'] == 'OPTIONS, GET'
+    assert resp.headers['Access-Control-Allow-Headers'] == 'Content-Type'
+    assert resp.headers['Access-Control-Max-Age'] == '3600'
+    resp = client.post('/cors/list', headers={'Origin': 'https://example.com'})
+    assert resp.status_code == 405
+
+    # Results from a callable are cached
+    cors_calls.clear()
+    for _i in range(3):
+        resp = client.get('/cors/callable', headers={'Origin': 'https://a.example.net'})
+        assert resp.status_code == 200
+        resp = client.get('/cors/callable', headers={'Origin': 'https://example.com'})
+        assert resp.status_code == 403
+    assert cors_calls == ['https://a.example.net', 'https://example.com']
+
+    # Pre-flight requests to a class view skip before_request and the view
+    cors_calls.clear()
+    resp = client.options('/cors/view', headers={'Origin': 'https://example.com'})
+    assert resp.status_code == 200
+    assert resp.headers['Access-Control-Allow-Origin'] == 'https://example.com'
+    assert cors_calls == []
+    resp = client.get('/cors/view', headers={'Origin': 'https://example.com'})
+    assert resp.data == b'view'
+    assert cors_calls == ['before_request', 'view']